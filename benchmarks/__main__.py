@@ -0,0 +1,212 @@
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import obsws_python as obs
+from obsws_python.mock import MockServer
+from obsws_python.util import as_dataclass
+
+"""
+Benchmarks of request, batch and event throughput against the mock server
+
+Results are written as JSON so runs of different versions can be compared:
+
+    python benchmarks --output before.json
+    python benchmarks --compare before.json
+"""
+
+PASSWORD = "benchmark"
+INPUTS = 32
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return {
+        f"p{q}": samples[min(int(len(samples) * q / 100), len(samples) - 1)] * 1e6
+        for q in (50, 90, 99)
+    } | {"mean": statistics.fmean(samples) * 1e6}
+
+
+def bench_import_time(repeat=5):
+    """milliseconds to import the package in a fresh interpreter, best of `repeat`"""
+
+    statements = {
+        "obsws_python": "import obsws_python",
+        "Subs": "from obsws_python import Subs",
+        "ReqClient": "from obsws_python import ReqClient",
+        "EventClient": "from obsws_python import EventClient",
+    }
+    results = {}
+    for name, statement in statements.items():
+        code = (
+            "import time; started = time.perf_counter(); "
+            f"{statement}; print(time.perf_counter() - started)"
+        )
+        results[name] = min(
+            float(subprocess.check_output([sys.executable, "-c", code])) * 1000
+            for _ in range(repeat)
+        )
+    return results
+
+
+def bench_request_latency(cl, n):
+    """round trip time of sequential GetVersion requests in microseconds"""
+
+    samples = []
+    for _ in range(n):
+        started = time.perf_counter()
+        cl.get_version()
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples)
+
+
+def bench_pipelined(cl, n):
+    """requests/s with every request in flight at once"""
+
+    started = time.perf_counter()
+    futures = [cl.send_async("GetStats") for _ in range(n)]
+    for future in futures:
+        future.result()
+    return {"requests_per_second": n / (time.perf_counter() - started)}
+
+
+def bench_batched(cl, n, size=50):
+    """requests/s sent as RequestBatches of `size` requests"""
+
+    batches = max(n // size, 1)
+    started = time.perf_counter()
+    for _ in range(batches):
+        cl.send_batch([("GetStats", None)] * size)
+    return {
+        "batch_size": size,
+        "requests_per_second": batches * size / (time.perf_counter() - started),
+    }
+
+
+def bench_as_dataclass(cl, n):
+    """microseconds to build the response object of typical responses"""
+
+    results = {}
+    for req_type in ("GetVersion", "GetStats", "GetInputList"):
+        data = cl.send(req_type, raw=True)
+        started = time.perf_counter()
+        for _ in range(n):
+            as_dataclass(req_type, data)
+        results[req_type] = (time.perf_counter() - started) / n * 1e6
+    return results
+
+
+def bench_events(server, conn, n):
+    """InputVolumeMeters events/s decoded and dispatched by an EventClient"""
+
+    done = threading.Event()
+    received = 0
+
+    def on_input_volume_meters(data):
+        nonlocal received
+        received += 1
+        if received == n:
+            done.set()
+
+    with obs.EventClient(**conn, subs=obs.Subs.ALL) as ev:
+        ev.callback.register(on_input_volume_meters)
+        data = server._volume_meters()
+        started = time.perf_counter()
+        for _ in range(n):
+            server.emit("InputVolumeMeters", data)
+        done.wait(timeout=60)
+        elapsed = time.perf_counter() - started
+    return {"events_per_second": received / elapsed, "inputs_per_event": INPUTS}
+
+
+def bench_memory(cl, n):
+    """bytes retained per response object"""
+
+    results = {}
+    for req_type in ("GetVersion", "GetInputList"):
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        responses = [cl.send(req_type) for _ in range(n)]
+        gc.collect()
+        results[req_type] = (tracemalloc.get_traced_memory()[0] - before) / n
+        tracemalloc.stop()
+        del responses
+    return results
+
+
+def run(n, conn, server):
+    with obs.ReqClient(**conn) as cl:
+        results = {
+            "request_latency_us": bench_request_latency(cl, n),
+            "pipelined": bench_pipelined(cl, n * 5),
+            "batched": bench_batched(cl, n * 5),
+            "as_dataclass_us": bench_as_dataclass(cl, n * 10),
+            "memory_bytes_per_response": bench_memory(cl, n),
+        }
+    results["events"] = bench_events(server, conn, n * 5)
+    results["import_time_ms"] = bench_import_time()
+    return results
+
+
+def compare(results, baseline):
+    """prints the change of every metric relative to a previous run"""
+
+    def flatten(d, prefix=""):
+        for key, value in d.items():
+            if isinstance(value, dict):
+                yield from flatten(value, f"{prefix}{key}.")
+            elif isinstance(value, (int, float)):
+                yield f"{prefix}{key}", value
+
+    previous = dict(flatten(baseline["results"]))
+    print(f"compared with {baseline['version']} at {baseline['timestamp']}")
+    for key, value in flatten(results["results"]):
+        if key in previous and previous[key]:
+            change = (value - previous[key]) / previous[key] * 100
+            print(f"{key:<50} {previous[key]:>14.1f} {value:>14.1f} {change:>+8.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=1000, help="base iteration count")
+    parser.add_argument("--output", type=Path, help="write the results to a JSON file")
+    parser.add_argument("--compare", type=Path, help="a previous results file")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="mock response latency in seconds"
+    )
+    args = parser.parse_args()
+
+    with MockServer(port=0, password=PASSWORD, latency=args.latency) as server:
+        for i in range(INPUTS):
+            server.state.create_input(
+                {"sceneName": "Scene", "inputName": f"Input {i}", "inputKind": "mic"}
+            )
+        conn = {"host": "localhost", "port": server.port, "password": PASSWORD}
+        results = {
+            "version": obs.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "parameters": {"n": args.n, "latency": args.latency},
+            "results": run(args.n, conn, server),
+        }
+
+    print(json.dumps(results["results"], indent=2))
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        compare(results, json.loads(args.compare.read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,380 @@
+import argparse
+import ast
+import json
+import keyword
+import textwrap
+import urllib.request
+from pathlib import Path
+
+from obsws_python.util import to_snake_case
+
+"""
+Generates obsws_python/protocol.py and obsws_python/reqs.pyi from protocol.json
+
+protocol.py holds a slotted class for the response of every request and
+the data of every event, reqs.pyi annotates the ReqClient methods with
+the request field types and the response class they return.
+
+    python codegen --fetch
+    python codegen
+    python codegen path/to/protocol.json
+
+--fetch downloads obs-websocket's protocol.json at UPSTREAM_VERSION into
+codegen/protocol.json. Without it the vendored upstream file is used, or
+the hand-written protocol.subset.json where none has been fetched.
+"""
+
+HERE = Path(__file__).parent
+PACKAGE = HERE.parent / "obsws_python"
+
+UPSTREAM_VERSION = "5.5.4"
+UPSTREAM_URL = (
+    "https://raw.githubusercontent.com/obsproject/obs-websocket/"
+    f"{UPSTREAM_VERSION}/docs/generated/protocol.json"
+)
+UPSTREAM = HERE / "protocol.json"
+SUBSET = HERE / "protocol.subset.json"
+
+TYPES = {
+    "String": "str",
+    "Number": "float",
+    "Boolean": "bool",
+    "Object": "dict",
+    "Any": "Any",
+}
+
+HEADER = '''\
+from typing import Any
+
+from .util import wrap
+
+"""
+Response and event classes of the obs-websocket protocol
+
+as_dataclass builds these in place of a dynamic dataclass whenever
+the data holds no fields unknown to the class.
+"""
+
+
+class ProtocolObject:
+    """
+    Base of the generated classes, attributes are the snake_case
+    names of the data's fields, set in the order they arrived.
+    Nested objects are wrapped in lazy snake_case views.
+    """
+
+    __slots__ = ("_data",)
+    _FIELDS = {}
+
+    def __init__(self, data: dict):
+        fields = self._FIELDS
+        for key, value in data.items():
+            if type(value) is dict or type(value) is list:
+                value = wrap(value)
+            setattr(self, fields[key], value)
+        self._data = data
+
+    def attrs(self) -> list:
+        return [self._FIELDS[key] for key in self._data]
+
+    def _values(self):
+        return [(attr, getattr(self, attr)) for attr in self.attrs()]
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __repr__(self):
+        fields = ", ".join(f"{attr}={value!r}" for attr, value in self._values())
+        return f"{type(self).__name__}({fields})"
+'''
+
+
+def annotation(value_type: str) -> str:
+    """maps a protocol valueType, eg. Array<String>, to a type annotation"""
+
+    if value_type.startswith("Array<") and value_type.endswith(">"):
+        return f"list[{annotation(value_type[6:-1])}]"
+    return TYPES.get(value_type, "Any")
+
+
+def attr_name(field: str) -> str:
+    name = to_snake_case(field)
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def render_class(name: str, kind: str, identifier: str, description: str, fields):
+    lines = [f"class {name}(ProtocolObject):", '    """']
+    lines += textwrap.wrap(
+        f"{kind} of {identifier}. {description}",
+        width=80,
+        initial_indent="    ",
+        subsequent_indent="    ",
+    )
+    if fields:
+        lines.append("")
+        for field in fields:
+            lines += textwrap.wrap(
+                f":ivar {attr_name(field['valueName'])}: {field.get('valueDescription', '')}",
+                width=80,
+                initial_indent="    ",
+                subsequent_indent="        ",
+            )
+    lines += ['    """', ""]
+    attrs = [attr_name(field["valueName"]) for field in fields]
+    if attrs:
+        lines.append(f"    __slots__ = ({''.join(repr(a) + ', ' for a in attrs)})")
+    else:
+        lines.append("    __slots__ = ()")
+    lines.append(
+        "    _FIELDS = {"
+        + ", ".join(f"{field['valueName']!r}: {a!r}" for field, a in zip(fields, attrs))
+        + "}"
+    )
+    if fields:
+        lines.append("")
+        for field, attr in zip(fields, attrs):
+            lines.append(f"    {attr}: {annotation(field['valueType'])}")
+    return "\n".join(lines)
+
+
+def generate_classes(spec: dict, source: str = "protocol.json"):
+    """returns the source of protocol.py and {identifier: class name}"""
+
+    classes = {}
+    blocks = [f"# generated by codegen from {source}, do not edit\n" + HEADER]
+    for request in spec["requests"]:
+        if not request.get("responseFields"):
+            continue
+        name = f"{request['requestType']}Response"
+        fields = [f for f in request["responseFields"] if "." not in f["valueName"]]
+        blocks.append(
+            render_class(
+                name,
+                "Response",
+                request["requestType"],
+                request.get("description", ""),
+                fields,
+            )
+        )
+        classes[request["requestType"]] = name
+    for event in spec["events"]:
+        name = f"{event['eventType']}Event"
+        blocks.append(
+            render_class(
+                name,
+                "Data",
+                event["eventType"],
+                event.get("description", ""),
+                event.get("dataFields", []),
+            )
+        )
+        classes[event["eventType"]] = name
+    blocks.append(
+        "CLASSES = {\n"
+        + "".join(
+            f"    {identifier!r}: {name},\n" for identifier, name in classes.items()
+        )
+        + "}\n"
+    )
+    return "\n\n\n".join(blocks), classes
+
+
+class _Stub(ast.NodeTransformer):
+    """strips bodies from reqs.py and annotates the request methods"""
+
+    def __init__(self, spec: dict, classes: dict):
+        self.requests = {r["requestType"]: r for r in spec["requests"]}
+        self.classes = classes
+        self.annotated = 0
+        # request types sent by a method but missing from the spec
+        self.missing = set()
+
+    def visit_Module(self, node):
+        body = [
+            ast.ImportFrom(
+                module="typing",
+                names=[ast.alias("Any"), ast.alias("Optional")],
+                level=0,
+            ),
+            ast.ImportFrom(module="", names=[ast.alias("protocol")], level=1),
+        ]
+        for child in node.body:
+            if isinstance(child, (ast.Import, ast.ImportFrom)):
+                body.append(child)
+            elif isinstance(child, ast.Assign):
+                body += self._declare(child)
+            elif isinstance(child, (ast.ClassDef, ast.FunctionDef)):
+                body.append(self.visit(child))
+        node.body = body
+        return node
+
+    def _declare(self, node):
+        if isinstance(node.value, ast.Name):
+            return [node]
+        return [
+            ast.AnnAssign(target=t, annotation=ast.Name("Any"), simple=1)
+            for t in node.targets
+            if isinstance(t, ast.Name)
+        ]
+
+    def visit_ClassDef(self, node):
+        body = []
+        for child in node.body:
+            if isinstance(child, ast.Assign):
+                body += self._declare(child)
+            elif isinstance(child, ast.FunctionDef):
+                body.append(self.visit(child))
+        node.body = body or [ast.Expr(ast.Constant(...))]
+        return node
+
+    def visit_FunctionDef(self, node):
+        request = self._request(node)
+        if request is not None:
+            self._annotate(node, request)
+        node.body = [ast.Expr(ast.Constant(...))]
+        return node
+
+    def _request(self, node):
+        """the request sent by a method, if it sends exactly one type"""
+
+        sent = {
+            call.args[0].value
+            for call in ast.walk(node)
+            if isinstance(call, ast.Call)
+            and isinstance(call.func, ast.Attribute)
+            and call.func.attr == "send"
+            and isinstance(call.func.value, ast.Name)
+            and call.func.value.id == "self"
+            and call.args
+            and isinstance(call.args[0], ast.Constant)
+        }
+        if len(sent) == 1:
+            req_type = sent.pop()
+            if req_type not in self.requests:
+                self.missing.add(req_type)
+            return self.requests.get(req_type)
+
+    def _annotate(self, node, request):
+        fields = {f["valueName"]: f for f in request["requestFields"]}
+        params = {}
+        for child in ast.walk(node):
+            if isinstance(child, ast.Dict):
+                for key, value in zip(child.keys, child.values):
+                    if isinstance(key, ast.Constant) and isinstance(value, ast.Name):
+                        params.setdefault(value.id, key.value)
+            elif (
+                isinstance(child, ast.Assign)
+                and isinstance(child.targets[0], ast.Subscript)
+                and isinstance(child.targets[0].slice, ast.Constant)
+                and isinstance(child.value, ast.Name)
+            ):
+                params.setdefault(child.value.id, child.targets[0].slice.value)
+
+        args = node.args.args
+        defaults = [None] * (len(args) - len(node.args.defaults)) + node.args.defaults
+        for arg, default in zip(args, defaults):
+            field = fields.get(params.get(arg.arg))
+            if field is None or arg.annotation is not None:
+                continue
+            type_ = annotation(field["valueType"])
+            if isinstance(default, ast.Constant) and default.value is None:
+                type_ = f"Optional[{type_}]"
+            arg.annotation = ast.parse(type_, mode="eval").body
+
+        if node.returns is None:
+            node.returns = ast.parse(self._returns(node, request), mode="eval").body
+        self.annotated += 1
+
+    def _returns(self, node, request):
+        returns = [
+            child.value
+            for child in ast.walk(node)
+            if isinstance(child, ast.Return) and child.value is not None
+        ]
+        if not returns:
+            return "None"
+        sends = all(
+            isinstance(value, ast.Call)
+            and isinstance(value.func, ast.Attribute)
+            and value.func.attr == "send"
+            and not any(k.arg == "raw" for k in value.keywords)
+            for value in returns
+        )
+        if sends and request["requestType"] in self.classes:
+            return f"protocol.{self.classes[request['requestType']]}"
+        return "Any"
+
+
+def generate_stub(spec: dict, classes: dict, source: str, spec_name="protocol.json"):
+    """returns the source of reqs.pyi and the stub transformer, for its counts"""
+
+    stub = _Stub(spec, classes)
+    tree = stub.visit(ast.parse(source))
+    header = f"# generated by codegen from {spec_name} and reqs.py, do not edit\n"
+    return header + ast.unparse(ast.fix_missing_locations(tree)) + "\n", stub
+
+
+def fetch(path: Path = UPSTREAM):
+    """downloads protocol.json of obs-websocket UPSTREAM_VERSION to path"""
+
+    with urllib.request.urlopen(UPSTREAM_URL, timeout=30) as resp:
+        spec = json.load(resp)
+    path.write_text(json.dumps(spec, indent=2) + "\n", encoding="utf-8")
+    print(f"fetched {UPSTREAM_URL}")
+
+
+def fmt(source: str, pyi: bool = False) -> str:
+    """formats the output as the style env would, when black and isort are installed"""
+
+    try:
+        import black
+        import isort
+    except ImportError:
+        return source
+    source = isort.code(source, profile="black")
+    return black.format_str(source, mode=black.Mode(is_pyi=pyi))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "protocol",
+        nargs="?",
+        type=Path,
+        help="obs-websocket docs/generated/protocol.json, "
+        "defaults to the vendored copy or protocol.subset.json",
+    )
+    parser.add_argument(
+        "--fetch",
+        action="store_true",
+        help=f"download protocol.json of obs-websocket {UPSTREAM_VERSION} first",
+    )
+    args = parser.parse_args()
+
+    if args.fetch:
+        fetch()
+    protocol = args.protocol or (UPSTREAM if UPSTREAM.exists() else SUBSET)
+    if protocol == SUBSET:
+        print(
+            f"{SUBSET.name} covers a subset of the protocol, "
+            "run with --fetch to generate from the upstream protocol.json"
+        )
+    spec = json.loads(protocol.read_text(encoding="utf-8"))
+    source, classes = generate_classes(spec, protocol.name)
+    (PACKAGE / "protocol.py").write_text(fmt(source), encoding="utf-8")
+    stub, transformer = generate_stub(
+        spec, classes, (PACKAGE / "reqs.py").read_text(encoding="utf-8"), protocol.name
+    )
+    (PACKAGE / "reqs.pyi").write_text(fmt(stub, pyi=True), encoding="utf-8")
+    print(f"{len(classes)} classes, {transformer.annotated} request methods annotated")
+    if transformer.missing:
+        print(
+            f"{len(transformer.missing)} request types sent by reqs.py are not in "
+            f"{protocol.name}: {', '.join(sorted(transformer.missing))}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,37 @@
-from .events import EventClient
-from .reqs import ReqClient
-from .subs import Subs
+import importlib
+
 from .version import version as __version__
 
-__ALL__ = ["ReqClient", "EventClient", "Subs"]
+# clients are imported on first access, so scripts that only need Subs
+# or one of the clients don't pay for loading websocket and reqs
+_LAZY = {
+    "EventClient": ".events",
+    "ReqClient": ".reqs",
+    "Priority": ".scheduler",
+    "Subs": ".subs",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    else:
+        try:
+            # submodules such as obsws_python.error
+            value = importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__ALL__ = ["ReqClient", "EventClient", "Subs", "Priority"]
+__all__ = __ALL__
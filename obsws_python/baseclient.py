@@ -1,19 +1,97 @@
 import base64
+import functools
 import hashlib
+import itertools
 import json
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
-from random import randint
 from typing import Optional
 
 import websocket
-from websocket import WebSocketTimeoutException
+from websocket import WebSocketConnectionClosedException, WebSocketTimeoutException
 
 from .error import OBSSDKError, OBSSDKTimeoutError
+from .iterparse import parse_response
+from .metrics import RequestSample
+from .scheduler import Priority, RequestScheduler
 
 logger = logging.getLogger(__name__)
 
 
+class CallbackDispatcher:
+    """
+    Runs Future done callbacks in order on a daemon thread, so callbacks
+    never run on the thread reading responses.
+
+    Once closed, callbacks run in the thread that adds or resolves them.
+    """
+
+    def __init__(self):
+        self.logger = logger.getChild(self.__class__.__name__)
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+
+    def submit(self, fn, future):
+        with self._lock:
+            if not self._closed:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+                self._queue.put((fn, future))
+                return
+        self._call(fn, future)
+
+    def close(self):
+        """runs the callbacks already submitted, then stops the thread"""
+
+        with self._lock:
+            self._closed = True
+            if self._thread is not None:
+                self._queue.put(None)
+
+    def _run(self):
+        while (item := self._queue.get()) is not None:
+            self._call(*item)
+
+    def _call(self, fn, future):
+        try:
+            fn(future)
+        except Exception as e:
+            self.logger.exception(f"{type(e).__name__} raised by a done callback")
+
+
+class DispatchFuture(Future):
+    """
+    A Future whose done callbacks run on a CallbackDispatcher.
+
+    Threads waiting on result() are woken as soon as the response is
+    read, a slow or blocking callback holds up neither them nor the
+    responses to other requests.
+    """
+
+    def __init__(self, dispatcher: CallbackDispatcher):
+        super().__init__()
+        self._dispatcher = dispatcher
+
+    def add_done_callback(self, fn, inline: bool = False):
+        """
+        :param inline: run fn in the thread that resolves the future,
+            for short callbacks that only resolve other futures
+        :type inline: bool
+        """
+        if inline:
+            super().add_done_callback(fn)
+        else:
+            super().add_done_callback(functools.partial(self._dispatcher.submit, fn))
+
+
 class ObsClient:
     def __init__(self, **kwargs):
         self.logger = logger.getChild(self.__class__.__name__)
@@ -23,12 +101,29 @@ class ObsClient:
             "password": "",
             "subs": 0,
             "timeout": None,
+            "max_in_flight": None,
+            "rate_limit": None,
+            "burst": None,
+            "limits": {},
+            "priorities": {},
+            "metrics": None,
         }
         if not any(key in kwargs for key in ("host", "port", "password")):
             kwargs |= self._conn_from_toml()
         kwargs = defaultkwargs | kwargs
         for attr, val in kwargs.items():
             setattr(self, attr, val)
+        self._send_lock = threading.Lock()
+        self._pending = {}
+        self._streamed = set()
+        self._request_ids = itertools.count(1)
+        self._reader = None
+        self._closed = False
+        self._timings = {}
+        self.dispatcher = CallbackDispatcher()
+        self.scheduler = RequestScheduler(
+            self._write, self.max_in_flight, self.rate_limit, self.burst, self.limits
+        )
 
         self.logger.info(
             "Connecting with parameters: host='{host}' port={port} password='{password}' subs={subs} timeout={timeout}".format(
@@ -48,11 +143,6 @@ class ObsClient:
             raise
 
     def _conn_from_toml(self) -> dict:
-        try:
-            import tomllib
-        except ModuleNotFoundError:
-            import tomli as tomllib
-
         def get_filepath() -> Optional[Path]:
             """
             traverses a list of paths for a 'config.toml'
@@ -69,6 +159,11 @@ class ObsClient:
 
         conn = {}
         if filepath := get_filepath():
+            try:
+                import tomllib
+            except ModuleNotFoundError:
+                import tomli as tomllib
+
             with open(filepath, "rb") as f:
                 conn = tomllib.load(f)
             self.logger.info(f"loading config from {filepath}")
@@ -116,19 +211,229 @@ class ObsClient:
                 "failed to identify client with the server, please check connection settings"
             )
 
-    def req(self, req_type, req_data=None):
+    def _start_reader(self):
+        with self._send_lock:
+            if self._reader is None:
+                self.ws.settimeout(None)
+                self._reader = threading.Thread(target=self._read, daemon=True)
+                self._reader.start()
+
+    def _read(self):
+        """
+        Continuously receive responses.
+
+        Resolves the pending request matching each response's requestId.
+        """
+        while True:
+            try:
+                message = self.ws.recv()
+            except (WebSocketConnectionClosedException, OSError) as e:
+                self.logger.debug(f"{type(e).__name__} terminating the response thread")
+                break
+            if not message:
+                continue
+            data = self._parse(message)
+            self.logger.debug(f"Response received {data}")
+            request_id = data.get("requestId")
+            self.scheduler.complete(request_id)
+            future = self._pending.pop(request_id, None)
+            if self.metrics is not None:
+                self._record(request_id, data, len(message))
+            if future is None:
+                self.logger.debug(
+                    f"Discarding response to unknown request {request_id}"
+                )
+                continue
+            if future.set_running_or_notify_cancel():
+                future.set_result(data)
+
+        self._closed = True
+        error = OBSSDKError("connection closed while waiting for a response")
+        while self._pending:
+            request_id, future = self._pending.popitem()
+            if self.metrics is not None:
+                self._record(request_id)
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+        self.dispatcher.close()
+
+    def _parse(self, message):
+        """
+        decodes the response of a message, a streamed request's response
+        data is left undecoded for its caller to iterate
+        """
+        if self._streamed:
+            try:
+                partial = parse_response(message)
+            except (ValueError, IndexError):
+                partial = None
+            if (
+                partial is not None
+                and partial.get("requestId") in self._streamed
+                # members following responseData are not parsed
+                and "requestStatus" in partial
+                and "requestType" in partial
+            ):
+                self._streamed.discard(partial["requestId"])
+                return partial
+            data = json.loads(message)["d"]
+            self._streamed.discard(data.get("requestId"))
+            return data
+        return json.loads(message)["d"]
+
+    def _record(self, request_id, response=None, received=0):
+        """passes the timing of a finished request to the metrics sink"""
+
+        if (timing := self._timings.pop(request_id, None)) is None:
+            return
+        started, req_type, sent = timing
+        code, ok = None, False
+        if response is not None:
+            if "results" in response:
+                failed = [
+                    result["requestStatus"]["code"]
+                    for result in response["results"]
+                    if not result["requestStatus"]["result"]
+                ]
+                code, ok = (failed[0], False) if failed else (None, True)
+            else:
+                code = response["requestStatus"]["code"]
+                ok = response["requestStatus"]["result"]
+        try:
+            self.metrics(
+                RequestSample(
+                    req_type,
+                    time.perf_counter() - started,
+                    sent,
+                    received,
+                    code,
+                    ok,
+                    len(self._pending),
+                )
+            )
+        except Exception as e:
+            self.logger.exception(f"{type(e).__name__} raised by the metrics sink")
+
+    def _write(self, payload):
+        self.logger.debug(f"Sending request {payload}")
+        message = json.dumps(payload)
+        if self.metrics is not None and (
+            timing := self._timings.get(payload["d"]["requestId"])
+        ):
+            timing[2] = len(message)
+        try:
+            with self._send_lock:
+                self.ws.send(message)
+        except Exception:
+            self._pending.pop(payload["d"]["requestId"], None)
+            self._streamed.discard(payload["d"]["requestId"])
+            if self.metrics is not None:
+                self._record(payload["d"]["requestId"])
+            raise
+
+    def send_payload(self, payload, priority=None, stream=False) -> Future:
+        """
+        sends a request payload without waiting for its response
+
+        once max_in_flight requests await a response further requests are
+        queued and sent in order of priority.
+
+        returns a DispatchFuture resolved with the response data, with
+        stream=True an iterparse.PartialResponse leaving the response data
+        undecoded. its done callbacks run on the client's dispatch thread
+        """
+        if self._reader is None:
+            self._start_reader()
+        if priority is None:
+            priority = self.priorities.get(
+                payload["d"].get("requestType"), Priority.NORMAL
+            )
+        future = DispatchFuture(self.dispatcher)
+        request_id = payload["d"]["requestId"] = next(self._request_ids)
+        future.request_id = request_id
+        if self.metrics is not None:
+            self._timings[request_id] = [
+                time.perf_counter(),
+                payload["d"].get("requestType", "RequestBatch"),
+                0,
+            ]
+        self._pending[request_id] = future
+        if stream:
+            self._streamed.add(request_id)
+        if self._closed:
+            self._pending.pop(request_id, None)
+            self._streamed.discard(request_id)
+            self._timings.pop(request_id, None)
+            raise OBSSDKError("connection closed")
+        if (submitted := getattr(self.metrics, "submitted", None)) is not None:
+            try:
+                submitted(len(self._pending))
+            except Exception as e:
+                self.logger.exception(f"{type(e).__name__} raised by the metrics sink")
+        self.scheduler.submit(request_id, payload, future, priority)
+        return future
+
+    def cancel(self, future) -> bool:
+        """
+        abandons a request, a queued request is never sent
+        and the response to a sent one is discarded when it arrives
+        """
+        self._pending.pop(future.request_id, None)
+        self._streamed.discard(future.request_id)
+        if self.metrics is not None:
+            self._record(future.request_id)
+        return future.cancel()
+
+    def wait(self, future, timeout=None):
+        """waits for a response, raises OBSSDKTimeoutError if none arrives in time"""
+
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError as e:
+            self.cancel(future)
+            self.logger.error(f"{type(e).__name__}: timed out waiting for a response")
+            raise OBSSDKTimeoutError("Timeout while trying to send the request") from e
+
+    def req_async(self, req_type, req_data=None, priority=None, stream=False) -> Future:
         payload = {
             "op": 6,
-            "d": {"requestType": req_type, "requestId": randint(1, 1000)},
+            "d": {"requestType": req_type},
         }
         if req_data:
             payload["d"]["requestData"] = req_data
-        self.logger.debug(f"Sending request {payload}")
-        try:
-            self.ws.send(json.dumps(payload))
-            response = json.loads(self.ws.recv())
-        except WebSocketTimeoutException as e:
-            self.logger.exception(f"{type(e).__name__}: {e}")
-            raise OBSSDKTimeoutError("Timeout while trying to send the request") from e
-        self.logger.debug(f"Response received {response}")
-        return response["d"]
+        return self.send_payload(payload, priority, stream)
+
+    def req(self, req_type, req_data=None, priority=None, timeout=None):
+        if timeout is None:
+            timeout = self.timeout
+        return self.wait(self.req_async(req_type, req_data, priority), timeout)
+
+    def req_batch(
+        self,
+        requests,
+        halt_on_failure=False,
+        execution_type=0,
+        priority=None,
+        timeout=None,
+    ):
+        """
+        sends a list of (req_type, req_data) pairs as a single RequestBatch (OpCode 8)
+
+        returns the list of request results in the order they were executed
+        """
+        payload = {
+            "op": 8,
+            "d": {
+                "haltOnFailure": halt_on_failure,
+                "executionType": execution_type,
+                "requests": [],
+            },
+        }
+        for req_type, req_data in requests:
+            request = {"requestType": req_type}
+            if req_data:
+                request["requestData"] = req_data
+            payload["d"]["requests"].append(request)
+        if timeout is None:
+            timeout = self.timeout
+        return self.wait(self.send_payload(payload, priority), timeout)["results"]
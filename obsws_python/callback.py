@@ -1,7 +1,36 @@
+import time
 from collections.abc import Callable, Iterable
-from typing import Union
+from typing import Optional, Union
 
-from .util import as_dataclass, to_camel_case, to_snake_case
+from .util import CACHE_SIZE, as_dataclass, to_camel_case, to_snake_case
+
+# event type <-> handler name, eg. SceneCreated <-> on_scene_created
+_handlers = {}
+_events = {}
+
+
+def handler_name(event: str) -> str:
+    """the name of the function handling `event`"""
+
+    try:
+        return _handlers[event]
+    except KeyError:
+        name = f"on_{to_snake_case(event)}"
+        if len(_handlers) < CACHE_SIZE:
+            _handlers[event] = name
+        return name
+
+
+def event_name(handler: str) -> str:
+    """the event a function named `handler` handles"""
+
+    try:
+        return _events[handler]
+    except KeyError:
+        name = to_camel_case(handler[2:])
+        if len(_events) < CACHE_SIZE:
+            _events[handler] = name
+        return name
 
 
 class Callback:
@@ -11,18 +40,49 @@ class Callback:
         """list of current callbacks"""
 
         self._callbacks = list()
+        self._by_name = {}
+        self.metrics = None
 
     def get(self) -> list:
         """returns a list of registered events"""
 
-        return [to_camel_case(fn.__name__[2:]) for fn in self._callbacks]
+        return [event_name(fn.__name__) for fn in self._callbacks]
 
-    def trigger(self, event, data):
-        """trigger callback on event"""
+    def _index(self):
+        """groups the callbacks by name, so trigger looks its handlers up"""
 
+        by_name = {}
         for fn in self._callbacks:
-            if fn.__name__ == f"on_{to_snake_case(event)}":
+            by_name.setdefault(fn.__name__, []).append(fn)
+        self._by_name = by_name
+
+    def trigger(self, event, data, received: Optional[float] = None):
+        """
+        trigger callback on event
+
+        received is the time.perf_counter() at which the event arrived,
+        used to measure handler lag when metrics are enabled
+        """
+        fns = self._by_name.get(handler_name(event))
+        if not fns:
+            return
+        if self.metrics is None:
+            for fn in fns:
+                fn(as_dataclass(event, data))
+            return
+
+        if received is None:
+            received = time.perf_counter()
+        for fn in fns:
+            started = time.perf_counter()
+            try:
                 fn(as_dataclass(event, data))
+            finally:
+                self.metrics.handled(
+                    fn.__qualname__,
+                    started - received,
+                    time.perf_counter() - started,
+                )
 
     def register(self, fns: Union[Iterable, Callable]):
         """registers callback functions"""
@@ -35,6 +95,7 @@ class Callback:
         except TypeError:
             if fns not in self._callbacks:
                 self._callbacks.append(fns)
+        self._index()
 
     def deregister(self, fns: Union[Iterable, Callable]):
         """deregisters callback functions"""
@@ -47,8 +108,10 @@ class Callback:
         except TypeError:
             if fns in self._callbacks:
                 self._callbacks.remove(fns)
+        self._index()
 
     def clear(self):
         """clears the _callbacks list"""
 
         self._callbacks.clear()
+        self._by_name = {}
@@ -0,0 +1,190 @@
+import logging
+import threading
+import time
+from collections import deque
+from typing import NamedTuple, Optional
+
+from .util import decode_image_data
+
+"""
+Continuous screenshot capture of a set of sources
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class Frame(NamedTuple):
+    source: str
+    img_format: str
+    data: bytes
+    timestamp: float
+    latency: float
+    seq: int
+
+
+class _SourceState:
+    def __init__(self, name, start):
+        self.name = name
+        self.next_due = start
+        self.seq = 0
+        self.latest = None
+        self.arrivals = deque(maxlen=32)
+        self.latencies = deque(maxlen=32)
+        self.dropped = 0
+        self.errors = 0
+
+
+class ScreenshotCapture:
+    """
+    Keeps up to `in_flight` GetSourceScreenshot requests outstanding across
+    a set of sources, paced to a target frame rate per source.
+
+    Responses that arrive after a newer frame of the same source are dropped,
+    so latest() always returns the most recent screenshot taken.
+    """
+
+    def __init__(
+        self,
+        client,
+        sources,
+        fps: float = 5.0,
+        in_flight: int = 4,
+        img_format: str = "jpg",
+        width: Optional[int] = None,
+        height: Optional[int] = None,
+        quality: Optional[int] = None,
+    ):
+        """
+        :param client: the request client to capture with
+        :type client: ReqClient
+        :param sources: names of the sources or scenes to capture
+        :type sources: list[str]
+        :param fps: target frames per second per source
+        :type fps: float
+        :param in_flight: maximum number of outstanding screenshot requests
+        :type in_flight: int
+        """
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.client = client
+        self.fps = fps
+        self.in_flight = in_flight
+        self.payload = {"imageFormat": img_format}
+        if width is not None:
+            self.payload["imageWidth"] = width
+        if height is not None:
+            self.payload["imageHeight"] = height
+        if quality is not None:
+            self.payload["imageCompressionQuality"] = quality
+        now = time.monotonic()
+        self._sources = {name: _SourceState(name, now) for name in sources}
+        self._slots = threading.Semaphore(in_flight)
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self.worker = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.stop()
+
+    def start(self):
+        """start capturing in a daemon thread"""
+
+        self._stop_event.clear()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def stop(self):
+        """stop issuing new requests, outstanding responses are still accepted"""
+
+        self._stop_event.set()
+        if self.worker is not None:
+            self.worker.join()
+
+    def _run(self):
+        interval = 1.0 / self.fps
+        while not self._stop_event.is_set():
+            state = min(self._sources.values(), key=lambda s: s.next_due)
+            if self._stop_event.wait(max(state.next_due - time.monotonic(), 0.0)):
+                break
+            while not self._slots.acquire(timeout=0.1):
+                if self._stop_event.is_set():
+                    return
+            now = time.monotonic()
+            # pace from the time the request is actually sent, never burst to catch up
+            state.next_due = max(state.next_due + interval, now)
+            state.seq += 1
+            try:
+                future = self.client.send_async(
+                    "GetSourceScreenshot",
+                    {"sourceName": state.name, **self.payload},
+                    raw=True,
+                )
+            except Exception as e:
+                self._slots.release()
+                self.logger.error(f"{type(e).__name__}: {e}")
+                break
+            future.add_done_callback(
+                lambda f, state=state, seq=state.seq, sent=now: self._done(
+                    f, state, seq, sent
+                )
+            )
+
+    def _done(self, future, state, seq, sent):
+        self._slots.release()
+        received = time.monotonic()
+        if future.cancelled() or future.exception() is not None:
+            with self._lock:
+                state.errors += 1
+            return
+        try:
+            img_format, data = decode_image_data(future.result()["imageData"])
+        except (KeyError, ValueError) as e:
+            self.logger.error(f"{type(e).__name__}: {e}")
+            with self._lock:
+                state.errors += 1
+            return
+        with self._lock:
+            if state.latest is not None and state.latest.seq > seq:
+                state.dropped += 1
+                return
+            state.latest = Frame(
+                state.name, img_format, data, received, received - sent, seq
+            )
+            state.arrivals.append(received)
+            state.latencies.append(received - sent)
+
+    def latest(self, source: str) -> Optional[Frame]:
+        """returns the most recent frame of a source, None until one arrives"""
+
+        with self._lock:
+            return self._sources[source].latest
+
+    def frames(self) -> dict:
+        """returns the most recent frame of every source keyed by source name"""
+
+        with self._lock:
+            return {name: state.latest for name, state in self._sources.items()}
+
+    def stats(self) -> dict:
+        """achieved fps, mean latency and dropped/error counts per source"""
+
+        stats = {}
+        with self._lock:
+            for name, state in self._sources.items():
+                arrivals = state.arrivals
+                span = arrivals[-1] - arrivals[0] if len(arrivals) > 1 else 0.0
+                stats[name] = {
+                    "fps": (len(arrivals) - 1) / span if span > 0 else 0.0,
+                    "latency": (
+                        sum(state.latencies) / len(state.latencies)
+                        if state.latencies
+                        else 0.0
+                    ),
+                    "requested": state.seq,
+                    "dropped": state.dropped,
+                    "errors": state.errors,
+                }
+        return stats
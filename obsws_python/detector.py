@@ -0,0 +1,268 @@
+import logging
+import threading
+import time
+from concurrent.futures import wait
+from typing import Optional
+
+import numpy as np
+from websocket import WebSocketConnectionClosedException
+
+from .callback import Callback
+from .error import OBSSDKError
+from .frames import decode_image, luma_plane
+from .util import decode_image_data
+
+"""
+Frozen and black output detection from low resolution screenshots
+
+Requires numpy and Pillow, install with `pip install obsws-python[analysis]`
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class _SourceState:
+    def __init__(self, source):
+        self.source = source
+        self.signature = None
+        self.timestamp = None
+        self.still_since = None
+        self.dark_since = None
+        self.frozen = False
+        self.black = False
+
+
+class OutputDetector:
+    """
+    Samples screenshots of a set of sources (or the current program scene)
+    and fires callbacks when one freezes or goes black.
+
+    Register handlers the same way as with EventClient:
+
+        def on_freeze_started(data):
+            print(data.source_name, data.duration)
+
+        detector.callback.register(on_freeze_started)
+
+    Events: FreezeStarted, FreezeEnded, BlackStarted, BlackEnded
+
+    Without sources the program output is watched, its state is kept
+    under OutputDetector.PROGRAM and reset whenever the scene changes.
+    """
+
+    PROGRAM = "program"
+
+    def __init__(
+        self,
+        client,
+        sources: Optional[list] = None,
+        interval: float = 0.5,
+        width: int = 64,
+        height: int = 36,
+        freeze_threshold: float = 0.5,
+        freeze_time: float = 3.0,
+        black_threshold: float = 16.0,
+        black_time: float = 2.0,
+        max_gap: Optional[float] = None,
+    ):
+        """
+        :param client: the request client to sample with
+        :type client: ReqClient
+        :param sources: names of the sources to watch, None for the program output
+        :type sources: list[str], optional
+        :param interval: seconds between samples
+        :type interval: float
+        :param freeze_threshold: mean luma difference (0-255) below which a frame is unchanged
+        :type freeze_threshold: float
+        :param freeze_time: seconds a source must stay unchanged to be reported frozen
+        :type freeze_time: float
+        :param black_threshold: mean luma (0-255) below which a frame is black
+        :type black_threshold: float
+        :param black_time: seconds a source must stay black to be reported
+        :type black_time: float
+        :param max_gap: seconds between frames after which a source's state is
+            reset rather than timed across the gap, defaults to two sampling rounds
+        :type max_gap: float, optional
+        """
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.client = client
+        self.sources = sources
+        self.interval = interval
+        self.payload = {
+            "imageFormat": "png",
+            "imageWidth": width,
+            "imageHeight": height,
+        }
+        self.freeze_threshold = freeze_threshold
+        self.freeze_time = freeze_time
+        self.black_threshold = black_threshold
+        self.black_time = black_time
+        self.max_gap = 2 * max(interval, 1.0) if max_gap is None else max_gap
+        self._program_scene = None
+        self.callback = Callback()
+        self._states = {}
+        self._stop_event = threading.Event()
+        self.worker = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.stop()
+
+    def start(self):
+        """start sampling in a daemon thread"""
+
+        self._stop_event.clear()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def stop(self):
+        """stop sampling"""
+
+        self._stop_event.set()
+        if self.worker is not None:
+            self.worker.join()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.sample()
+            except OBSSDKError as e:
+                if self.client.base_client._closed:
+                    self.logger.debug(
+                        f"connection closed, terminating the detector thread"
+                    )
+                    break
+                self.logger.error(f"{type(e).__name__}: {e}")
+            except (WebSocketConnectionClosedException, OSError) as e:
+                self.logger.debug(f"{type(e).__name__} terminating the detector thread")
+                break
+            self._stop_event.wait(
+                max(self.interval - (time.monotonic() - started), 0.0)
+            )
+
+    def sample(self):
+        """takes one screenshot of every watched source and updates their state"""
+
+        if self.sources is None:
+            resp = self.client.send("GetCurrentProgramScene", raw=True)
+            scene = resp["currentProgramSceneName"]
+            if scene != self._program_scene:
+                self.reset(self.PROGRAM)
+                self._program_scene = scene
+            sources = {self.PROGRAM: scene}
+        else:
+            sources = {name: name for name in self.sources}
+        futures = {
+            name: self.client.send_async(
+                "GetSourceScreenshot", {"sourceName": source, **self.payload}, raw=True
+            )
+            for name, source in sources.items()
+        }
+        _, not_done = wait(futures.values(), timeout=max(self.interval, 1.0))
+        for future in not_done:
+            # abandon the request, its response is discarded when it arrives
+            future.cancel()
+        now = time.monotonic()
+        for name, future in futures.items():
+            if future.cancelled() or future.exception() is not None:
+                continue
+            try:
+                _, data = decode_image_data(future.result()["imageData"])
+                frame = decode_image(data)
+            except (KeyError, ValueError, OSError) as e:
+                self.logger.error(f"{type(e).__name__}: {e}")
+                continue
+            self.update(name, luma_plane(frame), now, sources[name])
+
+    def update(
+        self,
+        name: str,
+        signature: np.ndarray,
+        timestamp: float,
+        source: Optional[str] = None,
+    ):
+        """
+        feeds the luma plane of a new frame of a source
+
+        :param source: the source name reported in events, defaults to name
+        :type source: str, optional
+        """
+        state = self._states.get(name)
+        if state is not None and timestamp - state.timestamp > self.max_gap:
+            self.reset(name)
+            state = None
+        if state is None:
+            state = self._states[name] = _SourceState(source or name)
+        previous, state.signature = state.signature, signature
+        previous_timestamp, state.timestamp = state.timestamp, timestamp
+
+        if previous is not None and previous.shape == signature.shape:
+            difference = float(np.abs(signature - previous).mean())
+            if difference < self.freeze_threshold:
+                if state.still_since is None:
+                    # the source has been unchanged since the previous frame
+                    state.still_since = previous_timestamp
+                duration = timestamp - state.still_since
+                if not state.frozen and duration >= self.freeze_time:
+                    state.frozen = True
+                    self._fire("FreezeStarted", state.source, duration, difference)
+            else:
+                if state.frozen:
+                    self._fire(
+                        "FreezeEnded",
+                        state.source,
+                        timestamp - state.still_since,
+                        difference,
+                    )
+                state.still_since = None
+                state.frozen = False
+
+        luma = float(signature.mean())
+        if luma < self.black_threshold:
+            if state.dark_since is None:
+                state.dark_since = timestamp
+            duration = timestamp - state.dark_since
+            if not state.black and duration >= self.black_time:
+                state.black = True
+                self._fire("BlackStarted", state.source, duration, luma=luma)
+        else:
+            if state.black:
+                self._fire(
+                    "BlackEnded", state.source, timestamp - state.dark_since, luma=luma
+                )
+            state.dark_since = None
+            state.black = False
+
+    def reset(self, name: str):
+        """forgets the state of a source, ending a freeze or blackout it is in"""
+
+        state = self._states.pop(name, None)
+        if state is None:
+            return
+        if state.frozen:
+            self._fire("FreezeEnded", state.source, state.timestamp - state.still_since)
+        if state.black:
+            self._fire("BlackEnded", state.source, state.timestamp - state.dark_since)
+
+    def _fire(self, event, name, duration, difference=None, luma=None):
+        self.logger.info(f"{event} {name} after {duration:.1f}s")
+        data = {"sourceName": name, "duration": duration}
+        if difference is not None:
+            data["difference"] = difference
+        if luma is not None:
+            data["luma"] = luma
+        self.callback.trigger(event, data)
+
+    def frozen(self, name: str) -> bool:
+        """True while a source, or OutputDetector.PROGRAM, is reported frozen"""
+
+        return name in self._states and self._states[name].frozen
+
+    def black(self, name: str) -> bool:
+        """True while a source, or OutputDetector.PROGRAM, is reported black"""
+
+        return name in self._states and self._states[name].black
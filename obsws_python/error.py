@@ -16,3 +16,16 @@ class OBSSDKRequestError(OBSSDKError):
         if comment:
             message += f" With message: {comment}"
         super().__init__(message)
+
+
+class OBSSDKFleetError(OBSSDKError):
+    """Exception raised when too few hosts of a fleet complete a call"""
+
+    def __init__(self, method, results):
+        self.method = method
+        self.results = results
+        failed = results.failed
+        message = f"{method} failed on {len(failed)} of {len(results)} hosts."
+        if failed:
+            message += " " + ", ".join(f"{host}: {e}" for host, e in failed.items())
+        super().__init__(message)
@@ -1,12 +1,15 @@
 import json
 import logging
 import threading
+import time
 
 from websocket import WebSocketConnectionClosedException, WebSocketTimeoutException
 
 from .baseclient import ObsClient
 from .callback import Callback
 from .error import OBSSDKError, OBSSDKTimeoutError
+from .history import EventHistory
+from .metrics import EventMetrics
 from .subs import Subs
 
 """
@@ -23,6 +26,17 @@ class EventClient:
         self.logger = logger.getChild(self.__class__.__name__)
         defaultkwargs = {"subs": Subs.LOW_VOLUME}
         kwargs = defaultkwargs | kwargs
+        self.history = kwargs.pop("history", None)
+        if self.history is True:
+            self.history = EventHistory()
+        elif not isinstance(self.history, EventHistory) and not self.history:
+            # an empty EventHistory is falsy, any other falsy value disables it
+            self.history = None
+        self.metrics = kwargs.pop("metrics", None)
+        if self.metrics is True:
+            self.metrics = EventMetrics()
+        elif not self.metrics:
+            self.metrics = None
         self.base_client = ObsClient(**kwargs)
         try:
             success = self.base_client.authenticate()
@@ -33,6 +47,7 @@ class EventClient:
             self.logger.error(f"{type(e).__name__}: {e}")
             raise
         self.callback = Callback()
+        self.callback.metrics = self.metrics
         self.subscribe()
 
     def __enter__(self):
@@ -68,13 +83,19 @@ class EventClient:
         while not stop_event.is_set():
             try:
                 if response := self.base_client.ws.recv():
+                    received = time.perf_counter()
                     event = json.loads(response)
+                    decoded = time.perf_counter()
                     self.logger.debug(f"Event received {event}")
                     type_, data = (
                         event["d"].get("eventType"),
                         event["d"].get("eventData"),
                     )
-                    self.callback.trigger(type_, data if data else {})
+                    if self.history is not None:
+                        self.history.append(type_, data if data else {}, len(response))
+                    if self.metrics is not None:
+                        self.metrics.received(type_, decoded - received)
+                    self.callback.trigger(type_, data if data else {}, received)
             except WebSocketTimeoutException as e:
                 self.logger.exception(f"{type(e).__name__}: {e}")
                 raise OBSSDKTimeoutError("Timeout while waiting for event") from e
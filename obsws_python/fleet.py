@@ -0,0 +1,151 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple, Optional, Union
+
+from .error import OBSSDKFleetError
+from .reqs import ReqClient
+
+"""
+A group of request clients controlled together
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class HostResult(NamedTuple):
+    host: str
+    result: object
+    error: Optional[Exception]
+    latency: float
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class FleetResult(dict):
+    """HostResults keyed by 'host:port'"""
+
+    @property
+    def succeeded(self) -> dict:
+        return {host: r.result for host, r in self.items() if r.ok}
+
+    @property
+    def failed(self) -> dict:
+        return {host: r.error for host, r in self.items() if not r.ok}
+
+    @property
+    def latencies(self) -> dict:
+        return {host: r.latency for host, r in self.items()}
+
+
+class FleetClient:
+    """
+    Holds a ReqClient per OBS instance and fans out calls to all of them.
+
+    Any ReqClient method may be called on the fleet, it runs concurrently
+    on every host and returns a FleetResult:
+
+        with FleetClient(["obs1", "obs2"], password="...") as fleet:
+            resp = fleet.set_current_program_scene("BRB")
+            print(resp.failed, resp.latencies)
+    """
+
+    def __init__(
+        self,
+        hosts: list,
+        min_success: Union[int, str, None] = None,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ):
+        """
+        :param hosts: host names, or dicts of connection parameters per host
+        :type hosts: list[str | dict]
+        :param min_success: raise OBSSDKFleetError if fewer hosts succeed,
+            "all" to require every host, None to never raise
+        :type min_success: int | str, optional
+        :param max_workers: calls run at once, defaults to one per host
+        :type max_workers: int, optional
+        :param kwargs: connection parameters shared by every host
+        """
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.min_success = min_success
+        params = [
+            kwargs | (host if isinstance(host, dict) else {"host": host})
+            for host in hosts
+        ]
+        self._executor = ThreadPoolExecutor(max_workers or max(len(params), 1))
+        self.clients = {}
+        self.connect_errors = {}
+        connecting = {
+            f"{p['host']}:{p.get('port', 4455)}": self._executor.submit(ReqClient, **p)
+            for p in params
+        }
+        for host, future in connecting.items():
+            try:
+                self.clients[host] = future.result()
+            except Exception as e:
+                # any failure is the host's alone, the other clients stay connected
+                self.logger.error(f"{host}: {type(e).__name__}: {e}")
+                self.connect_errors[host] = e
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.disconnect()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(hosts={list(self.clients)})"
+
+    def __getattr__(self, name):
+        if name.startswith("_") or not callable(getattr(ReqClient, name, None)):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+
+        def fan_out(*args, **kwargs):
+            return self.call(name, *args, **kwargs)
+
+        fan_out.__name__ = name
+        return fan_out
+
+    def _call(self, host, client, method, args, kwargs):
+        started = time.perf_counter()
+        try:
+            result = getattr(client, method)(*args, **kwargs)
+            error = None
+        except Exception as e:
+            result, error = None, e
+        return HostResult(host, result, error, time.perf_counter() - started)
+
+    def call(self, method: str, *args, **kwargs) -> FleetResult:
+        """
+        runs a ReqClient method on every connected host concurrently
+
+        hosts that failed to connect are included as failed, with their
+        connect error, and count against min_success
+        """
+        futures = [
+            self._executor.submit(self._call, host, client, method, args, kwargs)
+            for host, client in self.clients.items()
+        ]
+        results = FleetResult((r.host, r) for r in (f.result() for f in futures))
+        for host, error in results.failed.items():
+            self.logger.error(f"{host}: {method} {type(error).__name__}: {error}")
+        results.update(
+            (host, HostResult(host, None, error, 0.0))
+            for host, error in self.connect_errors.items()
+        )
+        required = len(results) if self.min_success == "all" else self.min_success
+        if required is not None and len(results.succeeded) < required:
+            raise OBSSDKFleetError(method, results)
+        return results
+
+    def disconnect(self):
+        """disconnects every host"""
+
+        for client in self.clients.values():
+            client.disconnect()
+        self._executor.shutdown()
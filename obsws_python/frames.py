@@ -0,0 +1,179 @@
+import io
+import multiprocessing
+import queue
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+from PIL import Image
+
+"""
+Decoding of screenshot payloads into NumPy arrays and cheap frame metrics
+
+Requires numpy and Pillow, install with `pip install obsws-python[analysis]`
+"""
+
+LUMA_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+def decode_image(data) -> np.ndarray:
+    """decodes a PNG/JPEG/... image file into an RGB array shaped (height, width, 3)"""
+
+    with Image.open(io.BytesIO(data)) as img:
+        return np.asarray(img.convert("RGB"))
+
+
+def luma_plane(frame: np.ndarray) -> np.ndarray:
+    """returns the Rec. 601 luma of an RGB frame as a float32 (height, width) array"""
+
+    return frame[..., :3] @ LUMA_WEIGHTS
+
+
+def mean_luma(frame: np.ndarray) -> float:
+    """mean luma of an RGB frame, 0 (black) to 255 (white)"""
+
+    return float(luma_plane(frame).mean())
+
+
+def frame_difference(a: np.ndarray, b: np.ndarray) -> float:
+    """mean absolute luma difference between two frames of the same size, 0 to 255"""
+
+    if a.shape != b.shape:
+        raise ValueError(f"frame shapes differ: {a.shape} != {b.shape}")
+    return float(np.abs(luma_plane(a) - luma_plane(b)).mean())
+
+
+_attached = {}
+
+
+def _decode_into(data, shm_name, size):
+    """runs in a worker process, decodes into the named shared memory block"""
+
+    if (shm := _attached.get(shm_name)) is None:
+        shm = _attached[shm_name] = SharedMemory(name=shm_name)
+    frame = decode_image(data)
+    if frame.nbytes > size:
+        raise ValueError(f"decoded frame of {frame.shape} exceeds the slot size")
+    np.ndarray(frame.shape, dtype=np.uint8, buffer=shm.buf)[...] = frame
+    return frame.shape
+
+
+class DecodedFrame:
+    """
+    A decoded frame backed by one of the decoder's shared memory slots.
+
+    The slot is reused once the frame is released, so copy the array
+    if it has to outlive the frame.
+    """
+
+    def __init__(self, decoder, slot, array):
+        self._decoder = decoder
+        self._slot = slot
+        self.array = array
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.release()
+
+    def mean_luma(self) -> float:
+        return mean_luma(self.array)
+
+    def release(self):
+        """returns the shared memory slot to the decoder"""
+
+        if self._slot is not None:
+            self.array = None
+            self._decoder._free.put(self._slot)
+            self._slot = None
+
+
+class FrameDecoder:
+    """
+    Decodes screenshots in a process pool, off the GIL.
+
+    Workers write decoded pixels straight into preallocated shared memory
+    slots, so no pixel data is pickled back to the calling process. They are
+    spawned rather than forked, so they never inherit the client's threads
+    or sockets.
+    """
+
+    def __init__(
+        self,
+        max_width: int = 1920,
+        max_height: int = 1080,
+        slots: int = 8,
+        workers: Optional[int] = None,
+    ):
+        """
+        :param max_width: widest frame that will be decoded
+        :type max_width: int
+        :param max_height: tallest frame that will be decoded
+        :type max_height: int
+        :param slots: number of frames that may be decoded or held at once
+        :type slots: int
+        :param workers: number of worker processes, defaults to the cpu count
+        :type workers: int, optional
+        """
+        self.slot_size = max_width * max_height * 3
+        self._pool = ProcessPoolExecutor(
+            workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        self._shm = [
+            SharedMemory(create=True, size=self.slot_size) for _ in range(slots)
+        ]
+        self._free = queue.Queue()
+        for slot in range(slots):
+            self._free.put(slot)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def submit(self, data) -> Future:
+        """
+        queues an encoded image for decoding, blocks while every slot is in use
+
+        returns a Future resolving to a DecodedFrame
+        """
+        slot = self._free.get()
+        shm = self._shm[slot]
+        future = Future()
+
+        def done(result):
+            if (e := result.exception()) is not None:
+                self._free.put(slot)
+                future.set_exception(e)
+                return
+            array = np.ndarray(result.result(), dtype=np.uint8, buffer=shm.buf)
+            future.set_result(DecodedFrame(self, slot, array))
+
+        try:
+            self._pool.submit(
+                _decode_into, bytes(data), shm.name, self.slot_size
+            ).add_done_callback(done)
+        except Exception:
+            self._free.put(slot)
+            raise
+        return future
+
+    def decode(self, data) -> DecodedFrame:
+        """decodes an encoded image, waiting for the result"""
+
+        return self.submit(data).result()
+
+    def close(self):
+        """shuts down the worker processes and frees the shared memory"""
+
+        self._pool.shutdown()
+        for shm in self._shm:
+            try:
+                shm.close()
+            except BufferError:
+                # a frame that was never released still maps the block
+                pass
+            shm.unlink()
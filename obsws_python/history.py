@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import deque
+from typing import NamedTuple, Optional
+
+"""
+A bounded in-memory record of recently received events
+"""
+
+
+class EventRecord(NamedTuple):
+    timestamp: float
+    event_type: str
+    data: dict
+    size: int
+
+
+class EventHistory:
+    """Fixed-size ring buffer of recent events, bounded by count and bytes"""
+
+    NAME_KEYS = ("inputName", "sceneName", "sourceName")
+
+    def __init__(self, maxlen: int = 1000, maxbytes: Optional[int] = None):
+        """
+        :param maxlen: maximum number of events to keep
+        :type maxlen: int
+        :param maxbytes: maximum total size of the raw event messages to keep
+        :type maxbytes: int, optional
+        """
+        self.maxlen = maxlen
+        self.maxbytes = maxbytes
+        self._records = deque(maxlen=maxlen)
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._records)
+
+    @property
+    def nbytes(self) -> int:
+        """total size of the raw event messages currently held"""
+
+        return self._nbytes
+
+    def append(self, event_type: str, data: dict, size: int = 0):
+        """records an event, evicting the oldest ones once a bound is exceeded"""
+
+        record = EventRecord(time.time(), event_type, data, size)
+        with self._lock:
+            if len(self._records) == self.maxlen:
+                self._nbytes -= self._records[0].size
+            self._records.append(record)
+            self._nbytes += size
+            if self.maxbytes is not None:
+                while self._nbytes > self.maxbytes and len(self._records) > 1:
+                    self._nbytes -= self._records.popleft().size
+
+    def query(
+        self,
+        event_type: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        name: Optional[str] = None,
+    ) -> list:
+        """
+        returns the recorded events matching all of the given filters, oldest first.
+
+        :param event_type: name of the event, eg. "InputMuteStateChanged"
+        :type event_type: str, optional
+        :param since: earliest timestamp (as returned by time.time()) to include
+        :type since: float, optional
+        :param until: latest timestamp to include
+        :type until: float, optional
+        :param name: input, scene or source name the event refers to
+        :type name: str, optional
+        """
+        with self._lock:
+            records = list(self._records)
+        if since is not None:
+            records = [r for r in records if r.timestamp >= since]
+        if until is not None:
+            records = [r for r in records if r.timestamp <= until]
+        if event_type is not None:
+            records = [r for r in records if r.event_type == event_type]
+        if name is not None:
+            records = [
+                r
+                for r in records
+                if any(r.data.get(key) == name for key in self.NAME_KEYS)
+            ]
+        return records
+
+    def last(self, seconds: float) -> list:
+        """returns the events received within the last number of seconds"""
+
+        return self.query(since=time.time() - seconds)
+
+    def clear(self):
+        """removes all recorded events"""
+
+        with self._lock:
+            self._records.clear()
+            self._nbytes = 0
@@ -0,0 +1,128 @@
+import json
+import re
+from json.decoder import scanstring
+from typing import Iterator, Optional
+
+"""
+Incremental parsing of large responses
+
+The members of a response preceding its responseData are parsed
+without decoding responseData itself. A list in it is then decoded
+one element at a time, so the whole list never exists as objects
+at once and processing starts before the last element is decoded.
+
+obs-websocket sorts the keys of its messages, responseData is the
+last member of a response. Messages not laid out that way are left
+to json.loads.
+"""
+
+_decode = json.JSONDecoder().raw_decode
+_whitespace = re.compile(r"[ \t\n\r]*").match
+
+
+def _skip(s, i):
+    return _whitespace(s, i).end()
+
+
+def _expect(s, i, char):
+    """index after `char`, the next non whitespace character of s from i"""
+
+    i = _skip(s, i)
+    if s[i : i + 1] != char:
+        raise ValueError(f"expected '{char}' at {i}")
+    return i + 1
+
+
+def _first(s, i, open_, close) -> Optional[int]:
+    """index of the first member or element of the object or array at i, None if empty"""
+
+    i = _skip(s, _expect(s, i, open_))
+    return None if s[i : i + 1] == close else i
+
+
+def _next(s, i, close) -> Optional[int]:
+    """index of the member or element after the value ending at i, None at `close`"""
+
+    i = _skip(s, i)
+    if s[i : i + 1] == ",":
+        return _skip(s, i + 1)
+    if s[i : i + 1] == close:
+        return None
+    raise ValueError(f"expected ',' or '{close}' at {i}")
+
+
+def _key(s, i):
+    """the key of the member at i and the index of its value"""
+
+    key, i = scanstring(s, _expect(s, i, '"'))
+    return key, _skip(s, _expect(s, i, ":"))
+
+
+class PartialResponse(dict):
+    """
+    The members of a response preceding its responseData, the
+    response data is left undecoded in `message` from `start`
+    """
+
+    def __init__(self, members: dict, message: str, start: Optional[int]):
+        super().__init__(members)
+        self.message = message
+        self.start = start
+
+    def iter(self, key: str) -> Iterator:
+        """
+        yields the elements of the list responseData[key] as they are decoded,
+        nothing if the response has no such list
+
+        raises ValueError if the value of `key` is not a list
+        """
+        if self.start is None:
+            return
+        s = self.message
+        i = _first(s, self.start, "{", "}")
+        while i is not None:
+            name, i = _key(s, i)
+            if name == key:
+                break
+            # members before the list are decoded and dropped, in sorted
+            # responses these are the few scalar fields ahead of it
+            _, i = _decode(s, i)
+            i = _next(s, i, "}")
+        else:
+            return
+        if s[i : i + 1] != "[":
+            raise ValueError(f"{key} is not a list")
+        i = _first(s, i, "[", "]")
+        while i is not None:
+            element, i = _decode(s, i)
+            yield element
+            i = _next(s, i, "]")
+
+
+def parse_response(message: str) -> Optional[PartialResponse]:
+    """
+    parses the response ("d") of a message up to its responseData
+
+    members following responseData are not parsed, the caller decodes
+    the message whole when one it needs is missing. returns None for
+    messages without a "d" object
+    """
+    i = _first(message, 0, "{", "}")
+    while i is not None:
+        key, i = _key(message, i)
+        if key == "d":
+            break
+        _, i = _decode(message, i)
+        i = _next(message, i, "}")
+    else:
+        return None
+
+    members = {}
+    i = _first(message, i, "{", "}")
+    while i is not None:
+        key, i = _key(message, i)
+        if key == "responseData":
+            return PartialResponse(members, message, i)
+        members[key], i = _decode(message, i)
+        i = _next(message, i, "}")
+    return PartialResponse(members, message, None)
@@ -0,0 +1,385 @@
+import threading
+import time
+from enum import IntEnum
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+"""
+Vectorized processing of InputVolumeMeters events
+
+Requires numpy, install with `pip install obsws-python[analysis]`
+"""
+
+LevelType = IntEnum("LevelType", "VU POSTFADER PREFADER", start=0)
+
+FLOOR_DB = -200.0
+
+
+def mul_to_db(mul):
+    """converts linear multipliers to dB, clamping silence to FLOOR_DB"""
+
+    mul = np.asarray(mul, dtype=np.float64)
+    with np.errstate(divide="ignore"):
+        db = 20.0 * np.log10(mul)
+    return np.maximum(db, FLOOR_DB)
+
+
+def levels_array(inputs: list, channels: Optional[int] = None):
+    """
+    converts the inputs of an InputVolumeMeters payload into an array
+    shaped (inputs, channels, 3), padded with zeros for inputs with fewer channels.
+    """
+
+    levels = [i["inputLevelsMul"] for i in inputs]
+    widths = {len(mul) for mul in levels}
+    if channels is None:
+        channels = max(widths, default=0)
+    if widths == {channels} and channels:
+        return np.array(levels, dtype=np.float64)
+    arr = np.zeros((len(levels), channels, len(LevelType)))
+    for row, mul in enumerate(levels):
+        if mul:
+            arr[row, : len(mul)] = mul[:channels]
+    return arr
+
+
+class LevelFrame(NamedTuple):
+    """latest meter values of an input, each shaped (channels, 3)"""
+
+    timestamp: float
+    mul: np.ndarray
+    db: np.ndarray
+    peak_db: np.ndarray
+    rms_db: np.ndarray
+
+
+class LevelMeter:
+    """
+    Keeps dB, peak-hold and decaying RMS levels per input.
+
+    Register it with an EventClient subscribed to Subs.INPUTVOLUMEMETERS:
+
+        meter = LevelMeter()
+        client.callback.register(meter.on_input_volume_meters)
+    """
+
+    def __init__(
+        self,
+        peak_hold: float = 1.5,
+        peak_decay: float = 20.0,
+        rms_window: float = 0.3,
+    ):
+        """
+        :param peak_hold: seconds a peak is held before it starts to decay
+        :type peak_hold: float
+        :param peak_decay: rate at which a held peak falls, in dB per second
+        :type peak_decay: float
+        :param rms_window: time constant of the RMS average, in seconds
+        :type rms_window: float
+        """
+        self.peak_hold = peak_hold
+        self.peak_decay = peak_decay
+        self.rms_window = rms_window
+        self._index = {}
+        self._lock = threading.Lock()
+        self._alloc(0, 0)
+
+    def _alloc(self, rows, channels):
+        shape = (rows, channels, len(LevelType))
+        self._mul = np.zeros(shape)
+        self._db = np.full(shape, FLOOR_DB)
+        self._peak = np.full(shape, FLOOR_DB)
+        self._held_until = np.zeros(shape)
+        self._ms = np.zeros(shape)
+        self._updated = np.full(rows, np.nan)
+
+    def _grow(self, rows, channels):
+        old = (self._mul, self._db, self._peak, self._held_until, self._ms)
+        updated = self._updated
+        r, c = self._mul.shape[:2]
+        self._alloc(max(rows, r), max(channels, c))
+        for new, prev in zip(
+            (self._mul, self._db, self._peak, self._held_until, self._ms), old
+        ):
+            new[:r, :c] = prev
+        self._updated[:r] = updated
+
+    @property
+    def names(self) -> list:
+        """names of the inputs seen so far"""
+
+        return list(self._index)
+
+    def on_input_volume_meters(self, data):
+        """callback for the InputVolumeMeters event"""
+
+        self.update(data.inputs)
+
+    def update(self, inputs: list, timestamp: Optional[float] = None):
+        """processes the inputs list of an InputVolumeMeters payload"""
+
+        if timestamp is None:
+            timestamp = time.monotonic()
+        with self._lock:
+            for i in inputs:
+                self._index.setdefault(i["inputName"], len(self._index))
+            channels = max((len(i["inputLevelsMul"]) for i in inputs), default=0)
+            channels = max(channels, self._mul.shape[1])
+            if len(self._index) > self._mul.shape[0] or channels > self._mul.shape[1]:
+                self._grow(len(self._index), channels)
+            if not inputs:
+                return
+
+            rows = np.fromiter(
+                (self._index[i["inputName"]] for i in inputs), dtype=np.intp
+            )
+            mul = levels_array(inputs, channels)
+            db = mul_to_db(mul)
+
+            updated = self._updated[rows][:, None, None]
+            fresh = np.isnan(updated)
+            dt = np.where(fresh, 0.0, timestamp - updated)
+
+            peak = self._peak[rows]
+            held_until = self._held_until[rows]
+            decay_time = np.where(
+                fresh, 0.0, timestamp - np.maximum(held_until, updated)
+            )
+            peak = peak - self.peak_decay * np.maximum(decay_time, 0.0)
+            new_peak = db >= peak
+            self._peak[rows] = np.where(new_peak, db, np.maximum(peak, FLOOR_DB))
+            self._held_until[rows] = np.where(
+                new_peak, timestamp + self.peak_hold, held_until
+            )
+
+            alpha = np.where(fresh, 0.0, np.exp(-dt / self.rms_window))
+            self._ms[rows] = alpha * self._ms[rows] + (1.0 - alpha) * mul * mul
+
+            self._mul[rows] = mul
+            self._db[rows] = db
+            self._updated[rows] = timestamp
+
+    def frame(self, name: str) -> Optional[LevelFrame]:
+        """returns the latest levels of an input or None if it hasn't been seen"""
+
+        with self._lock:
+            if (row := self._index.get(name)) is None:
+                return None
+            with np.errstate(divide="ignore"):
+                rms_db = np.maximum(10.0 * np.log10(self._ms[row]), FLOOR_DB)
+            return LevelFrame(
+                float(self._updated[row]),
+                self._mul[row].copy(),
+                self._db[row].copy(),
+                self._peak[row].copy(),
+                rms_db,
+            )
+
+    def frames(self) -> dict:
+        """returns the latest levels of every input keyed by input name"""
+
+        return {name: self.frame(name) for name in self.names}
+
+
+BUCKET_DTYPE = np.dtype(
+    [
+        ("start", "f8"),
+        ("min_db", "f4"),
+        ("max_db", "f4"),
+        ("mean_db", "f4"),
+        ("peak_db", "f4"),
+        ("silent", "?"),
+        ("clipped", "?"),
+    ]
+)
+
+
+class _BucketRing:
+    """preallocated ring of BUCKET_DTYPE records"""
+
+    def __init__(self, capacity):
+        self.data = np.zeros(capacity, dtype=BUCKET_DTYPE)
+        self.count = 0
+
+    def append(self, record):
+        self.data[self.count % len(self.data)] = record
+        self.count += 1
+
+    def ordered(self):
+        if self.count <= len(self.data):
+            return self.data[: self.count].copy()
+        pos = self.count % len(self.data)
+        return np.concatenate((self.data[pos:], self.data[:pos]))
+
+
+class LevelAggregator:
+    """
+    Downsamples InputVolumeMeters events into per-input time buckets.
+
+    Each bucket holds the min, max and mean (power average) of the VU level,
+    the highest postfader peak and flags for silence and clipping.
+    Register it the same way as LevelMeter:
+
+        agg = LevelAggregator(resolutions=(1.0, 10.0))
+        client.callback.register(agg.on_input_volume_meters)
+    """
+
+    def __init__(
+        self,
+        resolutions: tuple = (1.0, 10.0),
+        capacity: int = 3600,
+        silence_db: float = -60.0,
+        clip_db: float = -0.5,
+    ):
+        """
+        :param resolutions: bucket widths in seconds
+        :type resolutions: tuple
+        :param capacity: number of buckets kept per input and resolution
+        :type capacity: int
+        :param silence_db: a bucket whose max level is below this is flagged silent
+        :type silence_db: float
+        :param clip_db: a bucket whose peak reaches this is flagged clipped
+        :type clip_db: float
+        """
+        self.resolutions = tuple(resolutions)
+        self.capacity = capacity
+        self.silence_db = silence_db
+        self.clip_db = clip_db
+        self._index = {}
+        self._names = []
+        self._stores = {}
+        self._lock = threading.Lock()
+        self._acc = {res: self._new_acc(0) for res in self.resolutions}
+
+    @staticmethod
+    def _new_acc(rows):
+        return {
+            "bucket": np.full(rows, -1, dtype=np.int64),
+            "min": np.full(rows, np.inf),
+            "max": np.zeros(rows),
+            "sum_sq": np.zeros(rows),
+            "count": np.zeros(rows, dtype=np.int64),
+            "peak": np.zeros(rows),
+        }
+
+    def _grow(self, rows):
+        for res, acc in self._acc.items():
+            new = self._new_acc(rows)
+            r = len(acc["bucket"])
+            for key in new:
+                new[key][:r] = acc[key]
+            self._acc[res] = new
+
+    @property
+    def names(self) -> list:
+        """names of the inputs seen so far"""
+
+        return list(self._names)
+
+    def on_input_volume_meters(self, data):
+        """callback for the InputVolumeMeters event"""
+
+        self.update(data.inputs)
+
+    def update(self, inputs: list, timestamp: Optional[float] = None):
+        """accumulates the inputs list of an InputVolumeMeters payload"""
+
+        if not inputs:
+            return
+        if timestamp is None:
+            timestamp = time.time()
+        mul = levels_array(inputs)
+        if mul.shape[1] == 0:
+            return
+        vu = mul[:, :, LevelType.VU].max(axis=1)
+        peak = mul[:, :, LevelType.POSTFADER].max(axis=1)
+
+        with self._lock:
+            for i in inputs:
+                name = i["inputName"]
+                if name not in self._index:
+                    self._index[name] = len(self._names)
+                    self._names.append(name)
+                    self._stores[name] = {
+                        res: _BucketRing(self.capacity) for res in self.resolutions
+                    }
+            if len(self._index) > len(self._acc[self.resolutions[0]]["bucket"]):
+                self._grow(len(self._index))
+            rows = np.fromiter(
+                (self._index[i["inputName"]] for i in inputs), dtype=np.intp
+            )
+
+            for res, acc in self._acc.items():
+                bucket = int(timestamp // res)
+                stale = rows[(acc["bucket"][rows] != bucket) & (acc["count"][rows] > 0)]
+                for row in stale:
+                    self._flush(res, acc, row)
+                reset = rows[acc["bucket"][rows] != bucket]
+                acc["bucket"][reset] = bucket
+                acc["min"][reset] = np.inf
+                acc["max"][reset] = 0.0
+                acc["sum_sq"][reset] = 0.0
+                acc["count"][reset] = 0
+                acc["peak"][reset] = 0.0
+
+                acc["min"][rows] = np.minimum(acc["min"][rows], vu)
+                acc["max"][rows] = np.maximum(acc["max"][rows], vu)
+                acc["sum_sq"][rows] += vu * vu
+                acc["count"][rows] += 1
+                acc["peak"][rows] = np.maximum(acc["peak"][rows], peak)
+
+    def _flush(self, res, acc, row):
+        name = self._names[row]
+        count = acc["count"][row]
+        min_db, max_db, peak_db = mul_to_db(
+            [acc["min"][row], acc["max"][row], acc["peak"][row]]
+        )
+        with np.errstate(divide="ignore"):
+            mean_db = max(10.0 * np.log10(acc["sum_sq"][row] / count), FLOOR_DB)
+        self._stores[name][res].append(
+            (
+                acc["bucket"][row] * res,
+                min_db,
+                max_db,
+                mean_db,
+                peak_db,
+                max_db < self.silence_db,
+                peak_db >= self.clip_db,
+            )
+        )
+
+    def flush(self):
+        """closes the open buckets of every input"""
+
+        with self._lock:
+            for res, acc in self._acc.items():
+                for row in np.flatnonzero(acc["count"] > 0):
+                    self._flush(res, acc, row)
+                    acc["count"][row] = 0
+                acc["bucket"][:] = -1
+
+    def buckets(self, name: str, resolution: Optional[float] = None):
+        """
+        returns the completed buckets of an input, oldest first,
+        as a structured array with BUCKET_DTYPE fields.
+        """
+
+        if resolution is None:
+            resolution = self.resolutions[0]
+        with self._lock:
+            if name not in self._stores:
+                return np.zeros(0, dtype=BUCKET_DTYPE)
+            return self._stores[name][resolution].ordered()
+
+    def silent(self, name: str, resolution: Optional[float] = None) -> bool:
+        """True if the latest completed bucket of an input was silent"""
+
+        buckets = self.buckets(name, resolution)
+        return bool(len(buckets) and buckets[-1]["silent"])
+
+    def clipped(self, name: str, resolution: Optional[float] = None) -> bool:
+        """True if the latest completed bucket of an input clipped"""
+
+        buckets = self.buckets(name, resolution)
+        return bool(len(buckets) and buckets[-1]["clipped"])
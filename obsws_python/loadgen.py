@@ -0,0 +1,309 @@
+import argparse
+import itertools
+import json
+import logging
+import random
+import threading
+import time
+from typing import Optional
+
+from .error import OBSSDKError, OBSSDKRequestError
+from .reqs import ReqClient
+from .util import to_camel_case
+
+"""
+A load generator replaying a mix of requests against an OBS instance
+
+    obsws-loadgen --mix set_scene_item_enabled=70,get_stats=20,get_source_screenshot=10 \\
+        --rate 200 --duration 30 --scene Main
+
+Any request without required fields may be named in the mix, by method
+name (get_scene_list) or request type (GetSceneList). The operations
+below are given request data from the instance's scenes and sources.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class Operations:
+    """builds the request data of the operations that need it"""
+
+    def __init__(self, cl: ReqClient, scene: Optional[str], source: Optional[str]):
+        self.scenes = [s["sceneName"] for s in cl.get_scene_list().scenes]
+        self.scene = scene or cl.get_current_program_scene().current_program_scene_name
+        self.source = source or self.scene
+        self.items = [
+            (item["sceneItemId"], item["sceneItemEnabled"])
+            for item in cl.get_scene_item_list(self.scene).scene_items
+        ]
+        self._items = itertools.cycle(self.items)
+        self._program = itertools.cycle(self.scenes)
+        self._toggled = {}
+        self.screenshot = {"imageFormat": "jpg", "imageWidth": 640}
+
+    def set_scene_item_enabled(self):
+        """alternately hides and shows each item of the scene"""
+
+        item_id, enabled = next(self._items)
+        enabled = self._toggled[item_id] = not self._toggled.get(item_id, enabled)
+        return {
+            "sceneName": self.scene,
+            "sceneItemId": item_id,
+            "sceneItemEnabled": enabled,
+        }
+
+    def set_current_program_scene(self):
+        return {"sceneName": next(self._program)}
+
+    def get_source_screenshot(self):
+        return {"sourceName": self.source, **self.screenshot}
+
+    def get_scene_item_list(self):
+        return {"sceneName": self.scene}
+
+    def get_source_filter_list(self):
+        return {"sourceName": self.source}
+
+
+def parse_mix(mix: str) -> dict:
+    """parses 'name=weight,name=weight' into {name: weight}"""
+
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight) if weight else 1.0
+    return weights
+
+
+def percentile(samples, q):
+    if not samples:
+        return 0.0
+    return samples[min(int(len(samples) * q / 100), len(samples) - 1)]
+
+
+class _Result:
+    def __init__(self):
+        self.latencies = []
+        self.errors = {}
+
+    def summary(self, elapsed) -> dict:
+        latencies = sorted(self.latencies)
+        count = len(latencies) + sum(self.errors.values())
+        return {
+            "requests": count,
+            "throughput": count / elapsed if elapsed else 0.0,
+            "error_rate": sum(self.errors.values()) / count if count else 0.0,
+            "errors": dict(self.errors),
+            **{f"p{q}_ms": percentile(latencies, q) * 1000 for q in (50, 90, 99, 99.9)},
+            "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+        }
+
+
+class LoadGenerator:
+    """
+    Sends a weighted mix of requests, either paced to a target rate
+    or as fast as `concurrency` requests in flight allow.
+
+    With a target rate latency is measured from when each request was
+    due to be sent, so a stalled server shows up in the percentiles
+    rather than lowering the send rate.
+    """
+
+    def __init__(
+        self,
+        cl: ReqClient,
+        mix: dict,
+        rate: Optional[float] = None,
+        concurrency: int = 16,
+        scene: Optional[str] = None,
+        source: Optional[str] = None,
+    ):
+        """
+        :param cl: the client to send with, requests are pipelined on its connection
+        :type cl: ReqClient
+        :param mix: relative weights keyed by method name or request type
+        :type mix: dict
+        :param rate: requests per second, None to send as fast as possible
+        :type rate: float, optional
+        :param concurrency: requests in flight at once
+        :type concurrency: int
+        """
+        self.cl = cl
+        self.rate = rate
+        self.concurrency = concurrency
+        self.operations = Operations(cl, scene, source)
+        self.names = list(mix)
+        self.weights = list(mix.values())
+        self.builders = {}
+        for name in self.names:
+            if "_" in name or name.islower():
+                build = getattr(self.operations, name, None)
+                self.builders[name] = (to_camel_case(name), build)
+            else:
+                self.builders[name] = (name, None)
+        if "set_scene_item_enabled" in mix and not self.operations.items:
+            raise ValueError(
+                f"scene '{self.operations.scene}' has no items to toggle, choose one with --scene"
+            )
+        self._slots = threading.Semaphore(concurrency)
+        self._lock = threading.Lock()
+        self._results = {}
+        self._window = _Result()
+
+    def _done(self, future, name, started):
+        finished = time.perf_counter()
+        self._slots.release()
+        error = None
+        if future.cancelled():
+            error = "cancelled"
+        elif (e := future.exception()) is not None:
+            error = e.code if isinstance(e, OBSSDKRequestError) else type(e).__name__
+        with self._lock:
+            for result in (self._results.setdefault(name, _Result()), self._window):
+                if error is None:
+                    result.latencies.append(finished - started)
+                else:
+                    result.errors[error] = result.errors.get(error, 0) + 1
+
+    def run(self, duration: float, interval: float = 1.0, report=print) -> dict:
+        """sends requests for `duration` seconds, reports progress every `interval`"""
+
+        started = time.perf_counter()
+        end = started + duration
+        next_report = started + interval
+        due = started
+        sent = 0
+        while (now := time.perf_counter()) < end:
+            if now >= next_report:
+                with self._lock:
+                    window, self._window = self._window, _Result()
+                report(self._format(now - started, window.summary(interval)))
+                next_report += interval
+            if self.rate:
+                due = started + sent / self.rate
+                if due > now:
+                    time.sleep(min(due - now, next_report - now))
+                    continue
+            if not self._slots.acquire(timeout=0.1):
+                continue
+            name = random.choices(self.names, self.weights)[0]
+            req_type, build = self.builders[name]
+            t0 = due if self.rate else time.perf_counter()
+            try:
+                future = self.cl.send_async(
+                    req_type, build() if build else None, raw=True
+                )
+            except OBSSDKError as e:
+                self._slots.release()
+                logger.error(f"{type(e).__name__}: {e}")
+                break
+            future.add_done_callback(lambda f, n=name, t=t0: self._done(f, n, t))
+            sent += 1
+
+        # wait for the responses still in flight
+        drained = time.perf_counter() + 10.0
+        for _ in range(self.concurrency):
+            self._slots.acquire(timeout=max(drained - time.perf_counter(), 0))
+        elapsed = time.perf_counter() - started
+        total = _Result()
+        for result in self._results.values():
+            total.latencies += result.latencies
+            for code, n in result.errors.items():
+                total.errors[code] = total.errors.get(code, 0) + n
+        return {
+            "duration": elapsed,
+            "target_rate": self.rate,
+            "concurrency": self.concurrency,
+            "total": total.summary(elapsed),
+            "requests": {
+                name: result.summary(elapsed) for name, result in self._results.items()
+            },
+        }
+
+    @staticmethod
+    def _format(at, summary):
+        return (
+            f"{at:6.1f}s {summary['throughput']:8.1f} req/s "
+            f"p50 {summary['p50_ms']:7.2f}ms p99 {summary['p99_ms']:7.2f}ms "
+            f"errors {summary['error_rate'] * 100:5.1f}%"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="obsws-loadgen",
+        description="Replay a mix of requests against OBS and report latency percentiles, error rates and throughput.",
+    )
+    parser.add_argument("--host", help="defaults to the config.toml connection")
+    parser.add_argument("--port", type=int)
+    parser.add_argument("--password")
+    parser.add_argument(
+        "--mix",
+        default="set_scene_item_enabled=70,get_stats=20,get_source_screenshot=10",
+        help="comma separated name=weight pairs",
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="requests per second, omit to send as fast as --concurrency allows",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="requests in flight at once"
+    )
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds")
+    parser.add_argument("--scene", help="scene whose items are toggled")
+    parser.add_argument("--source", help="source to take screenshots of")
+    parser.add_argument("--json", help="write the final report to a file")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING)
+    if not args.verbose:
+        # failed requests are counted in the report, not logged one by one
+        logging.getLogger("obsws_python").setLevel(logging.CRITICAL)
+
+    conn = {
+        key: value
+        for key, value in (
+            ("host", args.host),
+            ("port", args.port),
+            ("password", args.password),
+        )
+        if value is not None
+    }
+    with ReqClient(**conn) as cl:
+        try:
+            generator = LoadGenerator(
+                cl,
+                parse_mix(args.mix),
+                args.rate,
+                args.concurrency,
+                args.scene,
+                args.source,
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        report = generator.run(args.duration, args.interval)
+
+    total = report["total"]
+    print(
+        f"\n{total['requests']} requests in {report['duration']:.1f}s, "
+        f"{total['throughput']:.1f} req/s, {total['error_rate'] * 100:.2f}% errors"
+    )
+    print(
+        f"{'request':<28}{'count':>8}{'req/s':>9}{'p50':>9}{'p90':>9}{'p99':>9}{'p99.9':>9}{'max':>9}{'err%':>7}"
+    )
+    for name, s in {**report["requests"], "total": total}.items():
+        print(
+            f"{name:<28}{s['requests']:>8}{s['throughput']:>9.1f}"
+            f"{s['p50_ms']:>9.2f}{s['p90_ms']:>9.2f}{s['p99_ms']:>9.2f}"
+            f"{s['p99.9_ms']:>9.2f}{s['max_ms']:>9.2f}{s['error_rate'] * 100:>7.2f}"
+        )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import NamedTuple, Optional
+
+"""
+Latency, size and error instrumentation of requests and events
+"""
+
+logger = logging.getLogger(__name__)
+
+# upper bounds of the latency histogram buckets in seconds, the last one catches the rest
+BUCKETS = (
+    0.0005,
+    0.001,
+    0.002,
+    0.005,
+    0.01,
+    0.02,
+    0.05,
+    0.1,
+    0.2,
+    0.5,
+    1.0,
+    2.0,
+    5.0,
+    float("inf"),
+)
+
+
+class RequestSample(NamedTuple):
+    """
+    One completed request as passed to a metrics sink.
+
+    code is None when no response arrived, the request timed out, was
+    cancelled or the connection closed. For batches it is the code of
+    the first failed request in the batch.
+    """
+
+    request_type: str
+    latency: float
+    bytes_sent: int
+    bytes_received: int
+    code: Optional[int]
+    ok: bool
+    in_flight: int
+
+
+class _Histogram:
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.histogram = [0] * len(BUCKETS)
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.histogram[bisect_left(BUCKETS, value)] += 1
+
+    def quantile(self, q):
+        """upper bound of the bucket holding the q quantile"""
+
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(BUCKETS, self.histogram):
+            seen += n
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class _TypeStats(_Histogram):
+    def __init__(self):
+        super().__init__()
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+
+class RequestMetrics:
+    """
+    In-process metrics sink, pass an instance as the `metrics` kwarg of a client:
+
+        metrics = RequestMetrics()
+        cl = obs.ReqClient(metrics=metrics)
+        ...
+        print(metrics.snapshot())
+
+    Any callable accepting a RequestSample may be passed instead,
+    to forward samples to an external metrics system.
+    """
+
+    def __init__(self):
+        self._types = {}
+        self._codes = {}
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, sample: RequestSample):
+        with self._lock:
+            if (stats := self._types.get(sample.request_type)) is None:
+                stats = self._types[sample.request_type] = _TypeStats()
+            stats.add(sample.latency)
+            stats.bytes_sent += sample.bytes_sent
+            stats.bytes_received += sample.bytes_received
+            if not sample.ok:
+                stats.errors += 1
+                code = "no_response" if sample.code is None else sample.code
+                self._codes[code] = self._codes.get(code, 0) + 1
+            self._in_flight = sample.in_flight
+            self._max_in_flight = max(self._max_in_flight, sample.in_flight)
+
+    def submitted(self, in_flight: int):
+        """
+        called by the client as each request is submitted,
+        so the gauge also counts requests that have not finished yet
+
+        :param in_flight: requests awaiting a response, this one included
+        :type in_flight: int
+        """
+        with self._lock:
+            self._in_flight = in_flight
+            self._max_in_flight = max(self._max_in_flight, in_flight)
+
+    def snapshot(self) -> dict:
+        """
+        per request type counts, latencies in seconds, histogram and bytes,
+        errors by status code and the in-flight gauge
+        """
+        with self._lock:
+            return {
+                "requests": {
+                    req_type: {
+                        "count": stats.count,
+                        "errors": stats.errors,
+                        **stats.summary(),
+                        "histogram": dict(zip(BUCKETS, stats.histogram)),
+                        "bytes_sent": stats.bytes_sent,
+                        "bytes_received": stats.bytes_received,
+                    }
+                    for req_type, stats in self._types.items()
+                },
+                "errors": dict(self._codes),
+                "in_flight": self._in_flight,
+                "max_in_flight": self._max_in_flight,
+            }
+
+    def reset(self):
+        with self._lock:
+            self._types.clear()
+            self._codes.clear()
+            self._max_in_flight = self._in_flight
+
+
+class EventMetrics:
+    """
+    Event pipeline metrics, pass an instance (or True) as the `metrics`
+    kwarg of an EventClient:
+
+        cl = obs.EventClient(metrics=True)
+        ...
+        print(cl.metrics.snapshot())
+
+    Records events received per type, JSON decode time, the lag from
+    receiving an event to each handler starting and the time spent in
+    each handler.
+    """
+
+    def __init__(self):
+        self.logger = logger.getChild(self.__class__.__name__)
+        self._events = {}
+        self._handlers = {}
+        self._since = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self.worker = None
+
+    def received(self, event_type: str, decode_time: float):
+        """records an event received and the time taken to decode it"""
+
+        with self._lock:
+            if (stats := self._events.get(event_type)) is None:
+                stats = self._events[event_type] = _Histogram()
+            stats.add(decode_time)
+
+    def handled(self, handler: str, lag: float, duration: float):
+        """records the lag from receipt to a handler starting and its run time"""
+
+        with self._lock:
+            if (stats := self._handlers.get(handler)) is None:
+                stats = self._handlers[handler] = (_Histogram(), _Histogram())
+            stats[0].add(lag)
+            stats[1].add(duration)
+
+    def snapshot(self, reset: bool = False) -> dict:
+        """
+        per event type counts, rates in events/s and decode times,
+        per handler lag and run times, all times in seconds
+
+        reset clears the metrics in the same step
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._since
+            snapshot = {
+                "elapsed": elapsed,
+                "events": {
+                    event_type: {
+                        "count": stats.count,
+                        "rate": stats.count / elapsed if elapsed > 0 else 0.0,
+                        "decode": stats.summary(),
+                    }
+                    for event_type, stats in self._events.items()
+                },
+                "handlers": {
+                    handler: {
+                        "count": duration.count,
+                        "lag": lag.summary(),
+                        "time": duration.summary(),
+                    }
+                    for handler, (lag, duration) in self._handlers.items()
+                },
+            }
+            if reset:
+                self._reset()
+            return snapshot
+
+    def _reset(self):
+        self._events = {}
+        self._handlers = {}
+        self._since = time.monotonic()
+
+    def reset(self):
+        with self._lock:
+            self._reset()
+
+    def start(self, interval: float = 60.0, report=None):
+        """
+        reports a snapshot every `interval` seconds from a daemon thread
+        then resets the metrics, so rates cover the last interval
+
+        :param report: called with each snapshot, defaults to logging it at INFO level
+        :type report: Callable, optional
+        """
+        if report is None:
+            report = self._log
+        self._stop_event.clear()
+        self.reset()
+        self.worker = threading.Thread(
+            target=self._run, args=(interval, report), daemon=True
+        )
+        self.worker.start()
+
+    def stop(self):
+        """stop reporting"""
+
+        self._stop_event.set()
+        if self.worker is not None:
+            self.worker.join()
+
+    def _run(self, interval, report):
+        while not self._stop_event.wait(interval):
+            snapshot = self.snapshot(reset=True)
+            try:
+                report(snapshot)
+            except Exception as e:
+                self.logger.exception(f"{type(e).__name__} raised by the reporter")
+
+    def _log(self, snapshot):
+        for event_type, stats in snapshot["events"].items():
+            self.logger.info(
+                f"{event_type}: {stats['rate']:.1f}/s decode p99 {stats['decode']['p99'] * 1000:.2f}ms"
+            )
+        for handler, stats in snapshot["handlers"].items():
+            self.logger.info(
+                f"{handler}: lag p99 {stats['lag']['p99'] * 1000:.2f}ms time p99 {stats['time']['p99'] * 1000:.2f}ms"
+            )
@@ -0,0 +1,1120 @@
+import base64
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import math
+import os
+import random
+import re
+import socket
+import struct
+import threading
+import time
+import uuid
+import zlib
+from typing import Callable, Optional, Union
+
+from .subs import Subs
+from .util import to_camel_case, to_snake_case
+
+"""
+An in-process mock obs-websocket v5 server for tests and benchmarks
+
+Implements Hello/Identify with authentication, requests (OpCode 6/7),
+request batches (OpCode 8/9) and events (OpCode 5) against a small
+model of OBS state. Run standalone with `python -m obsws_python.mock`.
+"""
+
+logger = logging.getLogger(__name__)
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# intents of the events the mock generates, anything else is sent as GENERAL
+EVENT_INTENTS = {
+    "CurrentSceneCollectionChanged": Subs.CONFIG,
+    "CurrentProfileChanged": Subs.CONFIG,
+    "SceneCreated": Subs.SCENES,
+    "SceneRemoved": Subs.SCENES,
+    "CurrentProgramSceneChanged": Subs.SCENES,
+    "CurrentPreviewSceneChanged": Subs.SCENES,
+    "InputCreated": Subs.INPUTS,
+    "InputRemoved": Subs.INPUTS,
+    "InputSettingsChanged": Subs.INPUTS,
+    "InputMuteStateChanged": Subs.INPUTS,
+    "InputVolumeChanged": Subs.INPUTS,
+    "CurrentSceneTransitionChanged": Subs.TRANSITIONS,
+    "SourceFilterCreated": Subs.FILTERS,
+    "SourceFilterRemoved": Subs.FILTERS,
+    "StreamStateChanged": Subs.OUTPUTS,
+    "RecordStateChanged": Subs.OUTPUTS,
+    "SceneItemEnableStateChanged": Subs.SCENEITEMS,
+    "StudioModeStateChanged": Subs.UI,
+    "InputVolumeMeters": Subs.INPUTVOLUMEMETERS,
+    "InputActiveStateChanged": Subs.INPUTACTIVESTATECHANGED,
+    "InputShowStateChanged": Subs.INPUTSHOWSTATECHANGED,
+    "SceneItemTransformChanged": Subs.SCENEITEMTRANSFORMCHANGED,
+}
+
+
+class MockRequestError(Exception):
+    """raised by a request handler to fail the request with a status code"""
+
+    def __init__(self, code: int, comment: Optional[str] = None):
+        self.code = code
+        self.comment = comment
+        super().__init__(comment)
+
+
+def _required(data, *fields):
+    for field in fields:
+        if data.get(field) is None:
+            raise MockRequestError(300, f"Your request is missing the `{field}` field.")
+    return [data[field] for field in fields]
+
+
+def _png(width, height, rgb):
+    """encodes a solid colour RGB PNG"""
+
+    def chunk(kind, body):
+        return (
+            struct.pack(">I", len(body))
+            + kind
+            + body
+            + struct.pack(">I", zlib.crc32(kind + body))
+        )
+
+    row = b"\x00" + bytes(rgb) * width
+    return b"".join(
+        (
+            b"\x89PNG\r\n\x1a\n",
+            chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),
+            chunk(b"IDAT", zlib.compress(row * height, 1)),
+            chunk(b"IEND", b""),
+        )
+    )
+
+
+class MockState:
+    """
+    A minimal model of OBS state.
+
+    Each request type is handled by the method of the same name in
+    snake_case, which receives the requestData and returns the
+    responseData. Subclass to add or change request types, or register
+    handlers on the server with MockServer.handler().
+    """
+
+    def __init__(self):
+        self.emit = lambda event_type, data=None: None
+        self.scenes = {}
+        self.inputs = {}
+        self.filters = {}
+        self.colors = {}
+        self.persistent_data = {}
+        self.studio_mode = False
+        self.streaming = False
+        self.recording = False
+        self.stream_service = {"streamServiceType": "rtmp_common", "settings": {}}
+        self.transitions = ["Fade", "Cut"]
+        self.current_transition = "Fade"
+        self.hotkeys = [
+            "OBSBasic.StartStreaming",
+            "OBSBasic.StopStreaming",
+            "OBSBasic.StartRecording",
+            "OBSBasic.StopRecording",
+            "OBSBasic.TransitionStudioMode",
+        ]
+        self.video = {
+            "fpsNumerator": 60,
+            "fpsDenominator": 1,
+            "baseWidth": 1920,
+            "baseHeight": 1080,
+            "outputWidth": 1920,
+            "outputHeight": 1080,
+        }
+        self._item_ids = itertools.count(1)
+        self._started = time.monotonic()
+        self._screenshots = {}
+        self._available = None
+        self.add_scene("Scene")
+        self.program_scene = self.preview_scene = "Scene"
+
+    def add_scene(self, name: str) -> dict:
+        scene = self.scenes[name] = {"uuid": str(uuid.uuid4()), "items": []}
+        return scene
+
+    def _scene(self, name):
+        if name not in self.scenes:
+            raise MockRequestError(600, f"No source was found by the name of `{name}`.")
+        return self.scenes[name]
+
+    def _input(self, name):
+        if name not in self.inputs:
+            raise MockRequestError(600, f"No source was found by the name of `{name}`.")
+        return self.inputs[name]
+
+    def _source(self, name):
+        if name in self.scenes:
+            return self.scenes[name]
+        return self._input(name)
+
+    def _scene_item(self, data):
+        scene_name, item_id = _required(data, "sceneName", "sceneItemId")
+        for item in self._scene(scene_name)["items"]:
+            if item["sceneItemId"] == item_id:
+                return item
+        raise MockRequestError(
+            600, "No scene items were found in the specified scene by that ID."
+        )
+
+    # General
+
+    def get_version(self, data):
+        if self._available is None:
+            self._available = sorted(
+                to_camel_case(name)
+                for name in dir(self)
+                if not name.startswith("_")
+                and callable(getattr(self, name))
+                and name not in ("add_scene", "emit")
+            )
+        return {
+            "availableRequests": self._available,
+            "obsVersion": "30.0.0",
+            "obsWebSocketVersion": "5.3.0",
+            "platform": "mock",
+            "platformDescription": "obsws-python mock server",
+            "rpcVersion": 1,
+            "supportedImageFormats": ["bmp", "jpeg", "jpg", "png"],
+        }
+
+    def get_stats(self, data):
+        return {
+            "activeFps": 60.0,
+            "availableDiskSpace": 100000.0,
+            "averageFrameRenderTime": 0.5,
+            "cpuUsage": random.uniform(1.0, 5.0),
+            "memoryUsage": 300.0,
+            "outputSkippedFrames": 0,
+            "outputTotalFrames": int((time.monotonic() - self._started) * 60),
+            "renderSkippedFrames": 0,
+            "renderTotalFrames": int((time.monotonic() - self._started) * 60),
+            "webSocketSessionIncomingMessages": 0,
+            "webSocketSessionOutgoingMessages": 0,
+        }
+
+    def broadcast_custom_event(self, data):
+        (event_data,) = _required(data, "eventData")
+        self.emit("CustomEvent", event_data)
+
+    def get_hotkey_list(self, data):
+        return {"hotkeys": list(self.hotkeys)}
+
+    def trigger_hotkey_by_name(self, data):
+        _required(data, "hotkeyName")
+
+    # Config
+
+    def get_persistent_data(self, data):
+        realm, slot_name = _required(data, "realm", "slotName")
+        return {"slotValue": self.persistent_data.get((realm, slot_name))}
+
+    def set_persistent_data(self, data):
+        realm, slot_name = _required(data, "realm", "slotName")
+        self.persistent_data[(realm, slot_name)] = data.get("slotValue")
+
+    def get_video_settings(self, data):
+        return dict(self.video)
+
+    def get_stream_service_settings(self, data):
+        return {
+            "streamServiceSettings": self.stream_service["settings"],
+            "streamServiceType": self.stream_service["streamServiceType"],
+        }
+
+    def set_stream_service_settings(self, data):
+        service_type, settings = _required(
+            data, "streamServiceType", "streamServiceSettings"
+        )
+        self.stream_service = {"streamServiceType": service_type, "settings": settings}
+
+    # Scenes
+
+    def get_scene_list(self, data):
+        return {
+            "currentPreviewSceneName": (
+                self.preview_scene if self.studio_mode else None
+            ),
+            "currentProgramSceneName": self.program_scene,
+            "scenes": [
+                {"sceneIndex": i, "sceneName": name, "sceneUuid": scene["uuid"]}
+                for i, (name, scene) in enumerate(reversed(self.scenes.items()))
+            ],
+        }
+
+    def get_current_program_scene(self, data):
+        scene_uuid = self.scenes[self.program_scene]["uuid"]
+        return {
+            "currentProgramSceneName": self.program_scene,
+            "currentProgramSceneUuid": scene_uuid,
+            "sceneName": self.program_scene,
+            "sceneUuid": scene_uuid,
+        }
+
+    def set_current_program_scene(self, data):
+        (name,) = _required(data, "sceneName")
+        scene = self._scene(name)
+        self.program_scene = name
+        self.emit(
+            "CurrentProgramSceneChanged",
+            {"sceneName": name, "sceneUuid": scene["uuid"]},
+        )
+
+    def get_current_preview_scene(self, data):
+        if not self.studio_mode:
+            raise MockRequestError(506, "Studio mode is not enabled.")
+        scene_uuid = self.scenes[self.preview_scene]["uuid"]
+        return {
+            "currentPreviewSceneName": self.preview_scene,
+            "currentPreviewSceneUuid": scene_uuid,
+            "sceneName": self.preview_scene,
+            "sceneUuid": scene_uuid,
+        }
+
+    def set_current_preview_scene(self, data):
+        (name,) = _required(data, "sceneName")
+        if not self.studio_mode:
+            raise MockRequestError(506, "Studio mode is not enabled.")
+        scene = self._scene(name)
+        self.preview_scene = name
+        self.emit(
+            "CurrentPreviewSceneChanged",
+            {"sceneName": name, "sceneUuid": scene["uuid"]},
+        )
+
+    def create_scene(self, data):
+        (name,) = _required(data, "sceneName")
+        if name in self.scenes or name in self.inputs:
+            raise MockRequestError(601, "A source already exists by that scene name.")
+        scene = self.add_scene(name)
+        self.emit(
+            "SceneCreated",
+            {"isGroup": False, "sceneName": name, "sceneUuid": scene["uuid"]},
+        )
+        return {"sceneUuid": scene["uuid"]}
+
+    def remove_scene(self, data):
+        (name,) = _required(data, "sceneName")
+        scene = self._scene(name)
+        if len(self.scenes) == 1:
+            raise MockRequestError(702, "You cannot remove the last scene.")
+        del self.scenes[name]
+        if self.program_scene == name:
+            self.program_scene = next(iter(self.scenes))
+        if self.preview_scene == name:
+            self.preview_scene = self.program_scene
+        self.emit(
+            "SceneRemoved",
+            {"isGroup": False, "sceneName": name, "sceneUuid": scene["uuid"]},
+        )
+
+    # Inputs
+
+    def get_input_list(self, data):
+        kind = data.get("inputKind")
+        return {
+            "inputs": [
+                {
+                    "inputKind": i["inputKind"],
+                    "inputName": name,
+                    "inputUuid": i["uuid"],
+                    "unversionedInputKind": re.sub(r"_v\d+$", "", i["inputKind"]),
+                }
+                for name, i in self.inputs.items()
+                if kind is None or i["inputKind"] == kind
+            ]
+        }
+
+    def create_input(self, data):
+        scene_name, name, kind = _required(data, "sceneName", "inputName", "inputKind")
+        scene = self._scene(scene_name)
+        if name in self.scenes or name in self.inputs:
+            raise MockRequestError(601, "A source already exists by that input name.")
+        input_ = self.inputs[name] = {
+            "uuid": str(uuid.uuid4()),
+            "inputKind": kind,
+            "settings": data.get("inputSettings") or {},
+            "muted": False,
+            "volumeMul": 1.0,
+        }
+        item_id = next(self._item_ids)
+        enabled = data.get("sceneItemEnabled")
+        scene["items"].append(
+            {
+                "sceneItemId": item_id,
+                "sourceName": name,
+                "sceneItemEnabled": True if enabled is None else enabled,
+            }
+        )
+        self.emit(
+            "InputCreated",
+            {
+                "inputKind": kind,
+                "inputName": name,
+                "inputSettings": input_["settings"],
+                "inputUuid": input_["uuid"],
+                "unversionedInputKind": re.sub(r"_v\d+$", "", kind),
+            },
+        )
+        return {"inputUuid": input_["uuid"], "sceneItemId": item_id}
+
+    def remove_input(self, data):
+        (name,) = _required(data, "inputName")
+        input_ = self._input(name)
+        del self.inputs[name]
+        self.filters.pop(name, None)
+        for scene in self.scenes.values():
+            scene["items"] = [i for i in scene["items"] if i["sourceName"] != name]
+        self.emit("InputRemoved", {"inputName": name, "inputUuid": input_["uuid"]})
+
+    def get_input_settings(self, data):
+        (name,) = _required(data, "inputName")
+        input_ = self._input(name)
+        return {"inputKind": input_["inputKind"], "inputSettings": input_["settings"]}
+
+    def set_input_settings(self, data):
+        name, settings = _required(data, "inputName", "inputSettings")
+        input_ = self._input(name)
+        overlay = data.get("overlay")
+        if overlay is None or overlay:
+            input_["settings"] = input_["settings"] | settings
+        else:
+            input_["settings"] = dict(settings)
+        self.emit(
+            "InputSettingsChanged",
+            {
+                "inputName": name,
+                "inputSettings": input_["settings"],
+                "inputUuid": input_["uuid"],
+            },
+        )
+
+    def get_input_mute(self, data):
+        (name,) = _required(data, "inputName")
+        return {"inputMuted": self._input(name)["muted"]}
+
+    def set_input_mute(self, data):
+        name, muted = _required(data, "inputName", "inputMuted")
+        self._set_mute(name, muted)
+
+    def toggle_input_mute(self, data):
+        (name,) = _required(data, "inputName")
+        return {"inputMuted": self._set_mute(name, not self._input(name)["muted"])}
+
+    def _set_mute(self, name, muted):
+        input_ = self._input(name)
+        input_["muted"] = muted
+        self.emit(
+            "InputMuteStateChanged",
+            {"inputMuted": muted, "inputName": name, "inputUuid": input_["uuid"]},
+        )
+        return muted
+
+    def get_input_volume(self, data):
+        (name,) = _required(data, "inputName")
+        mul = self._input(name)["volumeMul"]
+        return {
+            "inputVolumeDb": 20 * math.log10(mul) if mul else -100.0,
+            "inputVolumeMul": mul,
+        }
+
+    def set_input_volume(self, data):
+        (name,) = _required(data, "inputName")
+        input_ = self._input(name)
+        if data.get("inputVolumeMul") is not None:
+            input_["volumeMul"] = data["inputVolumeMul"]
+        elif data.get("inputVolumeDb") is not None:
+            input_["volumeMul"] = 10 ** (data["inputVolumeDb"] / 20)
+        else:
+            raise MockRequestError(
+                300, "Your request is missing the `inputVolumeMul` field."
+            )
+        self.emit(
+            "InputVolumeChanged",
+            {
+                "inputName": name,
+                "inputUuid": input_["uuid"],
+                **self.get_input_volume(data),
+            },
+        )
+
+    # Transitions
+
+    def get_transition_kind_list(self, data):
+        return {"transitionKinds": ["cut_transition", "fade_transition"]}
+
+    def get_scene_transition_list(self, data):
+        return {
+            "currentSceneTransitionKind": f"{self.current_transition.lower()}_transition",
+            "currentSceneTransitionName": self.current_transition,
+            "transitions": [
+                {"transitionKind": f"{name.lower()}_transition", "transitionName": name}
+                for name in self.transitions
+            ],
+        }
+
+    def set_current_scene_transition(self, data):
+        (name,) = _required(data, "transitionName")
+        if name not in self.transitions:
+            raise MockRequestError(600, "No transition was found by that name.")
+        self.current_transition = name
+        self.emit("CurrentSceneTransitionChanged", {"transitionName": name})
+
+    # Filters
+
+    def get_source_filter_list(self, data):
+        (name,) = _required(data, "sourceName")
+        self._source(name)
+        return {
+            "filters": [
+                dict(f, filterIndex=i) for i, f in enumerate(self.filters.get(name, []))
+            ]
+        }
+
+    def create_source_filter(self, data):
+        source, name, kind = _required(data, "sourceName", "filterName", "filterKind")
+        self._source(source)
+        filters = self.filters.setdefault(source, [])
+        if any(f["filterName"] == name for f in filters):
+            raise MockRequestError(601, "A filter already exists by that name.")
+        filters.append(
+            {
+                "filterEnabled": True,
+                "filterKind": kind,
+                "filterName": name,
+                "filterSettings": data.get("filterSettings") or {},
+            }
+        )
+        self.emit(
+            "SourceFilterCreated",
+            {
+                "filterIndex": len(filters) - 1,
+                "filterKind": kind,
+                "filterName": name,
+                "filterSettings": filters[-1]["filterSettings"],
+                "sourceName": source,
+            },
+        )
+
+    def remove_source_filter(self, data):
+        source, name = _required(data, "sourceName", "filterName")
+        filters = self.filters.get(source, [])
+        for f in filters:
+            if f["filterName"] == name:
+                filters.remove(f)
+                break
+        else:
+            raise MockRequestError(
+                600, "No filter was found in the source by that name."
+            )
+        self.emit("SourceFilterRemoved", {"filterName": name, "sourceName": source})
+
+    # Scene items
+
+    def get_scene_item_list(self, data):
+        (name,) = _required(data, "sceneName")
+        return {
+            "sceneItems": [
+                {
+                    "sceneItemEnabled": item["sceneItemEnabled"],
+                    "sceneItemId": item["sceneItemId"],
+                    "sceneItemIndex": i,
+                    "sourceName": item["sourceName"],
+                    "sourceUuid": self.inputs[item["sourceName"]]["uuid"],
+                }
+                for i, item in enumerate(self._scene(name)["items"])
+            ]
+        }
+
+    def get_scene_item_id(self, data):
+        scene_name, source_name = _required(data, "sceneName", "sourceName")
+        for item in self._scene(scene_name)["items"]:
+            if item["sourceName"] == source_name:
+                return {"sceneItemId": item["sceneItemId"]}
+        raise MockRequestError(600, "No scene items were found in the specified scene.")
+
+    def get_scene_item_enabled(self, data):
+        return {"sceneItemEnabled": self._scene_item(data)["sceneItemEnabled"]}
+
+    def set_scene_item_enabled(self, data):
+        item = self._scene_item(data)
+        (enabled,) = _required(data, "sceneItemEnabled")
+        item["sceneItemEnabled"] = enabled
+        self.emit(
+            "SceneItemEnableStateChanged",
+            {
+                "sceneItemEnabled": enabled,
+                "sceneItemId": item["sceneItemId"],
+                "sceneName": data["sceneName"],
+                "sceneUuid": self.scenes[data["sceneName"]]["uuid"],
+            },
+        )
+
+    # Outputs
+
+    def _output_status(self, active):
+        return {
+            "outputActive": active,
+            "outputBytes": 0,
+            "outputCongestion": 0.0,
+            "outputDuration": 0,
+            "outputReconnecting": False,
+            "outputSkippedFrames": 0,
+            "outputTimecode": "00:00:00.000",
+            "outputTotalFrames": 0,
+        }
+
+    def get_stream_status(self, data):
+        return self._output_status(self.streaming)
+
+    def start_stream(self, data):
+        if self.streaming:
+            raise MockRequestError(500, "The stream output is already running.")
+        self._set_stream(True)
+
+    def stop_stream(self, data):
+        if not self.streaming:
+            raise MockRequestError(501, "The stream output is not running.")
+        self._set_stream(False)
+
+    def toggle_stream(self, data):
+        return {"outputActive": self._set_stream(not self.streaming)}
+
+    def _set_stream(self, active):
+        self.streaming = active
+        self.emit(
+            "StreamStateChanged",
+            {
+                "outputActive": active,
+                "outputState": f"OBS_WEBSOCKET_OUTPUT_{'STARTED' if active else 'STOPPED'}",
+            },
+        )
+        return active
+
+    def get_record_status(self, data):
+        status = self._output_status(self.recording)
+        del status["outputCongestion"], status["outputReconnecting"]
+        del status["outputSkippedFrames"], status["outputTotalFrames"]
+        return status | {"outputPaused": False}
+
+    def start_record(self, data):
+        if self.recording:
+            raise MockRequestError(500, "The record output is already running.")
+        self._set_record(True)
+
+    def stop_record(self, data):
+        if not self.recording:
+            raise MockRequestError(501, "The record output is not running.")
+        self._set_record(False)
+        return {"outputPath": "/tmp/mock.mkv"}
+
+    def toggle_record(self, data):
+        return {"outputActive": self._set_record(not self.recording)}
+
+    def _set_record(self, active):
+        self.recording = active
+        self.emit(
+            "RecordStateChanged",
+            {
+                "outputActive": active,
+                "outputState": f"OBS_WEBSOCKET_OUTPUT_{'STARTED' if active else 'STOPPED'}",
+            },
+        )
+        return active
+
+    # Sources
+
+    def get_source_screenshot(self, data):
+        """
+        returns a solid colour frame, set `colors[source_name]` to an (r, g, b)
+        tuple to choose it. The image is always PNG encoded.
+        """
+        name, img_format = _required(data, "sourceName", "imageFormat")
+        self._source(name)
+        width, height = data.get("imageWidth"), data.get("imageHeight")
+        base_width, base_height = self.video["baseWidth"], self.video["baseHeight"]
+        if width is None and height is None:
+            width, height = base_width, base_height
+        elif height is None:
+            height = max(round(width * base_height / base_width), 1)
+        elif width is None:
+            width = max(round(height * base_width / base_height), 1)
+        rgb = self.colors.get(name)
+        if rgb is None:
+            digest = hashlib.md5(name.encode()).digest()
+            rgb = (64 + digest[0] // 2, 64 + digest[1] // 2, 64 + digest[2] // 2)
+        key = (width, height, tuple(rgb))
+        if (encoded := self._screenshots.get(key)) is None:
+            encoded = base64.b64encode(_png(width, height, rgb)).decode()
+            self._screenshots = {key: encoded}
+        return {"imageData": f"data:image/{img_format};base64,{encoded}"}
+
+    # Ui
+
+    def get_studio_mode_enabled(self, data):
+        return {"studioModeEnabled": self.studio_mode}
+
+    def set_studio_mode_enabled(self, data):
+        (enabled,) = _required(data, "studioModeEnabled")
+        if enabled != self.studio_mode:
+            self.studio_mode = enabled
+            self.preview_scene = self.program_scene
+            self.emit("StudioModeStateChanged", {"studioModeEnabled": enabled})
+
+
+class _Connection:
+    """one client connection, frames are read and requests handled on its own thread"""
+
+    def __init__(self, server, sock):
+        self.server = server
+        self.sock = sock
+        self.reader = sock.makefile("rb")
+        self.identified = False
+        self.subs = Subs.LOW_VOLUME
+        self._write_lock = threading.Lock()
+        self._delayed = []
+        self._order = itertools.count()
+        self._cond = threading.Condition()
+        self._open = True
+
+    def serve(self):
+        try:
+            if not self._handshake():
+                return
+            threading.Thread(target=self._send_delayed, daemon=True).start()
+            self._hello()
+            while (message := self._recv()) is not None:
+                self._handle(json.loads(message))
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"{type(e).__name__} closing connection: {e}")
+        finally:
+            self.close()
+
+    def _handshake(self):
+        request = b""
+        while b"\r\n\r\n" not in request:
+            chunk = self.sock.recv(4096)
+            if not chunk:
+                return False
+            request += chunk
+        headers = {}
+        for line in request.decode("latin-1").split("\r\n")[1:]:
+            if ":" in line:
+                key, value = line.split(":", 1)
+                headers[key.strip().lower()] = value.strip()
+        accept = base64.b64encode(
+            hashlib.sha1((headers["sec-websocket-key"] + WS_GUID).encode()).digest()
+        ).decode()
+        response = (
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n"
+        )
+        if "obswebsocket.json" in headers.get("sec-websocket-protocol", ""):
+            response += "Sec-WebSocket-Protocol: obswebsocket.json\r\n"
+        self.sock.sendall((response + "\r\n").encode())
+        return True
+
+    def _read_exact(self, n):
+        data = self.reader.read(n)
+        if len(data) < n:
+            raise ConnectionResetError("connection closed mid frame")
+        return data
+
+    def _recv(self) -> Optional[str]:
+        """returns the next text message, None once the client closes"""
+
+        fragments = []
+        while True:
+            b0, b1 = self._read_exact(2)
+            opcode, length = b0 & 0x0F, b1 & 0x7F
+            if length == 126:
+                (length,) = struct.unpack(">H", self._read_exact(2))
+            elif length == 127:
+                (length,) = struct.unpack(">Q", self._read_exact(8))
+            mask = self._read_exact(4) if b1 & 0x80 else None
+            payload = self._read_exact(length)
+            if mask is not None and length:
+                key = int.from_bytes((mask * (length // 4 + 1))[:length], "little")
+                payload = (int.from_bytes(payload, "little") ^ key).to_bytes(
+                    length, "little"
+                )
+            if opcode == 0x8:
+                self._write_frame(0x8, payload[:2])
+                return None
+            if opcode == 0x9:
+                self._write_frame(0xA, payload)
+                continue
+            if opcode == 0xA:
+                continue
+            fragments.append(payload)
+            if b0 & 0x80:
+                return b"".join(fragments).decode()
+
+    def _write_frame(self, opcode, payload):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack(">BB", 0x80 | opcode, length)
+        elif length < 1 << 16:
+            header = struct.pack(">BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack(">BBQ", 0x80 | opcode, 127, length)
+        with self._write_lock:
+            self.sock.sendall(header + payload)
+
+    def send(self, message: dict, delay: float = 0.0):
+        data = json.dumps(message, sort_keys=True).encode()
+        if delay <= 0:
+            self._write_frame(0x1, data)
+            return
+        with self._cond:
+            heapq.heappush(
+                self._delayed, (time.monotonic() + delay, next(self._order), data)
+            )
+            self._cond.notify()
+
+    def _send_delayed(self):
+        """writes latency injected responses once they are due"""
+
+        while True:
+            with self._cond:
+                while self._open and (
+                    not self._delayed or self._delayed[0][0] > time.monotonic()
+                ):
+                    self._cond.wait(
+                        self._delayed[0][0] - time.monotonic()
+                        if self._delayed
+                        else None
+                    )
+                if not self._open:
+                    return
+                _, _, data = heapq.heappop(self._delayed)
+            try:
+                self._write_frame(0x1, data)
+            except OSError:
+                return
+
+    def close(self, code: Optional[int] = None, reason: str = ""):
+        if code is not None:
+            try:
+                self._write_frame(0x8, struct.pack(">H", code) + reason.encode())
+            except OSError:
+                pass
+        with self._cond:
+            self._open = False
+            self._cond.notify()
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.reader.close()
+        self.sock.close()
+        self.server._connections.discard(self)
+
+    def _hello(self):
+        hello = {"obsWebSocketVersion": "5.3.0", "rpcVersion": 1}
+        if self.server.password:
+            self.challenge = base64.b64encode(os.urandom(32)).decode()
+            self.salt = base64.b64encode(os.urandom(32)).decode()
+            hello["authentication"] = {"challenge": self.challenge, "salt": self.salt}
+        self.send({"op": 0, "d": hello})
+
+    def _authenticated(self, auth):
+        secret = base64.b64encode(
+            hashlib.sha256((self.server.password + self.salt).encode()).digest()
+        )
+        expected = base64.b64encode(
+            hashlib.sha256(secret + self.challenge.encode()).digest()
+        ).decode()
+        return auth == expected
+
+    def _handle(self, message):
+        op, d = message["op"], message["d"]
+        if op == 1:
+            if self.identified:
+                self.close(
+                    4008, "You are already Identified with the obs-websocket server."
+                )
+                raise ConnectionAbortedError("already identified")
+            if self.server.password and not self._authenticated(
+                d.get("authentication")
+            ):
+                self.close(4009, "Authentication failed.")
+                raise ConnectionAbortedError("authentication failed")
+            self.identified = True
+            self.subs = Subs(d.get("eventSubscriptions", Subs.LOW_VOLUME))
+            self.send({"op": 2, "d": {"negotiatedRpcVersion": 1}})
+        elif not self.identified:
+            self.close(4007, "The client sent a message before identifying.")
+            raise ConnectionAbortedError("not identified")
+        elif op == 3:
+            self.subs = Subs(d.get("eventSubscriptions", self.subs))
+            self.send({"op": 2, "d": {"negotiatedRpcVersion": 1}})
+        elif op == 6:
+            result, delay = self.server.execute(d)
+            self.send({"op": 7, "d": result}, delay)
+        elif op == 8:
+            results, delay = [], 0.0
+            for request in d.get("requests", []):
+                if request.get("requestType") == "Sleep":
+                    delay += (request.get("requestData") or {}).get(
+                        "sleepMillis", 0
+                    ) / 1000
+                    result = {
+                        "requestType": "Sleep",
+                        "requestStatus": {"result": True, "code": 100},
+                    }
+                else:
+                    result, latency = self.server.execute(request)
+                    delay += latency
+                if "requestId" not in request:
+                    result.pop("requestId", None)
+                results.append(result)
+                if d.get("haltOnFailure") and not result["requestStatus"]["result"]:
+                    break
+            self.send(
+                {"op": 9, "d": {"requestId": d["requestId"], "results": results}}, delay
+            )
+
+
+class MockServer:
+    """
+    A mock obs-websocket server running on background threads:
+
+        with MockServer(port=4455, password="mystrongpass") as server:
+            cl = obs.ReqClient(port=4455, password="mystrongpass")
+
+    The OBS state is a MockState, reachable as `server.state`.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 4455,
+        password: str = "",
+        latency: Union[float, dict, Callable] = 0.0,
+        jitter: float = 0.0,
+        state: Optional[MockState] = None,
+    ):
+        """
+        :param port: port to listen on, 0 picks a free one
+        :type port: int
+        :param password: enables authentication when not empty
+        :type password: str
+        :param latency: seconds to delay each response by, a dict of seconds
+            per request type, or a callable taking the request type
+        :type latency: float | dict | Callable
+        :param jitter: up to this many seconds are added at random to every delay
+        :type jitter: float
+        :param state: the OBS state to serve, defaults to a fresh MockState
+        :type state: MockState, optional
+        """
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.host = host
+        self.port = port
+        self.password = password
+        self.latency = latency
+        self.jitter = jitter
+        self.state = state if state is not None else MockState()
+        self.state.emit = self.emit
+        self.handlers = {}
+        self.requests = 0
+        self._lock = threading.RLock()
+        self._connections = set()
+        self._generators = []
+        self._sock = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.stop()
+
+    def start(self):
+        """starts accepting connections in a daemon thread"""
+
+        self._sock = socket.create_server((self.host, self.port))
+        self.port = self._sock.getsockname()[1]
+        threading.Thread(target=self._accept, daemon=True).start()
+        self.logger.info(f"Listening on ws://{self.host}:{self.port}")
+        return self
+
+    def stop(self):
+        """stops event generators and closes every connection"""
+
+        for stop_event in self._generators:
+            stop_event.set()
+        self._generators.clear()
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+        for conn in list(self._connections):
+            conn.close(1001)
+
+    def _accept(self):
+        while self._sock is not None:
+            try:
+                sock, _ = self._sock.accept()
+            except OSError:
+                break
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            conn = _Connection(self, sock)
+            self._connections.add(conn)
+            threading.Thread(target=conn.serve, daemon=True).start()
+
+    def handler(self, req_type: str):
+        """
+        registers a function handling a request type, overriding the state model
+
+            @server.handler("GetVersion")
+            def get_version(state, data):
+                return {"obsVersion": "31.0.0"}
+        """
+
+        def decorator(fn):
+            self.handlers[req_type] = fn
+            return fn
+
+        return decorator
+
+    def _delay(self, req_type):
+        if callable(self.latency):
+            delay = self.latency(req_type)
+        elif isinstance(self.latency, dict):
+            delay = self.latency.get(req_type, 0.0)
+        else:
+            delay = self.latency
+        if self.jitter:
+            delay += random.uniform(0, self.jitter)
+        return delay
+
+    def execute(self, request: dict):
+        """runs one request against the state, returns the result and its delay"""
+
+        req_type = request.get("requestType")
+        result = {"requestType": req_type, "requestId": request.get("requestId")}
+        with self._lock:
+            self.requests += 1
+            handler = self.handlers.get(req_type)
+            if handler is None and req_type:
+                method = getattr(self.state, to_snake_case(req_type), None)
+                if callable(method) and not req_type.startswith("_"):
+                    handler = lambda state, data: method(data)
+            try:
+                if handler is None:
+                    raise MockRequestError(204, "Your request type is not valid.")
+                response = handler(self.state, request.get("requestData") or {})
+            except MockRequestError as e:
+                status = {"result": False, "code": e.code}
+                if e.comment:
+                    status["comment"] = e.comment
+                result["requestStatus"] = status
+            else:
+                result["requestStatus"] = {"result": True, "code": 100}
+                if response is not None:
+                    result["responseData"] = response
+        return result, self._delay(req_type)
+
+    def emit(self, event_type: str, data: Optional[dict] = None):
+        """sends an event to every client subscribed to its intent"""
+
+        intent = EVENT_INTENTS.get(event_type, Subs.GENERAL)
+        event = {"op": 5, "d": {"eventIntent": int(intent), "eventType": event_type}}
+        if data is not None:
+            event["d"]["eventData"] = data
+        for conn in list(self._connections):
+            if conn.identified and conn.subs & intent:
+                try:
+                    conn.send(event)
+                except OSError:
+                    pass
+
+    def generate(
+        self,
+        event_type: str,
+        rate: float,
+        data: Union[dict, Callable, None] = None,
+    ) -> threading.Event:
+        """
+        emits an event `rate` times per second from a daemon thread until
+        the server stops or the returned threading.Event is set
+
+        data may be a callable returning fresh data for every event,
+        InputVolumeMeters defaults to random levels for every input.
+        """
+        if data is None and event_type == "InputVolumeMeters":
+            data = self._volume_meters
+        stop_event = threading.Event()
+        self._generators.append(stop_event)
+
+        def run():
+            interval = 1.0 / rate
+            due = time.monotonic()
+            while not stop_event.is_set():
+                self.emit(event_type, data() if callable(data) else data)
+                due += interval
+                if (delay := due - time.monotonic()) > 0:
+                    stop_event.wait(delay)
+
+        threading.Thread(target=run, daemon=True).start()
+        return stop_event
+
+    def _volume_meters(self):
+        with self._lock:
+            inputs = list(self.state.inputs.items())
+        return {
+            "inputs": [
+                {
+                    "inputLevelsMul": [
+                        [level, level * 0.8, level * 0.9]
+                        for level in (random.random(), random.random())
+                    ],
+                    "inputName": name,
+                    "inputUuid": input_["uuid"],
+                }
+                for name, input_ in inputs
+            ]
+        }
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a mock obs-websocket server")
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=4455)
+    parser.add_argument("--password", default="")
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="seconds")
+    parser.add_argument(
+        "--meters", type=float, default=0.0, help="InputVolumeMeters events per second"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    server = MockServer(
+        args.host, args.port, args.password, args.latency, args.jitter
+    ).start()
+    if args.meters:
+        server.generate("InputVolumeMeters", args.meters)
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
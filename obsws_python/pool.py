@@ -0,0 +1,243 @@
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Optional
+
+from websocket import WebSocketConnectionClosedException
+
+from .error import OBSSDKError, OBSSDKTimeoutError
+from .reqs import ReqClient
+
+"""
+A pool of identified request clients shared between short lived callers
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class _HostPool:
+    def __init__(self, label):
+        self.label = label
+        self.idle = deque()
+        self.size = 0
+        self.checkouts = 0
+        self.created = 0
+        self.discarded = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class ConnectionPool:
+    """
+    Hands out ReqClients that are already connected and identified,
+    keyed by (host, port, password), so callers skip the connect and
+    authentication handshake.
+
+        pool = ConnectionPool(max_size=4)
+
+        with pool.connection(host="localhost", password="...") as cl:
+            cl.set_current_program_scene("BRB")
+    """
+
+    def __init__(
+        self,
+        max_size: int = 4,
+        idle_timeout: Optional[float] = 300.0,
+        check_after: Optional[float] = 30.0,
+        **kwargs,
+    ):
+        """
+        :param max_size: clients open at once per (host, port, password)
+        :type max_size: int
+        :param idle_timeout: seconds after which an idle client is closed, None to keep them open
+        :type idle_timeout: float, optional
+        :param check_after: seconds idle after which a client is health checked
+            with GetVersion before it is handed out, None to never check
+        :type check_after: float, optional
+        :param kwargs: connection parameters shared by every client, timeout, subs...
+        """
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.check_after = check_after
+        self.kwargs = kwargs
+        self._pools = {}
+        self._keys = {}
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def checkout(
+        self,
+        host: str = "localhost",
+        port: int = 4455,
+        password: str = "",
+        timeout: Optional[float] = None,
+    ) -> ReqClient:
+        """
+        returns an identified client, waits up to `timeout` seconds
+        while max_size clients for the key are checked out
+        """
+        key = (host, port, password)
+        started = time.monotonic()
+        deadline = None if timeout is None else started + timeout
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise OBSSDKError("connection pool is closed")
+                if (pool := self._pools.get(key)) is None:
+                    pool = self._pools[key] = _HostPool(self._label(host, port))
+                self._reap(pool)
+                while not pool.idle and pool.size >= self.max_size:
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise OBSSDKTimeoutError(
+                            "Timeout while waiting for a pooled connection"
+                        )
+                    self._cond.wait(remaining)
+                    if self._closed:
+                        raise OBSSDKError("connection pool is closed")
+                if pool.idle:
+                    client, idle_since = pool.idle.pop()
+                else:
+                    client, idle_since = None, None
+                    pool.size += 1
+
+            if client is None:
+                try:
+                    client = ReqClient(
+                        **self.kwargs
+                        | {"host": host, "port": port, "password": password}
+                    )
+                except Exception:
+                    self._release(key)
+                    raise
+                with self._cond:
+                    pool.created += 1
+            elif not self._healthy(client, idle_since):
+                self._discard(key, client)
+                continue
+            self._keys[id(client)] = key
+            # counted once per client handed out, not per attempt
+            waited = time.monotonic() - started
+            with self._cond:
+                pool.checkouts += 1
+                pool.total_wait += waited
+                pool.max_wait = max(pool.max_wait, waited)
+            return client
+
+    def checkin(self, client: ReqClient, discard: bool = False):
+        """
+        returns a client to the pool, discard it if a request on it
+        failed in a way that leaves the connection unusable
+        """
+        key = self._keys.pop(id(client))
+        if discard or self._closed or client.base_client._closed:
+            self._discard(key, client)
+            return
+        with self._cond:
+            self._pools[key].idle.append((client, time.monotonic()))
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self, **kwargs):
+        """checks out a client for the duration of the block"""
+
+        client = self.checkout(**kwargs)
+        discard = False
+        try:
+            yield client
+        except (WebSocketConnectionClosedException, OSError, OBSSDKTimeoutError):
+            discard = True
+            raise
+        finally:
+            self.checkin(client, discard=discard)
+
+    def _healthy(self, client, idle_since) -> bool:
+        if client.base_client._closed or not client.base_client.ws.connected:
+            return False
+        if self.check_after is None or time.monotonic() - idle_since < self.check_after:
+            return True
+        try:
+            client.send("GetVersion", raw=True, timeout=client.base_client.timeout or 5)
+        except (OBSSDKError, WebSocketConnectionClosedException, OSError) as e:
+            self.logger.debug(f"{type(e).__name__} discarding an idle client")
+            return False
+        return True
+
+    def _reap(self, pool):
+        """closes idle clients past idle_timeout, called with the lock held"""
+
+        if self.idle_timeout is None:
+            return
+        expired = time.monotonic() - self.idle_timeout
+        while pool.idle and pool.idle[0][1] < expired:
+            client, _ = pool.idle.popleft()
+            client.disconnect()
+            pool.size -= 1
+            pool.discarded += 1
+
+    def _label(self, host, port):
+        """
+        the stats key of a new (host, port, password), passwords are never shown,
+        a second password for the same host and port is labelled host:port#2
+        """
+        seen = sum((h, p) == (host, port) for h, p, _ in self._pools)
+        return f"{host}:{port}#{seen + 1}" if seen else f"{host}:{port}"
+
+    def _release(self, key):
+        with self._cond:
+            self._pools[key].size -= 1
+            self._cond.notify()
+
+    def _discard(self, key, client):
+        try:
+            client.disconnect()
+        except Exception:
+            pass
+        with self._cond:
+            self._pools[key].discarded += 1
+        self._release(key)
+
+    def stats(self) -> dict:
+        """
+        clients open, idle and created, and checkout wait times per
+        (host, port, password), keyed by host:port, #n marks further passwords
+        """
+
+        with self._cond:
+            return {
+                pool.label: {
+                    "size": pool.size,
+                    "idle": len(pool.idle),
+                    "created": pool.created,
+                    "discarded": pool.discarded,
+                    "checkouts": pool.checkouts,
+                    "mean_wait": (
+                        pool.total_wait / pool.checkouts if pool.checkouts else 0.0
+                    ),
+                    "max_wait": pool.max_wait,
+                }
+                for pool in self._pools.values()
+            }
+
+    def close(self):
+        """disconnects every idle client, checked out clients are closed on checkin"""
+
+        with self._cond:
+            self._closed = True
+            for pool in self._pools.values():
+                while pool.idle:
+                    client, _ = pool.idle.pop()
+                    client.disconnect()
+                    pool.size -= 1
+            self._cond.notify_all()
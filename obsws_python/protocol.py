@@ -0,0 +1,1278 @@
+# generated by codegen from protocol.subset.json, do not edit
+from typing import Any
+
+from .util import wrap
+
+"""
+Response and event classes of the obs-websocket protocol
+
+as_dataclass builds these in place of a dynamic dataclass whenever
+the data holds no fields unknown to the class.
+"""
+
+
+class ProtocolObject:
+    """
+    Base of the generated classes, attributes are the snake_case
+    names of the data's fields, set in the order they arrived.
+    Nested objects are wrapped in lazy snake_case views.
+    """
+
+    __slots__ = ("_data",)
+    _FIELDS = {}
+
+    def __init__(self, data: dict):
+        fields = self._FIELDS
+        for key, value in data.items():
+            if type(value) is dict or type(value) is list:
+                value = wrap(value)
+            setattr(self, fields[key], value)
+        self._data = data
+
+    def attrs(self) -> list:
+        return [self._FIELDS[key] for key in self._data]
+
+    def _values(self):
+        return [(attr, getattr(self, attr)) for attr in self.attrs()]
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __repr__(self):
+        fields = ", ".join(f"{attr}={value!r}" for attr, value in self._values())
+        return f"{type(self).__name__}({fields})"
+
+
+class GetVersionResponse(ProtocolObject):
+    """
+    Response of GetVersion. Gets data about the current plugin and RPC version.
+
+    :ivar obs_version: Current OBS Studio version
+    :ivar obs_web_socket_version: Current obs-websocket version
+    :ivar rpc_version: Current latest obs-websocket RPC version
+    :ivar available_requests: Array of available RPC requests for the currently
+        negotiated RPC version
+    :ivar supported_image_formats: Image formats available in
+        `GetSourceScreenshot` and `SaveSourceScreenshot` requests.
+    :ivar platform: Name of the platform. Usually `windows`, `macos`, or
+        `ubuntu` (linux flavor). Not guaranteed to be any of those
+    :ivar platform_description: Description of the platform, like `Windows 10
+        (10.0)`
+    """
+
+    __slots__ = (
+        "obs_version",
+        "obs_web_socket_version",
+        "rpc_version",
+        "available_requests",
+        "supported_image_formats",
+        "platform",
+        "platform_description",
+    )
+    _FIELDS = {
+        "obsVersion": "obs_version",
+        "obsWebSocketVersion": "obs_web_socket_version",
+        "rpcVersion": "rpc_version",
+        "availableRequests": "available_requests",
+        "supportedImageFormats": "supported_image_formats",
+        "platform": "platform",
+        "platformDescription": "platform_description",
+    }
+
+    obs_version: str
+    obs_web_socket_version: str
+    rpc_version: float
+    available_requests: list[str]
+    supported_image_formats: list[str]
+    platform: str
+    platform_description: str
+
+
+class GetStatsResponse(ProtocolObject):
+    """
+    Response of GetStats. Gets statistics about OBS, obs-websocket, and the
+    current session.
+
+    :ivar cpu_usage: Current CPU usage in percent
+    :ivar memory_usage: Amount of memory in MB currently being used by OBS
+    :ivar available_disk_space: Available disk space on the device being used
+        for recording storage
+    :ivar active_fps: Current FPS being rendered
+    :ivar average_frame_render_time: Average time in milliseconds that OBS is
+        taking to render a frame
+    :ivar render_skipped_frames: Number of frames skipped by OBS in the render
+        thread
+    :ivar render_total_frames: Total number of frames outputted by the render
+        thread
+    :ivar output_skipped_frames: Number of frames skipped by OBS in the output
+        thread
+    :ivar output_total_frames: Total number of frames outputted by the output
+        thread
+    :ivar web_socket_session_incoming_messages: Total number of messages
+        received by obs-websocket from the client
+    :ivar web_socket_session_outgoing_messages: Total number of messages sent by
+        obs-websocket to the client
+    """
+
+    __slots__ = (
+        "cpu_usage",
+        "memory_usage",
+        "available_disk_space",
+        "active_fps",
+        "average_frame_render_time",
+        "render_skipped_frames",
+        "render_total_frames",
+        "output_skipped_frames",
+        "output_total_frames",
+        "web_socket_session_incoming_messages",
+        "web_socket_session_outgoing_messages",
+    )
+    _FIELDS = {
+        "cpuUsage": "cpu_usage",
+        "memoryUsage": "memory_usage",
+        "availableDiskSpace": "available_disk_space",
+        "activeFps": "active_fps",
+        "averageFrameRenderTime": "average_frame_render_time",
+        "renderSkippedFrames": "render_skipped_frames",
+        "renderTotalFrames": "render_total_frames",
+        "outputSkippedFrames": "output_skipped_frames",
+        "outputTotalFrames": "output_total_frames",
+        "webSocketSessionIncomingMessages": "web_socket_session_incoming_messages",
+        "webSocketSessionOutgoingMessages": "web_socket_session_outgoing_messages",
+    }
+
+    cpu_usage: float
+    memory_usage: float
+    available_disk_space: float
+    active_fps: float
+    average_frame_render_time: float
+    render_skipped_frames: float
+    render_total_frames: float
+    output_skipped_frames: float
+    output_total_frames: float
+    web_socket_session_incoming_messages: float
+    web_socket_session_outgoing_messages: float
+
+
+class GetHotkeyListResponse(ProtocolObject):
+    """
+    Response of GetHotkeyList. Gets an array of all hotkey names in OBS.
+
+    :ivar hotkeys: Array of hotkey names
+    """
+
+    __slots__ = ("hotkeys",)
+    _FIELDS = {"hotkeys": "hotkeys"}
+
+    hotkeys: list[str]
+
+
+class GetPersistentDataResponse(ProtocolObject):
+    """
+    Response of GetPersistentData. Gets the value of a "slot" from the selected
+    persistent data realm.
+
+    :ivar slot_value: Value associated with the slot. `null` if not set
+    """
+
+    __slots__ = ("slot_value",)
+    _FIELDS = {"slotValue": "slot_value"}
+
+    slot_value: Any
+
+
+class GetVideoSettingsResponse(ProtocolObject):
+    """
+    Response of GetVideoSettings. Gets the current video settings.
+
+    :ivar fps_numerator: Numerator of the fractional FPS value
+    :ivar fps_denominator: Denominator of the fractional FPS value
+    :ivar base_width: Width of the base (canvas) resolution in pixels
+    :ivar base_height: Height of the base (canvas) resolution in pixels
+    :ivar output_width: Width of the output resolution in pixels
+    :ivar output_height: Height of the output resolution in pixels
+    """
+
+    __slots__ = (
+        "fps_numerator",
+        "fps_denominator",
+        "base_width",
+        "base_height",
+        "output_width",
+        "output_height",
+    )
+    _FIELDS = {
+        "fpsNumerator": "fps_numerator",
+        "fpsDenominator": "fps_denominator",
+        "baseWidth": "base_width",
+        "baseHeight": "base_height",
+        "outputWidth": "output_width",
+        "outputHeight": "output_height",
+    }
+
+    fps_numerator: float
+    fps_denominator: float
+    base_width: float
+    base_height: float
+    output_width: float
+    output_height: float
+
+
+class GetStreamServiceSettingsResponse(ProtocolObject):
+    """
+    Response of GetStreamServiceSettings. Gets the current stream service
+    settings (stream destination).
+
+    :ivar stream_service_type: Stream service type, like `rtmp_custom` or
+        `rtmp_common`
+    :ivar stream_service_settings: Stream service settings
+    """
+
+    __slots__ = (
+        "stream_service_type",
+        "stream_service_settings",
+    )
+    _FIELDS = {
+        "streamServiceType": "stream_service_type",
+        "streamServiceSettings": "stream_service_settings",
+    }
+
+    stream_service_type: str
+    stream_service_settings: dict
+
+
+class GetSceneListResponse(ProtocolObject):
+    """
+    Response of GetSceneList. Gets an array of all scenes in OBS.
+
+    :ivar current_program_scene_name: Current program scene name. Can be `null`
+        if internal state desync
+    :ivar current_program_scene_uuid: Current program scene UUID. Can be `null`
+        if internal state desync
+    :ivar current_preview_scene_name: Current preview scene name. `null` if not
+        in studio mode
+    :ivar current_preview_scene_uuid: Current preview scene UUID. `null` if not
+        in studio mode
+    :ivar scenes: Array of scenes
+    """
+
+    __slots__ = (
+        "current_program_scene_name",
+        "current_program_scene_uuid",
+        "current_preview_scene_name",
+        "current_preview_scene_uuid",
+        "scenes",
+    )
+    _FIELDS = {
+        "currentProgramSceneName": "current_program_scene_name",
+        "currentProgramSceneUuid": "current_program_scene_uuid",
+        "currentPreviewSceneName": "current_preview_scene_name",
+        "currentPreviewSceneUuid": "current_preview_scene_uuid",
+        "scenes": "scenes",
+    }
+
+    current_program_scene_name: str
+    current_program_scene_uuid: str
+    current_preview_scene_name: str
+    current_preview_scene_uuid: str
+    scenes: list[dict]
+
+
+class GetCurrentProgramSceneResponse(ProtocolObject):
+    """
+    Response of GetCurrentProgramScene. Gets the current program scene.
+
+    :ivar scene_name: Current program scene name
+    :ivar scene_uuid: Current program scene UUID
+    :ivar current_program_scene_name: Current program scene name (Deprecated)
+    :ivar current_program_scene_uuid: Current program scene UUID (Deprecated)
+    """
+
+    __slots__ = (
+        "scene_name",
+        "scene_uuid",
+        "current_program_scene_name",
+        "current_program_scene_uuid",
+    )
+    _FIELDS = {
+        "sceneName": "scene_name",
+        "sceneUuid": "scene_uuid",
+        "currentProgramSceneName": "current_program_scene_name",
+        "currentProgramSceneUuid": "current_program_scene_uuid",
+    }
+
+    scene_name: str
+    scene_uuid: str
+    current_program_scene_name: str
+    current_program_scene_uuid: str
+
+
+class GetCurrentPreviewSceneResponse(ProtocolObject):
+    """
+    Response of GetCurrentPreviewScene. Gets the current preview scene. Only
+    available when studio mode is enabled.
+
+    :ivar scene_name: Current preview scene name
+    :ivar scene_uuid: Current preview scene UUID
+    :ivar current_preview_scene_name: Current preview scene name
+    :ivar current_preview_scene_uuid: Current preview scene UUID
+    """
+
+    __slots__ = (
+        "scene_name",
+        "scene_uuid",
+        "current_preview_scene_name",
+        "current_preview_scene_uuid",
+    )
+    _FIELDS = {
+        "sceneName": "scene_name",
+        "sceneUuid": "scene_uuid",
+        "currentPreviewSceneName": "current_preview_scene_name",
+        "currentPreviewSceneUuid": "current_preview_scene_uuid",
+    }
+
+    scene_name: str
+    scene_uuid: str
+    current_preview_scene_name: str
+    current_preview_scene_uuid: str
+
+
+class CreateSceneResponse(ProtocolObject):
+    """
+    Response of CreateScene. Creates a new scene in OBS.
+
+    :ivar scene_uuid: UUID of the created scene
+    """
+
+    __slots__ = ("scene_uuid",)
+    _FIELDS = {"sceneUuid": "scene_uuid"}
+
+    scene_uuid: str
+
+
+class GetInputListResponse(ProtocolObject):
+    """
+    Response of GetInputList. Gets an array of all inputs in OBS.
+
+    :ivar inputs: Array of inputs
+    """
+
+    __slots__ = ("inputs",)
+    _FIELDS = {"inputs": "inputs"}
+
+    inputs: list[dict]
+
+
+class CreateInputResponse(ProtocolObject):
+    """
+    Response of CreateInput. Creates a new input, adding it as a scene item to
+    the specified scene.
+
+    :ivar input_uuid: UUID of the newly created input
+    :ivar scene_item_id: ID of the newly created scene item
+    """
+
+    __slots__ = (
+        "input_uuid",
+        "scene_item_id",
+    )
+    _FIELDS = {"inputUuid": "input_uuid", "sceneItemId": "scene_item_id"}
+
+    input_uuid: str
+    scene_item_id: float
+
+
+class GetInputSettingsResponse(ProtocolObject):
+    """
+    Response of GetInputSettings. Gets the settings of an input.
+
+    :ivar input_settings: Object of settings for the input
+    :ivar input_kind: The kind of the input
+    """
+
+    __slots__ = (
+        "input_settings",
+        "input_kind",
+    )
+    _FIELDS = {"inputSettings": "input_settings", "inputKind": "input_kind"}
+
+    input_settings: dict
+    input_kind: str
+
+
+class GetInputMuteResponse(ProtocolObject):
+    """
+    Response of GetInputMute. Gets the audio mute state of an input.
+
+    :ivar input_muted: Whether the input is muted
+    """
+
+    __slots__ = ("input_muted",)
+    _FIELDS = {"inputMuted": "input_muted"}
+
+    input_muted: bool
+
+
+class ToggleInputMuteResponse(ProtocolObject):
+    """
+    Response of ToggleInputMute. Toggles the audio mute state of an input.
+
+    :ivar input_muted: Whether the input has been muted or unmuted
+    """
+
+    __slots__ = ("input_muted",)
+    _FIELDS = {"inputMuted": "input_muted"}
+
+    input_muted: bool
+
+
+class GetInputVolumeResponse(ProtocolObject):
+    """
+    Response of GetInputVolume. Gets the current volume setting of an input.
+
+    :ivar input_volume_mul: Volume setting in mul
+    :ivar input_volume_db: Volume setting in dB
+    """
+
+    __slots__ = (
+        "input_volume_mul",
+        "input_volume_db",
+    )
+    _FIELDS = {"inputVolumeMul": "input_volume_mul", "inputVolumeDb": "input_volume_db"}
+
+    input_volume_mul: float
+    input_volume_db: float
+
+
+class GetTransitionKindListResponse(ProtocolObject):
+    """
+    Response of GetTransitionKindList. Gets an array of all available transition
+    kinds.
+
+    :ivar transition_kinds: Array of transition kinds
+    """
+
+    __slots__ = ("transition_kinds",)
+    _FIELDS = {"transitionKinds": "transition_kinds"}
+
+    transition_kinds: list[str]
+
+
+class GetSceneTransitionListResponse(ProtocolObject):
+    """
+    Response of GetSceneTransitionList. Gets an array of all scene transitions
+    in OBS.
+
+    :ivar current_scene_transition_name: Name of the current scene transition.
+        Can be null
+    :ivar current_scene_transition_uuid: UUID of the current scene transition.
+        Can be null
+    :ivar current_scene_transition_kind: Kind of the current scene transition.
+        Can be null
+    :ivar transitions: Array of transitions
+    """
+
+    __slots__ = (
+        "current_scene_transition_name",
+        "current_scene_transition_uuid",
+        "current_scene_transition_kind",
+        "transitions",
+    )
+    _FIELDS = {
+        "currentSceneTransitionName": "current_scene_transition_name",
+        "currentSceneTransitionUuid": "current_scene_transition_uuid",
+        "currentSceneTransitionKind": "current_scene_transition_kind",
+        "transitions": "transitions",
+    }
+
+    current_scene_transition_name: str
+    current_scene_transition_uuid: str
+    current_scene_transition_kind: str
+    transitions: list[dict]
+
+
+class GetSourceFilterListResponse(ProtocolObject):
+    """
+    Response of GetSourceFilterList. Gets an array of all of a source's filters.
+
+    :ivar filters: Array of filters
+    """
+
+    __slots__ = ("filters",)
+    _FIELDS = {"filters": "filters"}
+
+    filters: list[dict]
+
+
+class GetSceneItemListResponse(ProtocolObject):
+    """
+    Response of GetSceneItemList. Gets a list of all scene items in a scene.
+
+    :ivar scene_items: Array of scene items in the scene
+    """
+
+    __slots__ = ("scene_items",)
+    _FIELDS = {"sceneItems": "scene_items"}
+
+    scene_items: list[dict]
+
+
+class GetSceneItemIdResponse(ProtocolObject):
+    """
+    Response of GetSceneItemId. Searches a scene for a source, and returns its
+    id.
+
+    :ivar scene_item_id: Numeric ID of the scene item
+    """
+
+    __slots__ = ("scene_item_id",)
+    _FIELDS = {"sceneItemId": "scene_item_id"}
+
+    scene_item_id: float
+
+
+class GetSceneItemEnabledResponse(ProtocolObject):
+    """
+    Response of GetSceneItemEnabled. Gets the enable state of a scene item.
+
+    :ivar scene_item_enabled: Whether the scene item is enabled. `true` for
+        enabled, `false` for disabled
+    """
+
+    __slots__ = ("scene_item_enabled",)
+    _FIELDS = {"sceneItemEnabled": "scene_item_enabled"}
+
+    scene_item_enabled: bool
+
+
+class GetStreamStatusResponse(ProtocolObject):
+    """
+    Response of GetStreamStatus. Gets the status of the stream output.
+
+    :ivar output_active: Whether the output is active
+    :ivar output_reconnecting: Whether the output is currently reconnecting
+    :ivar output_timecode: Current formatted timecode string for the output
+    :ivar output_duration: Current duration in milliseconds for the output
+    :ivar output_congestion: Congestion of the output
+    :ivar output_bytes: Number of bytes sent by the output
+    :ivar output_skipped_frames: Number of frames skipped by the output's
+        process
+    :ivar output_total_frames: Total number of frames delivered by the output's
+        process
+    """
+
+    __slots__ = (
+        "output_active",
+        "output_reconnecting",
+        "output_timecode",
+        "output_duration",
+        "output_congestion",
+        "output_bytes",
+        "output_skipped_frames",
+        "output_total_frames",
+    )
+    _FIELDS = {
+        "outputActive": "output_active",
+        "outputReconnecting": "output_reconnecting",
+        "outputTimecode": "output_timecode",
+        "outputDuration": "output_duration",
+        "outputCongestion": "output_congestion",
+        "outputBytes": "output_bytes",
+        "outputSkippedFrames": "output_skipped_frames",
+        "outputTotalFrames": "output_total_frames",
+    }
+
+    output_active: bool
+    output_reconnecting: bool
+    output_timecode: str
+    output_duration: float
+    output_congestion: float
+    output_bytes: float
+    output_skipped_frames: float
+    output_total_frames: float
+
+
+class ToggleStreamResponse(ProtocolObject):
+    """
+    Response of ToggleStream. Toggles the status of the stream output.
+
+    :ivar output_active: New state of the stream output
+    """
+
+    __slots__ = ("output_active",)
+    _FIELDS = {"outputActive": "output_active"}
+
+    output_active: bool
+
+
+class GetRecordStatusResponse(ProtocolObject):
+    """
+    Response of GetRecordStatus. Gets the status of the record output.
+
+    :ivar output_active: Whether the output is active
+    :ivar output_paused: Whether the output is paused
+    :ivar output_timecode: Current formatted timecode string for the output
+    :ivar output_duration: Current duration in milliseconds for the output
+    :ivar output_bytes: Number of bytes sent by the output
+    """
+
+    __slots__ = (
+        "output_active",
+        "output_paused",
+        "output_timecode",
+        "output_duration",
+        "output_bytes",
+    )
+    _FIELDS = {
+        "outputActive": "output_active",
+        "outputPaused": "output_paused",
+        "outputTimecode": "output_timecode",
+        "outputDuration": "output_duration",
+        "outputBytes": "output_bytes",
+    }
+
+    output_active: bool
+    output_paused: bool
+    output_timecode: str
+    output_duration: float
+    output_bytes: float
+
+
+class ToggleRecordResponse(ProtocolObject):
+    """
+    Response of ToggleRecord. Toggles the status of the record output.
+
+    :ivar output_active: The new active state of the output
+    """
+
+    __slots__ = ("output_active",)
+    _FIELDS = {"outputActive": "output_active"}
+
+    output_active: bool
+
+
+class StopRecordResponse(ProtocolObject):
+    """
+    Response of StopRecord. Stops the record output.
+
+    :ivar output_path: File name for the saved recording
+    """
+
+    __slots__ = ("output_path",)
+    _FIELDS = {"outputPath": "output_path"}
+
+    output_path: str
+
+
+class GetSourceScreenshotResponse(ProtocolObject):
+    """
+    Response of GetSourceScreenshot. Gets a Base64-encoded screenshot of a
+    source.
+
+    :ivar image_data: Base64-encoded screenshot
+    """
+
+    __slots__ = ("image_data",)
+    _FIELDS = {"imageData": "image_data"}
+
+    image_data: str
+
+
+class GetStudioModeEnabledResponse(ProtocolObject):
+    """
+    Response of GetStudioModeEnabled. Gets whether studio is enabled.
+
+    :ivar studio_mode_enabled: Whether studio mode is enabled
+    """
+
+    __slots__ = ("studio_mode_enabled",)
+    _FIELDS = {"studioModeEnabled": "studio_mode_enabled"}
+
+    studio_mode_enabled: bool
+
+
+class ExitStartedEvent(ProtocolObject):
+    """
+    Data of ExitStarted. OBS has begun the shutdown process.
+    """
+
+    __slots__ = ()
+    _FIELDS = {}
+
+
+class CustomEventEvent(ProtocolObject):
+    """
+    Data of CustomEvent. Custom event emitted by `BroadcastCustomEvent`.
+
+    :ivar event_data: Custom event data
+    """
+
+    __slots__ = ("event_data",)
+    _FIELDS = {"eventData": "event_data"}
+
+    event_data: dict
+
+
+class CurrentSceneCollectionChangedEvent(ProtocolObject):
+    """
+    Data of CurrentSceneCollectionChanged. The current scene collection has
+    changed.
+
+    :ivar scene_collection_name: Name of the new scene collection
+    """
+
+    __slots__ = ("scene_collection_name",)
+    _FIELDS = {"sceneCollectionName": "scene_collection_name"}
+
+    scene_collection_name: str
+
+
+class CurrentProfileChangedEvent(ProtocolObject):
+    """
+    Data of CurrentProfileChanged. The current profile has changed.
+
+    :ivar profile_name: Name of the new profile
+    """
+
+    __slots__ = ("profile_name",)
+    _FIELDS = {"profileName": "profile_name"}
+
+    profile_name: str
+
+
+class SceneCreatedEvent(ProtocolObject):
+    """
+    Data of SceneCreated. A new scene has been created.
+
+    :ivar scene_name: Name of the new scene
+    :ivar scene_uuid: UUID of the new scene
+    :ivar is_group: Whether the new scene is a group
+    """
+
+    __slots__ = (
+        "scene_name",
+        "scene_uuid",
+        "is_group",
+    )
+    _FIELDS = {
+        "sceneName": "scene_name",
+        "sceneUuid": "scene_uuid",
+        "isGroup": "is_group",
+    }
+
+    scene_name: str
+    scene_uuid: str
+    is_group: bool
+
+
+class SceneRemovedEvent(ProtocolObject):
+    """
+    Data of SceneRemoved. A scene has been removed.
+
+    :ivar scene_name: Name of the removed scene
+    :ivar scene_uuid: UUID of the removed scene
+    :ivar is_group: Whether the scene was a group
+    """
+
+    __slots__ = (
+        "scene_name",
+        "scene_uuid",
+        "is_group",
+    )
+    _FIELDS = {
+        "sceneName": "scene_name",
+        "sceneUuid": "scene_uuid",
+        "isGroup": "is_group",
+    }
+
+    scene_name: str
+    scene_uuid: str
+    is_group: bool
+
+
+class CurrentProgramSceneChangedEvent(ProtocolObject):
+    """
+    Data of CurrentProgramSceneChanged. The current program scene has changed.
+
+    :ivar scene_name: Name of the scene that was switched to
+    :ivar scene_uuid: UUID of the scene that was switched to
+    """
+
+    __slots__ = (
+        "scene_name",
+        "scene_uuid",
+    )
+    _FIELDS = {"sceneName": "scene_name", "sceneUuid": "scene_uuid"}
+
+    scene_name: str
+    scene_uuid: str
+
+
+class CurrentPreviewSceneChangedEvent(ProtocolObject):
+    """
+    Data of CurrentPreviewSceneChanged. The current preview scene has changed.
+
+    :ivar scene_name: Name of the scene that was switched to
+    :ivar scene_uuid: UUID of the scene that was switched to
+    """
+
+    __slots__ = (
+        "scene_name",
+        "scene_uuid",
+    )
+    _FIELDS = {"sceneName": "scene_name", "sceneUuid": "scene_uuid"}
+
+    scene_name: str
+    scene_uuid: str
+
+
+class InputCreatedEvent(ProtocolObject):
+    """
+    Data of InputCreated. An input has been created.
+
+    :ivar input_name: Name of the input
+    :ivar input_uuid: UUID of the input
+    :ivar input_kind: The kind of the input
+    :ivar unversioned_input_kind: The unversioned kind of input (aka no `_v2`
+        stuff)
+    :ivar input_settings: The settings configured to the input when it was
+        created
+    :ivar default_input_settings: The default settings for the input
+    """
+
+    __slots__ = (
+        "input_name",
+        "input_uuid",
+        "input_kind",
+        "unversioned_input_kind",
+        "input_settings",
+        "default_input_settings",
+    )
+    _FIELDS = {
+        "inputName": "input_name",
+        "inputUuid": "input_uuid",
+        "inputKind": "input_kind",
+        "unversionedInputKind": "unversioned_input_kind",
+        "inputSettings": "input_settings",
+        "defaultInputSettings": "default_input_settings",
+    }
+
+    input_name: str
+    input_uuid: str
+    input_kind: str
+    unversioned_input_kind: str
+    input_settings: dict
+    default_input_settings: dict
+
+
+class InputRemovedEvent(ProtocolObject):
+    """
+    Data of InputRemoved. An input has been removed.
+
+    :ivar input_name: Name of the input
+    :ivar input_uuid: UUID of the input
+    """
+
+    __slots__ = (
+        "input_name",
+        "input_uuid",
+    )
+    _FIELDS = {"inputName": "input_name", "inputUuid": "input_uuid"}
+
+    input_name: str
+    input_uuid: str
+
+
+class InputSettingsChangedEvent(ProtocolObject):
+    """
+    Data of InputSettingsChanged. An input's settings have changed (been
+    updated).
+
+    :ivar input_name: Name of the input
+    :ivar input_uuid: UUID of the input
+    :ivar input_settings: New settings object of the input
+    """
+
+    __slots__ = (
+        "input_name",
+        "input_uuid",
+        "input_settings",
+    )
+    _FIELDS = {
+        "inputName": "input_name",
+        "inputUuid": "input_uuid",
+        "inputSettings": "input_settings",
+    }
+
+    input_name: str
+    input_uuid: str
+    input_settings: dict
+
+
+class InputMuteStateChangedEvent(ProtocolObject):
+    """
+    Data of InputMuteStateChanged. An input's mute state has changed.
+
+    :ivar input_name: Name of the input
+    :ivar input_uuid: UUID of the input
+    :ivar input_muted: Whether the input is muted
+    """
+
+    __slots__ = (
+        "input_name",
+        "input_uuid",
+        "input_muted",
+    )
+    _FIELDS = {
+        "inputName": "input_name",
+        "inputUuid": "input_uuid",
+        "inputMuted": "input_muted",
+    }
+
+    input_name: str
+    input_uuid: str
+    input_muted: bool
+
+
+class InputVolumeChangedEvent(ProtocolObject):
+    """
+    Data of InputVolumeChanged. An input's volume level has changed.
+
+    :ivar input_name: Name of the input
+    :ivar input_uuid: UUID of the input
+    :ivar input_volume_mul: New volume level multiplier
+    :ivar input_volume_db: New volume level in dB
+    """
+
+    __slots__ = (
+        "input_name",
+        "input_uuid",
+        "input_volume_mul",
+        "input_volume_db",
+    )
+    _FIELDS = {
+        "inputName": "input_name",
+        "inputUuid": "input_uuid",
+        "inputVolumeMul": "input_volume_mul",
+        "inputVolumeDb": "input_volume_db",
+    }
+
+    input_name: str
+    input_uuid: str
+    input_volume_mul: float
+    input_volume_db: float
+
+
+class InputVolumeMetersEvent(ProtocolObject):
+    """
+    Data of InputVolumeMeters. A high-volume event providing volume levels of
+    all active inputs every 50 milliseconds.
+
+    :ivar inputs: Array of active inputs with their associated volume levels
+    """
+
+    __slots__ = ("inputs",)
+    _FIELDS = {"inputs": "inputs"}
+
+    inputs: list[dict]
+
+
+class InputActiveStateChangedEvent(ProtocolObject):
+    """
+    Data of InputActiveStateChanged. An input's active state has changed.
+
+    :ivar input_name: Name of the input
+    :ivar input_uuid: UUID of the input
+    :ivar video_active: Whether the input is active
+    """
+
+    __slots__ = (
+        "input_name",
+        "input_uuid",
+        "video_active",
+    )
+    _FIELDS = {
+        "inputName": "input_name",
+        "inputUuid": "input_uuid",
+        "videoActive": "video_active",
+    }
+
+    input_name: str
+    input_uuid: str
+    video_active: bool
+
+
+class InputShowStateChangedEvent(ProtocolObject):
+    """
+    Data of InputShowStateChanged. An input's show state has changed.
+
+    :ivar input_name: Name of the input
+    :ivar input_uuid: UUID of the input
+    :ivar video_showing: Whether the input is showing
+    """
+
+    __slots__ = (
+        "input_name",
+        "input_uuid",
+        "video_showing",
+    )
+    _FIELDS = {
+        "inputName": "input_name",
+        "inputUuid": "input_uuid",
+        "videoShowing": "video_showing",
+    }
+
+    input_name: str
+    input_uuid: str
+    video_showing: bool
+
+
+class CurrentSceneTransitionChangedEvent(ProtocolObject):
+    """
+    Data of CurrentSceneTransitionChanged. The current scene transition has
+    changed.
+
+    :ivar transition_name: Scene transition name
+    :ivar transition_uuid: Scene transition UUID
+    """
+
+    __slots__ = (
+        "transition_name",
+        "transition_uuid",
+    )
+    _FIELDS = {"transitionName": "transition_name", "transitionUuid": "transition_uuid"}
+
+    transition_name: str
+    transition_uuid: str
+
+
+class SourceFilterCreatedEvent(ProtocolObject):
+    """
+    Data of SourceFilterCreated. A filter has been added to a source.
+
+    :ivar source_name: Name of the source the filter was added to
+    :ivar filter_name: Name of the filter
+    :ivar filter_kind: The kind of the filter
+    :ivar filter_index: Index position of the filter
+    :ivar filter_settings: The settings configured to the filter when it was
+        created
+    :ivar default_filter_settings: The default settings for the filter
+    """
+
+    __slots__ = (
+        "source_name",
+        "filter_name",
+        "filter_kind",
+        "filter_index",
+        "filter_settings",
+        "default_filter_settings",
+    )
+    _FIELDS = {
+        "sourceName": "source_name",
+        "filterName": "filter_name",
+        "filterKind": "filter_kind",
+        "filterIndex": "filter_index",
+        "filterSettings": "filter_settings",
+        "defaultFilterSettings": "default_filter_settings",
+    }
+
+    source_name: str
+    filter_name: str
+    filter_kind: str
+    filter_index: float
+    filter_settings: dict
+    default_filter_settings: dict
+
+
+class SourceFilterRemovedEvent(ProtocolObject):
+    """
+    Data of SourceFilterRemoved. A filter has been removed from a source.
+
+    :ivar source_name: Name of the source the filter was on
+    :ivar filter_name: Name of the filter
+    """
+
+    __slots__ = (
+        "source_name",
+        "filter_name",
+    )
+    _FIELDS = {"sourceName": "source_name", "filterName": "filter_name"}
+
+    source_name: str
+    filter_name: str
+
+
+class StreamStateChangedEvent(ProtocolObject):
+    """
+    Data of StreamStateChanged. The state of the stream output has changed.
+
+    :ivar output_active: Whether the output is active
+    :ivar output_state: The specific state of the output
+    """
+
+    __slots__ = (
+        "output_active",
+        "output_state",
+    )
+    _FIELDS = {"outputActive": "output_active", "outputState": "output_state"}
+
+    output_active: bool
+    output_state: str
+
+
+class RecordStateChangedEvent(ProtocolObject):
+    """
+    Data of RecordStateChanged. The state of the record output has changed.
+
+    :ivar output_active: Whether the output is active
+    :ivar output_state: The specific state of the output
+    :ivar output_path: File name for the saved recording, if record stopped.
+        `null` otherwise
+    """
+
+    __slots__ = (
+        "output_active",
+        "output_state",
+        "output_path",
+    )
+    _FIELDS = {
+        "outputActive": "output_active",
+        "outputState": "output_state",
+        "outputPath": "output_path",
+    }
+
+    output_active: bool
+    output_state: str
+    output_path: str
+
+
+class SceneItemEnableStateChangedEvent(ProtocolObject):
+    """
+    Data of SceneItemEnableStateChanged. A scene item's enable state has
+    changed.
+
+    :ivar scene_name: Name of the scene the item is in
+    :ivar scene_uuid: UUID of the scene the item is in
+    :ivar scene_item_id: Numeric ID of the scene item
+    :ivar scene_item_enabled: Whether the scene item is enabled (visible)
+    """
+
+    __slots__ = (
+        "scene_name",
+        "scene_uuid",
+        "scene_item_id",
+        "scene_item_enabled",
+    )
+    _FIELDS = {
+        "sceneName": "scene_name",
+        "sceneUuid": "scene_uuid",
+        "sceneItemId": "scene_item_id",
+        "sceneItemEnabled": "scene_item_enabled",
+    }
+
+    scene_name: str
+    scene_uuid: str
+    scene_item_id: float
+    scene_item_enabled: bool
+
+
+class SceneItemTransformChangedEvent(ProtocolObject):
+    """
+    Data of SceneItemTransformChanged. The transform/crop of a scene item has
+    changed.
+
+    :ivar scene_name: The name of the scene the item is in
+    :ivar scene_uuid: The UUID of the scene the item is in
+    :ivar scene_item_id: Numeric ID of the scene item
+    :ivar scene_item_transform: New transform/crop info of the scene item
+    """
+
+    __slots__ = (
+        "scene_name",
+        "scene_uuid",
+        "scene_item_id",
+        "scene_item_transform",
+    )
+    _FIELDS = {
+        "sceneName": "scene_name",
+        "sceneUuid": "scene_uuid",
+        "sceneItemId": "scene_item_id",
+        "sceneItemTransform": "scene_item_transform",
+    }
+
+    scene_name: str
+    scene_uuid: str
+    scene_item_id: float
+    scene_item_transform: dict
+
+
+class StudioModeStateChangedEvent(ProtocolObject):
+    """
+    Data of StudioModeStateChanged. Studio mode has been enabled or disabled.
+
+    :ivar studio_mode_enabled: True == Enabled, False == Disabled
+    """
+
+    __slots__ = ("studio_mode_enabled",)
+    _FIELDS = {"studioModeEnabled": "studio_mode_enabled"}
+
+    studio_mode_enabled: bool
+
+
+CLASSES = {
+    "GetVersion": GetVersionResponse,
+    "GetStats": GetStatsResponse,
+    "GetHotkeyList": GetHotkeyListResponse,
+    "GetPersistentData": GetPersistentDataResponse,
+    "GetVideoSettings": GetVideoSettingsResponse,
+    "GetStreamServiceSettings": GetStreamServiceSettingsResponse,
+    "GetSceneList": GetSceneListResponse,
+    "GetCurrentProgramScene": GetCurrentProgramSceneResponse,
+    "GetCurrentPreviewScene": GetCurrentPreviewSceneResponse,
+    "CreateScene": CreateSceneResponse,
+    "GetInputList": GetInputListResponse,
+    "CreateInput": CreateInputResponse,
+    "GetInputSettings": GetInputSettingsResponse,
+    "GetInputMute": GetInputMuteResponse,
+    "ToggleInputMute": ToggleInputMuteResponse,
+    "GetInputVolume": GetInputVolumeResponse,
+    "GetTransitionKindList": GetTransitionKindListResponse,
+    "GetSceneTransitionList": GetSceneTransitionListResponse,
+    "GetSourceFilterList": GetSourceFilterListResponse,
+    "GetSceneItemList": GetSceneItemListResponse,
+    "GetSceneItemId": GetSceneItemIdResponse,
+    "GetSceneItemEnabled": GetSceneItemEnabledResponse,
+    "GetStreamStatus": GetStreamStatusResponse,
+    "ToggleStream": ToggleStreamResponse,
+    "GetRecordStatus": GetRecordStatusResponse,
+    "ToggleRecord": ToggleRecordResponse,
+    "StopRecord": StopRecordResponse,
+    "GetSourceScreenshot": GetSourceScreenshotResponse,
+    "GetStudioModeEnabled": GetStudioModeEnabledResponse,
+    "ExitStarted": ExitStartedEvent,
+    "CustomEvent": CustomEventEvent,
+    "CurrentSceneCollectionChanged": CurrentSceneCollectionChangedEvent,
+    "CurrentProfileChanged": CurrentProfileChangedEvent,
+    "SceneCreated": SceneCreatedEvent,
+    "SceneRemoved": SceneRemovedEvent,
+    "CurrentProgramSceneChanged": CurrentProgramSceneChangedEvent,
+    "CurrentPreviewSceneChanged": CurrentPreviewSceneChangedEvent,
+    "InputCreated": InputCreatedEvent,
+    "InputRemoved": InputRemovedEvent,
+    "InputSettingsChanged": InputSettingsChangedEvent,
+    "InputMuteStateChanged": InputMuteStateChangedEvent,
+    "InputVolumeChanged": InputVolumeChangedEvent,
+    "InputVolumeMeters": InputVolumeMetersEvent,
+    "InputActiveStateChanged": InputActiveStateChangedEvent,
+    "InputShowStateChanged": InputShowStateChangedEvent,
+    "CurrentSceneTransitionChanged": CurrentSceneTransitionChangedEvent,
+    "SourceFilterCreated": SourceFilterCreatedEvent,
+    "SourceFilterRemoved": SourceFilterRemovedEvent,
+    "StreamStateChanged": StreamStateChangedEvent,
+    "RecordStateChanged": RecordStateChangedEvent,
+    "SceneItemEnableStateChanged": SceneItemEnableStateChangedEvent,
+    "SceneItemTransformChanged": SceneItemTransformChangedEvent,
+    "StudioModeStateChanged": StudioModeStateChangedEvent,
+}
@@ -1,9 +1,14 @@
+import copy
 import logging
+import threading
+import time
+from concurrent.futures import Future
 from warnings import warn
 
-from .baseclient import ObsClient
-from .error import OBSSDKError, OBSSDKRequestError
-from .util import as_dataclass
+from .baseclient import DispatchFuture, ObsClient
+from .error import OBSSDKError, OBSSDKRequestError, OBSSDKTimeoutError
+from .iterparse import PartialResponse
+from .util import ResponseView, as_dataclass, decode_image_data, wrap
 
 """
 A class to interact with obs-websocket requests
@@ -13,10 +18,80 @@ https://github.com/obsproject/obs-websocket/blob/master/docs/generated/protocol.
 
 logger = logging.getLogger(__name__)
 
+# how response data is returned, "raw" returns the decoded dict untouched
+RESPONSE_MODES = {"dataclass": as_dataclass, "lazy": ResponseView, "raw": None}
+
+
+class DetachedRequests:
+    """Tracks requests sent without waiting for their response"""
+
+    def __init__(self, on_error=None):
+        """
+        :param on_error: called with the exception of every failed request
+        :type on_error: Callable, optional
+        """
+        self.on_error = on_error
+        self.sent = 0
+        self.succeeded = 0
+        self.failed = 0
+        self._outstanding = set()
+        self._cond = threading.Condition()
+
+    @property
+    def outstanding(self) -> int:
+        """number of requests still waiting for a response"""
+
+        return len(self._outstanding)
+
+    def add(self, future):
+        with self._cond:
+            self.sent += 1
+            self._outstanding.add(future)
+
+    def done(self, future, error=None):
+        """counts a finished request once on_error has been called for it"""
+
+        try:
+            if error is not None and self.on_error is not None:
+                self.on_error(error)
+        finally:
+            with self._cond:
+                self._outstanding.discard(future)
+                if error is None:
+                    self.succeeded += 1
+                else:
+                    self.failed += 1
+                self._cond.notify_all()
+
+    def flush(self, timeout=None) -> bool:
+        """
+        waits until the requests outstanding now are counted and reported
+        to on_error, returns False on timeout
+        """
+        with self._cond:
+            outstanding = set(self._outstanding)
+            return self._cond.wait_for(
+                lambda: outstanding.isdisjoint(self._outstanding), timeout
+            )
+
 
 class ReqClient:
+    OPTIONS = {
+        "wait": True,
+        "priority": None,
+        "timeout": None,
+        "deadline": None,
+        "response": "dataclass",
+    }
+
     def __init__(self, **kwargs):
         self.logger = logger.getChild(self.__class__.__name__)
+        self._options = {
+            option: kwargs.pop(option, default)
+            for option, default in self.OPTIONS.items()
+        }
+        self._convert = self._converter(self._options["response"])
+        self.detached = DetachedRequests(kwargs.pop("on_error", None))
         self.base_client = ObsClient(**kwargs)
         try:
             success = self.base_client.authenticate()
@@ -46,9 +121,52 @@ class ReqClient:
     def disconnect(self):
         self.base_client.ws.close()
 
-    def send(self, param, data=None, raw=False):
+    def with_options(self, **options):
+        """
+        Returns a copy of the client that sends requests with the given options.
+
+        The copy shares the connection of the original client.
+
+        :param wait: wait for responses, if False requests return None immediately
+            and their responses are handled in the background
+        :type wait: bool
+        :param priority: queueing priority once max_in_flight requests are outstanding
+        :type priority: Priority
+        :param timeout: seconds to wait for each response, defaults to the connection timeout
+        :type timeout: float
+        :param deadline: time.monotonic() value by which responses must have arrived
+        :type deadline: float
+        :param response: "dataclass", "lazy" for a view converting keys on access
+            or "raw" for the response data as decoded
+        :type response: str
+        """
+        if unknown := set(options) - set(self.OPTIONS):
+            raise TypeError(f"unknown options: {', '.join(sorted(unknown))}")
+        client = copy.copy(self)
+        client._options = self._options | options
+        client._convert = self._converter(client._options["response"])
+        return client
+
+    @staticmethod
+    def _converter(mode):
+        try:
+            return RESPONSE_MODES[mode]
+        except KeyError:
+            raise ValueError(
+                f"response must be one of {', '.join(RESPONSE_MODES)}, not {mode!r}"
+            ) from None
+
+    def flush(self, timeout=None) -> bool:
+        """
+        Waits for the responses to requests sent with wait=False.
+
+        :return: False if the timeout expired before all responses arrived
+        :rtype: bool
+        """
+        return self.detached.flush(timeout)
+
+    def _response(self, response, raw):
         try:
-            response = self.base_client.req(param, data)
             if not response["requestStatus"]["result"]:
                 raise OBSSDKRequestError(
                     response["requestType"],
@@ -59,9 +177,190 @@ class ReqClient:
             self.logger.exception(f"{type(e).__name__}: {e}")
             raise
         if "responseData" in response:
-            if raw:
+            if raw or self._convert is None:
                 return response["responseData"]
-            return as_dataclass(response["requestType"], response["responseData"])
+            return self._convert(response["requestType"], response["responseData"])
+
+    def _timeout(self, timeout, deadline):
+        """combines a timeout and a deadline into the number of seconds left to wait"""
+
+        if timeout is None:
+            timeout = self._options["timeout"]
+        if timeout is None:
+            timeout = self.base_client.timeout
+        if deadline is None:
+            deadline = self._options["deadline"]
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        if timeout is not None and timeout <= 0:
+            raise OBSSDKTimeoutError("Deadline expired before the request was sent")
+        return timeout
+
+    def send(self, param, data=None, raw=False, timeout=None, deadline=None):
+        """
+        Sends a request and waits for the response.
+
+        :param param: the request type, eg. "GetVersion"
+        :type param: str
+        :param data: the request data
+        :type data: dict, optional
+        :param raw: return the raw response data instead of a response object
+        :type raw: bool
+        :param timeout: seconds to wait for the response, overrides the client's timeout
+        :type timeout: float, optional
+        :param deadline: time.monotonic() value by which the response must have arrived
+        :type deadline: float, optional
+        """
+        if not self._options["wait"]:
+            self._send_detached(param, data)
+            return
+        timeout = self._timeout(timeout, deadline)
+        return self._response(
+            self.base_client.req(param, data, self._options["priority"], timeout), raw
+        )
+
+    def _send_detached(self, param, data):
+        future = self.base_client.req_async(param, data, self._options["priority"])
+        self.detached.add(future)
+
+        def done(response):
+            if response.cancelled():
+                self.detached.done(response, OBSSDKError(f"{param} was cancelled"))
+                return
+            error = response.exception()
+            if error is None and not response.result()["requestStatus"]["result"]:
+                status = response.result()["requestStatus"]
+                error = OBSSDKRequestError(param, status["code"], status.get("comment"))
+            if error is not None:
+                self.logger.error(f"{type(error).__name__}: {error}")
+            self.detached.done(response, error)
+
+        future.add_done_callback(done)
+
+    def send_async(self, param, data=None, raw=False) -> Future:
+        """
+        Sends a request without waiting for the response.
+
+        Any number of requests may be in flight on the same client.
+
+        Cancelling the returned future abandons the request.
+
+        Done callbacks run in order on the client's dispatch thread rather than
+        the thread reading responses, they may send requests and wait for them.
+
+        :return: resolves to the same value send() would return
+        :rtype: concurrent.futures.Future
+        """
+        future = DispatchFuture(self.base_client.dispatcher)
+        request = self.base_client.req_async(param, data, self._options["priority"])
+
+        def done(response):
+            if future.cancelled():
+                return
+            if response.cancelled():
+                future.cancel()
+            elif (e := response.exception()) is not None:
+                future.set_exception(e)
+            else:
+                try:
+                    future.set_result(self._response(response.result(), raw))
+                except OBSSDKRequestError as e:
+                    future.set_exception(e)
+
+        def cancelled(f):
+            if f.cancelled():
+                self.base_client.cancel(request)
+
+        future.add_done_callback(cancelled, inline=True)
+        request.add_done_callback(done, inline=True)
+        return future
+
+    def send_iter(self, param, key, data=None, timeout=None, deadline=None):
+        """
+        Sends a request and iterates over a list in its response data,
+        decoding one element at a time.
+
+        For very large responses: the list is never held decoded in full,
+        and elements can be processed before the last one is decoded.
+
+        :param param: the request type, eg. "GetInputList"
+        :type param: str
+        :param key: the list to iterate over, eg. "inputs"
+        :type key: str
+        :param data: the request data
+        :type data: dict, optional
+        :param timeout: seconds to wait for the response, overrides the client's timeout
+        :type timeout: float, optional
+        :param deadline: time.monotonic() value by which the response must have arrived
+        :type deadline: float, optional
+        :return: the elements, dicts with snake_case attribute access
+            unless the response mode is raw
+        :rtype: Iterator
+        """
+        timeout = self._timeout(timeout, deadline)
+        response = self.base_client.wait(
+            self.base_client.req_async(
+                param, data, self._options["priority"], stream=True
+            ),
+            timeout,
+        )
+        self._response(response, raw=True)
+        if isinstance(response, PartialResponse):
+            elements = response.iter(key)
+        else:
+            elements = iter(response.get("responseData", {}).get(key, ()))
+        if self._convert is None:
+            return elements
+        return map(wrap, elements)
+
+    def send_batch(
+        self, requests, raw=False, halt_on_failure=False, timeout=None, deadline=None
+    ):
+        """
+        Sends several requests in a single round trip.
+
+        :param requests: (request type, request data) pairs, request data may be None
+        :type requests: list[tuple]
+        :param raw: return the raw response data instead of response objects
+        :type raw: bool
+        :param halt_on_failure: stop processing the batch at the first failed request
+        :type halt_on_failure: bool
+        :param timeout: seconds to wait for the response, overrides the client's timeout
+        :type timeout: float, optional
+        :param deadline: time.monotonic() value by which the response must have arrived
+        :type deadline: float, optional
+        :return: one response per request, None for requests without response data
+        :rtype: list
+        """
+        try:
+            results = self.base_client.req_batch(
+                requests,
+                halt_on_failure,
+                priority=self._options["priority"],
+                timeout=self._timeout(timeout, deadline),
+            )
+            for result in results:
+                if not result["requestStatus"]["result"]:
+                    raise OBSSDKRequestError(
+                        result["requestType"],
+                        result["requestStatus"]["code"],
+                        result["requestStatus"].get("comment"),
+                    )
+        except OBSSDKRequestError as e:
+            self.logger.exception(f"{type(e).__name__}: {e}")
+            raise
+        responses = []
+        for result in results:
+            if "responseData" not in result:
+                responses.append(None)
+            elif raw or self._convert is None:
+                responses.append(result["responseData"])
+            else:
+                responses.append(
+                    self._convert(result["requestType"], result["responseData"])
+                )
+        return responses
 
     def get_version(self):
         """
@@ -492,6 +791,42 @@ class ReqClient:
         }
         return self.send("GetSourceScreenshot", payload)
 
+    def get_source_screenshot_data(
+        self, name, img_format, width=None, height=None, quality=None, out=None
+    ):
+        """
+        Gets a screenshot of a source as decoded image bytes.
+
+        Same as get_source_screenshot but skips the response object
+        and returns the image with the data URI prefix stripped and decoded.
+
+        :param name:    Name of the source to take a screenshot of
+        :type name:     str
+        :param img_format: Image compression format to use. Use GetVersion to get compatible image formats
+        :type img_format:  str
+        :param width:   Width to scale the screenshot to (>= 8, <= 4096)
+        :type width:    int, optional
+        :param height:  Height to scale the screenshot to (>= 8, <= 4096)
+        :type height:   int, optional
+        :param quality: Compression quality to use. 0 for high compression, 100 for uncompressed. -1 to use "default"
+        :type quality:  int, optional
+        :param out:     Writable buffer to decode the image into
+        :type out:      bytearray, optional
+        :return: (format, data) the image format, eg. "png", and the encoded image file
+        :rtype: tuple[str, bytes | memoryview]
+
+
+        """
+        payload = {"sourceName": name, "imageFormat": img_format}
+        if width is not None:
+            payload["imageWidth"] = width
+        if height is not None:
+            payload["imageHeight"] = height
+        if quality is not None:
+            payload["imageCompressionQuality"] = quality
+        resp = self.send("GetSourceScreenshot", payload, raw=True)
+        return decode_image_data(resp["imageData"], out)
+
     def save_source_screenshot(
         self, name, img_format, file_path, width, height, quality
     ):
@@ -669,6 +1004,20 @@ class ReqClient:
         payload = {"inputKind": kind}
         return self.send("GetInputList", payload)
 
+    def iter_input_list(self, kind=None):
+        """
+        Iterates over the inputs in OBS, decoding one at a time.
+
+        See send_iter, for scene collections with thousands of inputs.
+
+        :param kind: Restrict the list to only inputs of the specified kind
+        :type kind: str
+
+
+        """
+        payload = {"inputKind": kind}
+        return self.send_iter("GetInputList", "inputs", payload)
+
     def get_input_kind_list(self, unversioned):
         """
         Gets a list of all available input kinds in OBS.
@@ -1285,6 +1634,20 @@ class ReqClient:
         payload = {"sceneName": name}
         return self.send("GetSceneItemList", payload)
 
+    def iter_scene_item_list(self, name):
+        """
+        Iterates over the scene items in a scene, decoding one at a time.
+
+        See send_iter, for scenes with thousands of items.
+
+        :param name: Name of the scene to get the items of
+        :type name: str
+
+
+        """
+        payload = {"sceneName": name}
+        return self.send_iter("GetSceneItemList", "sceneItems", payload)
+
     def get_group_scene_item_list(self, name):
         """
         Basically GetSceneItemList, but for groups.
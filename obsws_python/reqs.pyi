@@ -0,0 +1,254 @@
+# generated by codegen from protocol.subset.json and reqs.py, do not edit
+import copy
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Optional
+from warnings import warn
+
+from . import protocol
+from .baseclient import DispatchFuture, ObsClient
+from .error import OBSSDKError, OBSSDKRequestError, OBSSDKTimeoutError
+from .iterparse import PartialResponse
+from .util import ResponseView, as_dataclass, decode_image_data, wrap
+
+logger: Any
+RESPONSE_MODES: Any
+
+class DetachedRequests:
+    def __init__(self, on_error=None): ...
+    @property
+    def outstanding(self) -> int: ...
+    def add(self, future): ...
+    def done(self, future, error=None): ...
+    def flush(self, timeout=None) -> bool: ...
+
+class ReqClient:
+    OPTIONS: Any
+
+    def __init__(self, **kwargs): ...
+    def __enter__(self): ...
+    def __exit__(self, exc_type, exc_value, exc_traceback): ...
+    def __repr__(self): ...
+    def __str__(self): ...
+    def disconnect(self): ...
+    def with_options(self, **options): ...
+    @staticmethod
+    def _converter(mode): ...
+    def flush(self, timeout=None) -> bool: ...
+    def _response(self, response, raw): ...
+    def _timeout(self, timeout, deadline): ...
+    def send(self, param, data=None, raw=False, timeout=None, deadline=None): ...
+    def _send_detached(self, param, data): ...
+    def send_async(self, param, data=None, raw=False) -> Future: ...
+    def send_iter(self, param, key, data=None, timeout=None, deadline=None): ...
+    def send_batch(
+        self, requests, raw=False, halt_on_failure=False, timeout=None, deadline=None
+    ): ...
+    def get_version(self) -> protocol.GetVersionResponse: ...
+    def get_stats(self) -> protocol.GetStatsResponse: ...
+    def broadcast_custom_event(self, eventData) -> None: ...
+    def call_vendor_request(self, vendor_name, request_type, request_data=None): ...
+    def get_hot_key_list(self) -> protocol.GetHotkeyListResponse: ...
+    get_hotkey_list = get_hot_key_list
+
+    def trigger_hot_key_by_name(
+        self, hotkeyName: str, contextName: Optional[str] = None
+    ) -> None: ...
+    trigger_hotkey_by_name = trigger_hot_key_by_name
+
+    def trigger_hot_key_by_key_sequence(
+        self, keyId, pressShift=None, pressCtrl=None, pressAlt=None, pressCmd=None
+    ): ...
+    trigger_hotkey_by_key_sequence = trigger_hot_key_by_key_sequence
+
+    def sleep(self, sleepMillis=None, sleepFrames=None): ...
+    def get_persistent_data(
+        self, realm: str, slotName: str
+    ) -> protocol.GetPersistentDataResponse: ...
+    def set_persistent_data(
+        self, realm: str, slotName: str, slotValue: Any
+    ) -> None: ...
+    def get_scene_collection_list(self): ...
+    def set_current_scene_collection(self, name): ...
+    def create_scene_collection(self, name): ...
+    def get_profile_list(self): ...
+    def set_current_profile(self, name): ...
+    def create_profile(self, name): ...
+    def remove_profile(self, name): ...
+    def get_profile_parameter(self, category, name): ...
+    def set_profile_parameter(self, category, name, value): ...
+    def get_video_settings(self) -> protocol.GetVideoSettingsResponse: ...
+    def set_video_settings(
+        self, numerator, denominator, base_width, base_height, out_width, out_height
+    ): ...
+    def get_stream_service_settings(
+        self,
+    ) -> protocol.GetStreamServiceSettingsResponse: ...
+    def set_stream_service_settings(self, ss_type: str, ss_settings: dict) -> None: ...
+    def get_record_directory(self): ...
+    def set_record_directory(self, recordDirectory): ...
+    def get_source_active(self, name): ...
+    def get_source_screenshot(
+        self, name: str, img_format: str, width: float, height: float, quality: float
+    ) -> protocol.GetSourceScreenshotResponse: ...
+    def get_source_screenshot_data(
+        self,
+        name: str,
+        img_format: str,
+        width: Optional[float] = None,
+        height: Optional[float] = None,
+        quality: Optional[float] = None,
+        out=None,
+    ) -> Any: ...
+    def save_source_screenshot(
+        self, name, img_format, file_path, width, height, quality
+    ): ...
+    def get_scene_list(self) -> protocol.GetSceneListResponse: ...
+    def get_group_list(self): ...
+    def get_current_program_scene(self) -> protocol.GetCurrentProgramSceneResponse: ...
+    def set_current_program_scene(self, name: str) -> None: ...
+    def get_current_preview_scene(self) -> protocol.GetCurrentPreviewSceneResponse: ...
+    def set_current_preview_scene(self, name: str) -> None: ...
+    def create_scene(self, name: str) -> None: ...
+    def remove_scene(self, name: str) -> None: ...
+    def set_scene_name(self, old_name, new_name): ...
+    def get_scene_scene_transition_override(self, name): ...
+    def set_scene_scene_transition_override(self, scene_name, tr_name, tr_duration): ...
+    def get_input_list(
+        self, kind: Optional[str] = None
+    ) -> protocol.GetInputListResponse: ...
+    def iter_input_list(self, kind=None): ...
+    def get_input_kind_list(self, unversioned): ...
+    def get_special_inputs(self): ...
+    def create_input(
+        self,
+        sceneName: str,
+        inputName: str,
+        inputKind: str,
+        inputSettings: dict,
+        sceneItemEnabled: bool,
+    ) -> protocol.CreateInputResponse: ...
+    def remove_input(self, name: str) -> None: ...
+    def set_input_name(self, old_name, new_name): ...
+    def get_input_default_settings(self, kind): ...
+    def get_input_settings(self, name: str) -> protocol.GetInputSettingsResponse: ...
+    def set_input_settings(self, name: str, settings: dict, overlay: bool) -> None: ...
+    def get_input_mute(self, name: str) -> protocol.GetInputMuteResponse: ...
+    def set_input_mute(self, name: str, muted: bool) -> None: ...
+    def toggle_input_mute(self, name: str) -> protocol.ToggleInputMuteResponse: ...
+    def get_input_volume(self, name: str) -> protocol.GetInputVolumeResponse: ...
+    def set_input_volume(
+        self, name: str, vol_mul: Optional[float] = None, vol_db: Optional[float] = None
+    ) -> None: ...
+    def get_input_audio_balance(self, name): ...
+    def set_input_audio_balance(self, name, balance): ...
+    def get_input_audio_sync_offset(self, name): ...
+    def set_input_audio_sync_offset(self, name, offset): ...
+    def get_input_audio_monitor_type(self, name): ...
+    def set_input_audio_monitor_type(self, name, mon_type): ...
+    def get_input_audio_tracks(self, name): ...
+    def set_input_audio_tracks(self, name, track): ...
+    def get_input_properties_list_property_items(self, input_name, prop_name): ...
+    def press_input_properties_button(self, input_name, prop_name): ...
+    def get_transition_kind_list(self) -> protocol.GetTransitionKindListResponse: ...
+    def get_scene_transition_list(self) -> protocol.GetSceneTransitionListResponse: ...
+    def get_current_scene_transition(self): ...
+    def set_current_scene_transition(self, name: str) -> None: ...
+    def set_current_scene_transition_duration(self, duration): ...
+    def set_current_scene_transition_settings(self, settings, overlay=None): ...
+    def get_current_scene_transition_cursor(self): ...
+    def trigger_studio_mode_transition(self): ...
+    def set_t_bar_position(self, pos, release=None): ...
+    def get_source_filter_kind_list(self): ...
+    def get_source_filter_list(
+        self, name: str
+    ) -> protocol.GetSourceFilterListResponse: ...
+    def get_source_filter_default_settings(self, kind): ...
+    def create_source_filter(
+        self,
+        source_name: str,
+        filter_name: str,
+        filter_kind: str,
+        filter_settings: Optional[dict] = None,
+    ) -> None: ...
+    def remove_source_filter(self, source_name: str, filter_name: str) -> None: ...
+    def set_source_filter_name(self, source_name, old_filter_name, new_filter_name): ...
+    def get_source_filter(self, source_name, filter_name): ...
+    def set_source_filter_index(self, source_name, filter_name, filter_index): ...
+    def set_source_filter_settings(
+        self, source_name, filter_name, settings, overlay=None
+    ): ...
+    def set_source_filter_enabled(self, source_name, filter_name, enabled): ...
+    def get_scene_item_list(self, name: str) -> protocol.GetSceneItemListResponse: ...
+    def iter_scene_item_list(self, name): ...
+    def get_group_scene_item_list(self, name): ...
+    def get_scene_item_id(
+        self, scene_name: str, source_name: str, offset: Optional[float] = None
+    ) -> protocol.GetSceneItemIdResponse: ...
+    def get_scene_item_source(self, scene_name, scene_item_id): ...
+    def create_scene_item(self, scene_name, source_name, enabled=None): ...
+    def remove_scene_item(self, scene_name, item_id): ...
+    def duplicate_scene_item(self, scene_name, item_id, dest_scene_name=None): ...
+    def get_scene_item_transform(self, scene_name, item_id): ...
+    def set_scene_item_transform(self, scene_name, item_id, transform): ...
+    def get_scene_item_enabled(
+        self, scene_name: str, item_id: float
+    ) -> protocol.GetSceneItemEnabledResponse: ...
+    def set_scene_item_enabled(
+        self, scene_name: str, item_id: float, enabled: bool
+    ) -> None: ...
+    def get_scene_item_locked(self, scene_name, item_id): ...
+    def set_scene_item_locked(self, scene_name, item_id, locked): ...
+    def get_scene_item_index(self, scene_name, item_id): ...
+    def set_scene_item_index(self, scene_name, item_id, item_index): ...
+    def get_scene_item_blend_mode(self, scene_name, item_id): ...
+    def set_scene_item_blend_mode(self, scene_name, item_id, blend): ...
+    def get_virtual_cam_status(self): ...
+    def toggle_virtual_cam(self): ...
+    def start_virtual_cam(self): ...
+    def stop_virtual_cam(self): ...
+    def get_replay_buffer_status(self): ...
+    def toggle_replay_buffer(self): ...
+    def start_replay_buffer(self): ...
+    def stop_replay_buffer(self): ...
+    def save_replay_buffer(self): ...
+    def get_last_replay_buffer_replay(self): ...
+    def get_output_list(self): ...
+    def get_output_status(self, name): ...
+    def toggle_output(self, name): ...
+    def start_output(self, name): ...
+    def stop_output(self, name): ...
+    def get_output_settings(self, name): ...
+    def set_output_settings(self, name, settings): ...
+    def get_stream_status(self) -> protocol.GetStreamStatusResponse: ...
+    def toggle_stream(self) -> protocol.ToggleStreamResponse: ...
+    def start_stream(self) -> None: ...
+    def stop_stream(self) -> None: ...
+    def send_stream_caption(self, caption): ...
+    def get_record_status(self) -> protocol.GetRecordStatusResponse: ...
+    def toggle_record(self) -> protocol.ToggleRecordResponse: ...
+    def start_record(self) -> None: ...
+    def stop_record(self) -> protocol.StopRecordResponse: ...
+    def toggle_record_pause(self): ...
+    def pause_record(self): ...
+    def resume_record(self): ...
+    def split_record_file(self): ...
+    def create_record_chapter(self, chapter_name=None): ...
+    def get_media_input_status(self, name): ...
+    def set_media_input_cursor(self, name, cursor): ...
+    def offset_media_input_cursor(self, name, offset): ...
+    def trigger_media_input_action(self, name, action): ...
+    def get_studio_mode_enabled(self) -> protocol.GetStudioModeEnabledResponse: ...
+    def set_studio_mode_enabled(self, enabled: bool) -> None: ...
+    def open_input_properties_dialog(self, name): ...
+    def open_input_filters_dialog(self, name): ...
+    def open_input_interact_dialog(self, name): ...
+    def get_monitor_list(self): ...
+    def open_video_mix_projector(
+        self, video_mix_type, monitor_index=-1, projector_geometry=None
+    ): ...
+    def open_source_projector(
+        self, source_name, monitor_index=-1, projector_geometry=None
+    ): ...
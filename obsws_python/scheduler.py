@@ -0,0 +1,236 @@
+import heapq
+import itertools
+import threading
+import time
+from enum import IntEnum
+from typing import Optional
+
+"""
+Client side queueing of requests on a shared connection
+"""
+
+
+class Priority(IntEnum):
+    CRITICAL = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+class TokenBucket:
+    """allows `rate` events per second on average with bursts of up to `burst`"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def delay(self, now) -> float:
+        """seconds until a token is available, 0 if one is available now"""
+
+        self._refill(now)
+        return 0.0 if self.tokens >= 1.0 else (1.0 - self.tokens) / self.rate
+
+    def take(self):
+        self.tokens -= 1.0
+
+
+class _Limit:
+    def __init__(self, rate=None, burst=None, max_in_flight=None):
+        self.bucket = TokenBucket(rate, burst) if rate else None
+        self.max_in_flight = max_in_flight
+        self.in_flight = 0
+
+    def delay(self, now):
+        """seconds until a request may be sent, None while the in-flight cap is reached"""
+
+        if self.max_in_flight is not None and self.in_flight >= self.max_in_flight:
+            return None
+        return self.bucket.delay(now) if self.bucket else 0.0
+
+
+class _ClassStats:
+    def __init__(self):
+        self.depth = 0
+        self.max_depth = 0
+        self.sent = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+
+class RequestScheduler:
+    """
+    Queues requests that would exceed the in-flight caps or rate limits,
+    globally or per request type, and releases them highest priority first,
+    in order within a priority.
+    """
+
+    def __init__(
+        self,
+        send,
+        max_in_flight: Optional[int] = None,
+        rate_limit: Optional[float] = None,
+        burst: Optional[float] = None,
+        limits: Optional[dict] = None,
+    ):
+        """
+        :param send: writes a payload to the connection
+        :type send: Callable
+        :param max_in_flight: requests allowed to await a response at once, None for no limit
+        :type max_in_flight: int, optional
+        :param rate_limit: requests sent per second, None for no limit
+        :type rate_limit: float, optional
+        :param burst: requests that may be sent at once before rate_limit applies
+        :type burst: float, optional
+        :param limits: per request type dicts with any of rate_limit, burst and max_in_flight
+        :type limits: dict, optional
+        """
+        self._send = send
+        self.max_in_flight = max_in_flight
+        self._global = _Limit(rate_limit, burst, max_in_flight)
+        self._limits = {
+            req_type: _Limit(
+                limit.get("rate_limit"), limit.get("burst"), limit.get("max_in_flight")
+            )
+            for req_type, limit in (limits or {}).items()
+        }
+        self._queue = []
+        self._order = itertools.count()
+        self._in_flight = {}
+        self._stats = {priority: _ClassStats() for priority in Priority}
+        self._lock = threading.Lock()
+        self._timer = None
+        self._timer_due = 0.0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def submit(self, request_id, payload, future, priority=Priority.NORMAL):
+        """sends the payload as soon as the limits allow, highest priority first"""
+
+        priority = Priority(priority)
+        with self._lock:
+            heapq.heappush(
+                self._queue,
+                (
+                    priority,
+                    next(self._order),
+                    time.monotonic(),
+                    request_id,
+                    payload,
+                    future,
+                ),
+            )
+            stats = self._stats[priority]
+            stats.depth += 1
+            stats.max_depth = max(stats.max_depth, stats.depth)
+        self._drain()
+
+    def complete(self, request_id):
+        """releases the slot held by a request and sends the next queued ones"""
+
+        with self._lock:
+            if (limit := self._in_flight.pop(request_id, None)) is None:
+                return
+            self._global.in_flight -= 1
+            if limit is not self._global:
+                limit.in_flight -= 1
+        self._drain()
+
+    def _limit(self, payload):
+        return self._limits.get(payload["d"].get("requestType"), self._global)
+
+    def _next(self):
+        """pops the first queued request the limits allow to be sent now"""
+
+        now = time.monotonic()
+        global_delay = self._global.delay(now)
+        if global_delay is None:
+            return None, None
+        if global_delay > 0:
+            return None, global_delay
+        skipped = []
+        wake = None
+        found = None
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            priority, future = entry[0], entry[5]
+            if future.cancelled():
+                self._stats[priority].depth -= 1
+                continue
+            limit = self._limit(entry[4])
+            delay = limit.delay(now) if limit is not self._global else 0.0
+            if delay == 0.0:
+                found = entry
+                break
+            skipped.append(entry)
+            if delay is not None:
+                wake = delay if wake is None else min(wake, delay)
+        for entry in skipped:
+            heapq.heappush(self._queue, entry)
+        return found, wake
+
+    def _drain(self):
+        while True:
+            with self._lock:
+                entry, wake = self._next()
+                if entry is None:
+                    if wake is not None:
+                        self._schedule(wake)
+                    return
+                priority, _, queued, request_id, payload, future = entry
+                limit = self._limit(payload)
+                for lim in {self._global, limit}:
+                    lim.in_flight += 1
+                    if lim.bucket:
+                        lim.bucket.take()
+                self._in_flight[request_id] = limit
+                stats = self._stats[priority]
+                stats.depth -= 1
+                stats.sent += 1
+                waited = time.monotonic() - queued
+                stats.total_wait += waited
+                stats.max_wait = max(stats.max_wait, waited)
+            self._dispatch(request_id, payload, future)
+
+    def _schedule(self, delay):
+        """wakes the queue up once a rate limited request may be sent"""
+
+        due = time.monotonic() + delay
+        if self._timer is not None and self._timer.is_alive():
+            if self._timer_due <= due:
+                return
+            self._timer.cancel()
+        self._timer_due = due
+        self._timer = threading.Timer(delay, self._drain)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _dispatch(self, request_id, payload, future):
+        try:
+            self._send(payload)
+        except Exception as e:
+            # the response thread fails pending requests when the connection closes
+            if not future.done() and future.set_running_or_notify_cancel():
+                future.set_exception(e)
+            self.complete(request_id)
+
+    def stats(self) -> dict:
+        """queue depth, requests sent and wait times in seconds per priority"""
+
+        with self._lock:
+            return {
+                priority.name: {
+                    "depth": stats.depth,
+                    "max_depth": stats.max_depth,
+                    "sent": stats.sent,
+                    "mean_wait": stats.total_wait / stats.sent if stats.sent else 0.0,
+                    "max_wait": stats.max_wait,
+                }
+                for priority, stats in self._stats.items()
+            }
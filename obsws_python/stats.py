@@ -0,0 +1,216 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+from websocket import WebSocketConnectionClosedException
+
+from .error import OBSSDKError
+
+"""
+Background sampling of GetStats, GetStreamStatus and GetRecordStatus
+
+Requires numpy, install with `pip install obsws-python[analysis]`
+"""
+
+logger = logging.getLogger(__name__)
+
+FIELDS = (
+    "timestamp",
+    "cpu_usage",
+    "memory_usage",
+    "active_fps",
+    "average_frame_render_time",
+    "render_skipped_frames",
+    "render_total_frames",
+    "output_skipped_frames",
+    "output_total_frames",
+    "stream_active",
+    "stream_bytes",
+    "stream_skipped_frames",
+    "stream_total_frames",
+    "record_active",
+    "record_bytes",
+)
+
+_REQUESTS = (("GetStats", None), ("GetStreamStatus", None), ("GetRecordStatus", None))
+
+_KEYS = (
+    (
+        0,
+        (
+            ("cpu_usage", "cpuUsage"),
+            ("memory_usage", "memoryUsage"),
+            ("active_fps", "activeFps"),
+            ("average_frame_render_time", "averageFrameRenderTime"),
+            ("render_skipped_frames", "renderSkippedFrames"),
+            ("render_total_frames", "renderTotalFrames"),
+            ("output_skipped_frames", "outputSkippedFrames"),
+            ("output_total_frames", "outputTotalFrames"),
+        ),
+    ),
+    (
+        1,
+        (
+            ("stream_active", "outputActive"),
+            ("stream_bytes", "outputBytes"),
+            ("stream_skipped_frames", "outputSkippedFrames"),
+            ("stream_total_frames", "outputTotalFrames"),
+        ),
+    ),
+    (
+        2,
+        (
+            ("record_active", "outputActive"),
+            ("record_bytes", "outputBytes"),
+        ),
+    ),
+)
+
+COLUMN = {name: i for i, name in enumerate(FIELDS)}
+
+
+class StatsSampler:
+    """
+    Polls OBS health stats in a background thread.
+
+    All three requests are sent as one RequestBatch per sample and the
+    results are stored in a preallocated (capacity, len(FIELDS)) array.
+    """
+
+    def __init__(self, client, interval: float = 1.0, capacity: int = 3600):
+        """
+        :param client: the request client to poll with
+        :type client: ReqClient
+        :param interval: seconds between samples
+        :type interval: float
+        :param capacity: number of samples kept
+        :type capacity: int
+        """
+        self.logger = logger.getChild(self.__class__.__name__)
+        self.client = client
+        self.interval = interval
+        self.capacity = capacity
+        self._data = np.full((capacity, len(FIELDS)), np.nan)
+        self._count = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self.worker = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.stop()
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def start(self):
+        """start sampling in a daemon thread"""
+
+        self._stop_event.clear()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def stop(self):
+        """stop sampling"""
+
+        self._stop_event.set()
+        if self.worker is not None:
+            self.worker.join()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self.sample()
+            except OBSSDKError as e:
+                if self.client.base_client._closed:
+                    self.logger.debug(
+                        f"connection closed, terminating the sampler thread"
+                    )
+                    break
+                self.logger.error(f"{type(e).__name__}: {e}")
+            except (WebSocketConnectionClosedException, OSError) as e:
+                self.logger.debug(f"{type(e).__name__} terminating the sampler thread")
+                break
+            self._stop_event.wait(
+                max(self.interval - (time.monotonic() - started), 0.0)
+            )
+
+    def sample(self):
+        """takes a single sample and stores it"""
+
+        results = self.client.send_batch(_REQUESTS, raw=True)
+        row = np.full(len(FIELDS), np.nan)
+        row[0] = time.time()
+        for i, keys in _KEYS:
+            data = results[i] or {}
+            for field, key in keys:
+                if (value := data.get(key)) is not None:
+                    row[COLUMN[field]] = float(value)
+        with self._lock:
+            self._data[self._count % self.capacity] = row
+            self._count += 1
+
+    def samples(self, seconds: Optional[float] = None):
+        """
+        returns the stored samples, oldest first, shaped (n, len(FIELDS))
+
+        :param seconds: only return samples taken within this many seconds
+        :type seconds: float, optional
+        """
+        with self._lock:
+            if self._count <= self.capacity:
+                data = self._data[: self._count].copy()
+            else:
+                pos = self._count % self.capacity
+                data = np.concatenate((self._data[pos:], self._data[:pos]))
+        if seconds is not None and len(data):
+            data = data[data[:, 0] >= data[-1, 0] - seconds]
+        return data
+
+    def column(self, field: str, seconds: Optional[float] = None):
+        """returns a single field of the stored samples"""
+
+        return self.samples(seconds)[:, COLUMN[field]]
+
+    def rates(self, seconds: Optional[float] = None) -> dict:
+        """
+        computes derived rates between the first and last sample of a window
+
+        dropped_frames_per_sec: render and output frames skipped per second
+        render_lag_ratio: fraction of frames skipped by the renderer
+        average_frame_render_time: mean render time in ms over the window
+        stream_kbps, record_kbps: bitrate computed from outputBytes
+        """
+        data = self.samples(seconds)
+        if len(data) < 2:
+            return {}
+        first, last = data[0], data[-1]
+        dt = last[0] - first[0]
+        if dt <= 0:
+            return {}
+
+        def delta(field):
+            return last[COLUMN[field]] - first[COLUMN[field]]
+
+        render_total = delta("render_total_frames")
+        return {
+            "dropped_frames_per_sec": float(
+                (delta("render_skipped_frames") + delta("output_skipped_frames")) / dt
+            ),
+            "render_lag_ratio": (
+                float(delta("render_skipped_frames") / render_total)
+                if render_total > 0
+                else 0.0
+            ),
+            "average_frame_render_time": float(
+                np.nanmean(data[:, COLUMN["average_frame_render_time"]])
+            ),
+            "stream_kbps": float(max(delta("stream_bytes"), 0.0) * 8 / dt / 1000),
+            "record_kbps": float(max(delta("record_bytes"), 0.0) * 8 / dt / 1000),
+        }
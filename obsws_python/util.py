@@ -1,16 +1,161 @@
+import binascii
+import functools
 import re
 from dataclasses import dataclass
 
+# entries kept per memoized conversion, keys past the limit are converted
+# every time so arbitrary data keys (vendor, persistent data) can't grow it
+CACHE_SIZE = 4096
 
+
+def _memoized(fn):
+    cache = {}
+
+    @functools.wraps(fn)
+    def wrapper(s):
+        try:
+            return cache[s]
+        except KeyError:
+            converted = fn(s)
+            if len(cache) < CACHE_SIZE:
+                cache[s] = converted
+            return converted
+
+    wrapper.cache = cache
+    return wrapper
+
+
+@_memoized
 def to_camel_case(s):
     return "".join(word.title() for word in s.split("_"))
 
 
+_UPPER = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@_memoized
 def to_snake_case(s):
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", s).lower()
+    return _UPPER.sub("_", s).lower()
+
+
+def to_attr_key(name):
+    """maps a snake_case attribute name back to a camelCase data key"""
+
+    head, *words = name.split("_")
+    return head + "".join(word.title() for word in words)
+
+
+def _find_key(data, name):
+    """the key of `data` an attribute name refers to, None if there is none"""
+
+    key = to_attr_key(name)
+    if key in data:
+        return key
+    # keys that don't round trip, eg. consecutive capitals
+    for key in data:
+        if to_snake_case(key) == name:
+            return key
+
+
+@functools.cache
+def _classes():
+    """
+    the classes generated from protocol.json, imported on first use
+    since they import this module
+    """
+    from .protocol import CLASSES
+
+    # seed with every field name of the protocol, the generated classes hold
+    # them converted already, keyword names were given a trailing underscore
+    for cls in CLASSES.values():
+        to_snake_case.cache.update(
+            (key, attr) for key, attr in cls._FIELDS.items() if not attr.endswith("_")
+        )
+    return CLASSES
+
+
+def wrap(value):
+    """wraps a dict, or a list of dicts, in its lazy snake_case view"""
+
+    if type(value) is dict:
+        return DataDict(value)
+    if type(value) is list and value and type(value[0]) is dict:
+        return DataList(value)
+    return value
+
+
+class DataDict(dict):
+    """
+    Nested response data, a dict that also gives snake_case attribute
+    access to its keys: item.scene_name is item["sceneName"].
+
+    Nested dicts and lists of dicts are wrapped when first accessed.
+    dict methods take precedence over keys of the same name.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is dict or type(value) is list:
+            if (wrapped := wrap(value)) is not value:
+                dict.__setitem__(self, key, wrapped)
+            return wrapped
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def __getattr__(self, name):
+        if (key := _find_key(self, name)) is None:
+            raise AttributeError(f"no attribute '{name}'")
+        return self[key]
+
+    def __dir__(self):
+        return [*super().__dir__(), *self.attrs()]
+
+    def attrs(self):
+        return [to_snake_case(k) for k in self]
+
+
+class DataList(list):
+    """
+    Nested list of response objects, its dicts are wrapped in DataDicts
+    when first accessed.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        value = list.__getitem__(self, index)
+        if type(index) is slice:
+            return DataList(value)
+        if type(value) is dict:
+            value = DataDict(value)
+            list.__setitem__(self, index, value)
+        return value
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __reversed__(self):
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
 
 
 def as_dataclass(identifier, data):
+    """
+    builds the response or event object of `data`
+
+    uses the class generated from protocol.json for `identifier`,
+    falling back to a dynamic dataclass for types it does not know
+    or data holding fields it does not know
+    """
+    cls = _classes().get(identifier)
+    if cls is not None and cls._FIELDS.keys() >= data.keys():
+        return cls(data)
+
     def attrs():
         return list(to_snake_case(k) for k in data.keys())
 
@@ -20,7 +165,84 @@ def as_dataclass(identifier, data):
             (),
             {
                 "attrs": attrs,
-                **{to_snake_case(k): v for k, v in data.items()},
+                **{to_snake_case(k): wrap(v) for k, v in data.items()},
             },
         )
     )
+
+
+class ResponseView:
+    """
+    Attribute view over response data, the lazy response mode.
+
+    Nothing is converted up front, attribute names are mapped to the
+    data's keys when accessed.
+    """
+
+    __slots__ = ("_identifier", "_data")
+
+    def __init__(self, identifier, data):
+        self._identifier = identifier
+        self._data = data
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if (key := _find_key(self._data, name)) is None:
+            raise AttributeError(
+                f"'{self._identifier}' response has no attribute '{name}'"
+            )
+        return wrap(self._data[key])
+
+    def __dir__(self):
+        return [*super().__dir__(), *self.attrs()]
+
+    def __eq__(self, other):
+        if not isinstance(other, ResponseView):
+            return NotImplemented
+        return self._identifier == other._identifier and self._data == other._data
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._identifier!r}, {self._data!r})"
+
+    def attrs(self):
+        return [to_snake_case(k) for k in self._data]
+
+
+# base64 characters decoded at a time into a caller's buffer, whole 4 character groups
+DECODE_CHUNK = 1 << 16
+
+
+def decode_image_data(image_data, out=None):
+    """
+    decodes a "data:image/<format>;base64,..." string
+
+    returns (format, data), where data is bytes, or a memoryview
+    over the start of out if a writable buffer is supplied.
+
+    into out the image is decoded DECODE_CHUNK characters at a time,
+    so no full size copy of the base64 text or the image is made.
+    """
+    header_end = image_data.find(",", 0, 64)
+    if not image_data.startswith("data:") or header_end < 0:
+        raise ValueError("expected a base64 encoded data URI")
+    mime = image_data[5:header_end].split(";", 1)[0]
+    img_format = mime.rpartition("/")[2]
+    if out is None:
+        return img_format, binascii.a2b_base64(image_data[header_end + 1 :])
+
+    view = memoryview(out).cast("B")
+    length = len(image_data) - header_end - 1
+    if length % 4:
+        raise ValueError("base64 data is not a whole number of 4 character groups")
+    size = length // 4 * 3 - image_data.endswith("=") - image_data.endswith("==")
+    if size > len(view):
+        raise ValueError(
+            f"buffer too small for decoded image ({len(view)} < {size} bytes)"
+        )
+    written = 0
+    for i in range(header_end + 1, len(image_data), DECODE_CHUNK):
+        chunk = binascii.a2b_base64(image_data[i : i + DECODE_CHUNK])
+        view[written : written + len(chunk)] = chunk
+        written += len(chunk)
+    return img_format, view[:written]
@@ -36,9 +36,13 @@ EXTRAS_REQUIRE = {
         "pytest-randomly",
         "black",
         "isort",
-    ]
+    ],
+    "analysis": ["numpy", "pillow"],
 }
 
+# Command line tools
+ENTRY_POINTS = {"console_scripts": ["obsws-loadgen = obsws_python.loadgen:main"]}
+
 # Python version requirement
 PYTHON_REQUIRES = ">=3.9"
 
@@ -56,4 +60,5 @@ setup(
     extras_require=EXTRAS_REQUIRE,
     python_requires=PYTHON_REQUIRES,
     packages=find_packages(),
+    entry_points=ENTRY_POINTS,
 )
@@ -1,6 +1,15 @@
+import os
+
 import obsws_python as obs
 
-req_cl = obs.ReqClient()
+if os.environ.get("OBSWS_TEST_MOCK"):
+    from obsws_python.mock import MockServer
+
+    mock_server = MockServer(port=4455, password="mystrongpass").start()
+    req_cl = obs.ReqClient(host="localhost", port=4455, password="mystrongpass")
+else:
+    mock_server = None
+    req_cl = obs.ReqClient()
 
 
 def setup_module():
@@ -17,3 +26,5 @@ def teardown_module():
     if resp.studio_mode_enabled:
         req_cl.set_studio_mode_enabled(False)
     req_cl.base_client.ws.close()
+    if mock_server is not None:
+        mock_server.stop()
@@ -1,6 +1,7 @@
 import pytest
 
-from obsws_python.callback import Callback
+from obsws_python.callback import Callback, event_name, handler_name
+from obsws_python.util import to_camel_case, to_snake_case
 
 
 class TestCallbacks:
@@ -58,3 +59,31 @@ class TestCallbacks:
         )
         self.callback.deregister((on_callback_method_two, on_callback_method_three))
         assert self.callback.get() == ["CallbackMethodOne"]
+
+    def test_trigger_by_handler_name(self):
+        received = []
+
+        def on_input_mute_state_changed(data):
+            received.append(data.input_muted)
+
+        def on_scene_created(data):
+            received.append(data.scene_name)
+
+        self.callback.register((on_input_mute_state_changed, on_scene_created))
+        self.callback.trigger("InputMuteStateChanged", {"inputMuted": True})
+        self.callback.trigger("SceneRemoved", {"sceneName": "Scene"})
+        self.callback.deregister(on_input_mute_state_changed)
+        self.callback.trigger("InputMuteStateChanged", {"inputMuted": False})
+        assert received == [True]
+
+
+class TestCaseConversion:
+    __test__ = True
+
+    def test_memoized(self):
+        assert to_snake_case("obsWebSocketVersion") == "obs_web_socket_version"
+        assert to_snake_case("someVendorField") == "some_vendor_field"
+        assert to_snake_case.cache["someVendorField"] == "some_vendor_field"
+        assert to_camel_case("input_volume_meters") == "InputVolumeMeters"
+        assert handler_name("InputVolumeMeters") == "on_input_volume_meters"
+        assert event_name("on_input_volume_meters") == "InputVolumeMeters"
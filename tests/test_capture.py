@@ -0,0 +1,81 @@
+import threading
+import time
+
+import obsws_python as obs
+from obsws_python import capture
+from obsws_python.capture import ScreenshotCapture
+from obsws_python.mock import MockServer
+
+PNG = b"\x89PNG\r\n\x1a\n"
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+class TestScreenshotCapture:
+    __test__ = True
+
+    def test_latest_frame_per_source(self):
+        with MockServer(port=0) as server, obs.ReqClient(port=server.port) as cl:
+            server.state.add_scene("BRB")
+            with ScreenshotCapture(cl, ["Scene", "BRB"], fps=20, width=32) as cap:
+                assert wait_for(lambda: all(cap.frames().values()))
+                frame = cap.latest("Scene")
+                assert frame.source == "Scene"
+                assert frame.img_format == "jpg"
+                assert bytes(frame.data[:8]) == PNG
+                assert frame.seq >= 1 and frame.latency >= 0
+            stats = cap.stats()
+            assert set(stats) == {"Scene", "BRB"}
+            assert all(s["requested"] >= 1 and s["errors"] == 0 for s in stats.values())
+
+    def test_errors_counted(self):
+        with MockServer(port=0) as server, obs.ReqClient(port=server.port) as cl:
+            with ScreenshotCapture(cl, ["missing"], fps=50) as cap:
+                assert wait_for(lambda: cap.stats()["missing"]["errors"] >= 2)
+            assert cap.latest("missing") is None
+
+    def test_in_flight_limit(self):
+        with MockServer(port=0, latency=0.2) as server:
+            with obs.ReqClient(port=server.port) as cl:
+                with ScreenshotCapture(cl, ["Scene"], fps=100, in_flight=1) as cap:
+                    time.sleep(0.5)
+                # one request at a time, each taking 0.2s
+                assert cap.stats()["Scene"]["requested"] <= 4
+
+    def test_stale_frame_dropped(self):
+        delays = iter([0.3])
+
+        def latency(req_type):
+            return next(delays, 0.0)
+
+        with MockServer(port=0, latency=latency) as server:
+            with obs.ReqClient(port=server.port) as cl:
+                with ScreenshotCapture(cl, ["Scene"], fps=20, in_flight=2) as cap:
+                    assert wait_for(lambda: cap.stats()["Scene"]["dropped"] == 1)
+                assert cap.latest("Scene").seq > 1
+
+    def test_slow_decode_holds_up_no_response(self, monkeypatch):
+        decoding, release = threading.Event(), threading.Event()
+        decode = capture.decode_image_data
+
+        def slow_decode(image_data):
+            decoding.set()
+            release.wait(5)
+            return decode(image_data)
+
+        monkeypatch.setattr(capture, "decode_image_data", slow_decode)
+        with MockServer(port=0) as server, obs.ReqClient(port=server.port) as cl:
+            with ScreenshotCapture(cl, ["Scene"], fps=20) as cap:
+                try:
+                    assert decoding.wait(timeout=5)
+                    assert cl.send("GetVersion", timeout=2).obs_web_socket_version
+                finally:
+                    release.set()
+                assert wait_for(lambda: cap.latest("Scene") is not None)
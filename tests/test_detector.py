@@ -0,0 +1,216 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL.Image")
+
+import obsws_python as obs
+from obsws_python.detector import OutputDetector
+from obsws_python.mock import MockServer
+
+
+def plane(luma):
+    return np.full((36, 64), float(luma), dtype=np.float32)
+
+
+class TestOutputDetector:
+    __test__ = True
+
+    @pytest.fixture(autouse=True)
+    def detector(self):
+        self.events = []
+        self.detector = OutputDetector(
+            None, freeze_time=3.0, black_time=2.0, max_gap=10.0
+        )
+
+        def on_freeze_started(data):
+            self.events.append(("FreezeStarted", data))
+
+        def on_freeze_ended(data):
+            self.events.append(("FreezeEnded", data))
+
+        def on_black_started(data):
+            self.events.append(("BlackStarted", data))
+
+        def on_black_ended(data):
+            self.events.append(("BlackEnded", data))
+
+        self.detector.callback.register(
+            (on_freeze_started, on_freeze_ended, on_black_started, on_black_ended)
+        )
+
+    def feed(self, frames, name="Scene"):
+        for timestamp, luma in frames:
+            self.detector.update(name, plane(luma), timestamp)
+
+    def test_freeze_started_after_freeze_time(self):
+        self.feed([(0.0, 100), (1.0, 100), (2.5, 100)])
+        assert not self.events
+        assert not self.detector.frozen("Scene")
+        self.feed([(3.0, 100)])
+        assert self.detector.frozen("Scene")
+        [(event, data)] = self.events
+        assert event == "FreezeStarted"
+        assert data.source_name == "Scene"
+        assert data.duration == 3.0
+        assert data.difference == 0.0
+        self.feed([(5.0, 100)])
+        assert len(self.events) == 1
+
+    def test_freeze_ended(self):
+        self.feed([(0.0, 100), (1.0, 100), (4.0, 100), (6.0, 140)])
+        assert [event for event, _ in self.events] == ["FreezeStarted", "FreezeEnded"]
+        data = self.events[-1][1]
+        assert data.duration == 6.0
+        assert data.difference == 40.0
+        assert not self.detector.frozen("Scene")
+
+    def test_change_resets_freeze_time(self):
+        self.feed([(0.0, 100), (1.0, 100), (2.0, 120), (3.0, 120), (4.5, 120)])
+        assert not self.events
+        self.feed([(5.0, 120)])
+        assert self.events[0][0] == "FreezeStarted"
+        assert self.events[0][1].duration == 3.0
+
+    def test_freeze_threshold(self):
+        self.detector.freeze_threshold = 0.5
+        self.feed([(0.0, 100.0), (1.0, 100.4), (2.0, 100.0), (4.0, 100.4)])
+        assert self.events[0][0] == "FreezeStarted"
+        self.events.clear()
+        self.feed([(5.0, 101.0)])
+        assert self.events[0][0] == "FreezeEnded"
+
+    def test_black_started_after_black_time(self):
+        self.feed([(0.0, 0), (1.0, 10)])
+        assert not self.events
+        self.feed([(2.0, 5)])
+        assert self.detector.black("Scene")
+        [(event, data)] = [e for e in self.events if e[0].startswith("Black")]
+        assert event == "BlackStarted"
+        assert data.duration == 2.0
+        assert data.luma == 5.0
+        self.feed([(3.0, 5)])
+        assert len([e for e in self.events if e[0] == "BlackStarted"]) == 1
+
+    def test_black_ended(self):
+        self.feed([(0.0, 0), (1.0, 8), (2.0, 0), (2.5, 200)])
+        black = [(e, d) for e, d in self.events if e.startswith("Black")]
+        assert [e for e, _ in black] == ["BlackStarted", "BlackEnded"]
+        assert black[-1][1].duration == 2.5
+        assert black[-1][1].luma == 200.0
+        assert not self.detector.black("Scene")
+
+    def test_bright_frame_resets_black_time(self):
+        self.feed([(0.0, 0), (1.5, 200), (2.0, 0), (3.5, 0)])
+        assert not [e for e, _ in self.events if e.startswith("Black")]
+        self.feed([(4.0, 0)])
+        assert self.detector.black("Scene")
+
+    def test_black_threshold(self):
+        self.detector.black_threshold = 16.0
+        self.feed([(0.0, 16.0), (5.0, 16.0)])
+        assert not self.detector.black("Scene")
+        self.feed([(6.0, 15.9), (8.0, 15.9)])
+        assert self.detector.black("Scene")
+
+    def test_frozen_black_frame_fires_both(self):
+        self.feed([(0.0, 0), (2.0, 0), (3.0, 0)])
+        assert [event for event, _ in self.events] == ["BlackStarted", "FreezeStarted"]
+
+    def test_sources_are_independent(self):
+        self.feed([(0.0, 100), (4.0, 100)], name="A")
+        self.feed([(0.0, 100), (1.0, 150), (4.0, 100)], name="B")
+        assert self.detector.frozen("A")
+        assert not self.detector.frozen("B")
+        assert not self.detector.frozen("unknown")
+        assert [data.source_name for _, data in self.events] == ["A"]
+
+    def test_frame_size_change_is_not_compared(self):
+        self.detector.update("Scene", plane(100), 0.0)
+        self.detector.update("Scene", np.full((18, 32), 100.0), 4.0)
+        assert not self.events
+
+    def test_gap_resets_timing(self):
+        self.detector.max_gap = 2.0
+        self.feed([(0.0, 0), (0.5, 0), (10.5, 0)])
+        assert not self.events
+        assert not self.detector.frozen("Scene")
+        assert not self.detector.black("Scene")
+        self.feed([(11.5, 0), (12.5, 0)])
+        assert [event for event, _ in self.events] == ["BlackStarted"]
+
+    def test_gap_ends_freeze_and_blackout(self):
+        self.detector.max_gap = 2.0
+        self.feed([(0.0, 0), (1.0, 0), (2.0, 0), (3.0, 0)])
+        assert self.detector.frozen("Scene") and self.detector.black("Scene")
+        self.events.clear()
+        self.feed([(10.0, 0)])
+        assert [(event, data.duration) for event, data in self.events] == [
+            ("FreezeEnded", 3.0),
+            ("BlackEnded", 3.0),
+        ]
+        assert not self.detector.frozen("Scene")
+
+    def test_source_reported(self):
+        self.detector.update("program", plane(0), 0.0, source="Scene")
+        self.detector.update("program", plane(0), 2.0, source="Scene")
+        assert self.detector.black("program")
+        assert self.events[0][1].source_name == "Scene"
+
+    def test_sample(self):
+        with MockServer(port=0) as server, obs.ReqClient(port=server.port) as cl:
+            server.state.colors["Scene"] = (0, 0, 0)
+            detector = OutputDetector(cl, black_time=0.0)
+            events = []
+
+            def on_black_started(data):
+                events.append(data)
+
+            detector.callback.register(on_black_started)
+            detector.sample()
+            assert detector.black(OutputDetector.PROGRAM)
+            assert events[0].source_name == "Scene"
+            assert events[0].luma == 0.0
+
+    def test_stops_when_connection_closes(self):
+        server = MockServer(port=0).start()
+        cl = obs.ReqClient(port=server.port)
+        with OutputDetector(cl, interval=0.01) as detector:
+            server.stop()
+            detector.worker.join(timeout=5)
+            assert not detector.worker.is_alive()
+        cl.disconnect()
+
+    def test_sample_program(self):
+        with MockServer(port=0) as server, obs.ReqClient(port=server.port) as cl:
+            server.state.add_scene("BRB")
+            detector = OutputDetector(cl, freeze_time=0.0)
+            events = []
+
+            def on_freeze_started(data):
+                events.append(("FreezeStarted", data.source_name))
+
+            def on_freeze_ended(data):
+                events.append(("FreezeEnded", data.source_name))
+
+            detector.callback.register((on_freeze_started, on_freeze_ended))
+            detector.sample()
+            detector.sample()
+            assert detector.frozen(OutputDetector.PROGRAM)
+            assert not detector.frozen("Scene")
+            cl.set_current_program_scene("BRB")
+            detector.sample()
+            assert not detector.frozen(OutputDetector.PROGRAM)
+            detector.sample()
+            assert events == [
+                ("FreezeStarted", "Scene"),
+                ("FreezeEnded", "Scene"),
+                ("FreezeStarted", "BRB"),
+            ]
+
+    def test_sample_cancels_late_screenshots(self):
+        with MockServer(port=0, latency={"GetSourceScreenshot": 2.0}) as server:
+            with obs.ReqClient(port=server.port) as cl:
+                detector = OutputDetector(cl, sources=["Scene"], interval=0.1)
+                detector.sample()
+                assert not cl.base_client._pending
+                assert not detector.black("Scene")
@@ -1,3 +1,5 @@
+import time
+
 import pytest
 
 import obsws_python as obsws
@@ -33,3 +35,10 @@ class TestErrors:
         e = exc_info.value
         assert e.req_name == "SetCurrentProgramScene"
         assert e.code == 600
+
+    def test_it_raises_a_timeout_error_on_an_expired_deadline(self):
+        with pytest.raises(
+            obsws.error.OBSSDKTimeoutError,
+            match="Deadline expired before the request was sent",
+        ):
+            req_cl.with_options(deadline=time.monotonic() - 1).get_version()
@@ -0,0 +1,45 @@
+import threading
+
+import pytest
+
+import obsws_python as obs
+from obsws_python.history import EventHistory
+from obsws_python.metrics import EventMetrics
+from obsws_python.mock import MockServer
+
+
+class TestEventClient:
+    __test__ = True
+
+    @pytest.mark.parametrize(
+        "option, value",
+        [
+            ("history", False),
+            ("history", None),
+            ("history", True),
+            ("history", EventHistory()),
+            ("metrics", False),
+            ("metrics", None),
+            ("metrics", True),
+            ("metrics", EventMetrics()),
+        ],
+    )
+    def test_falsy_option_disables_it(self, option, value):
+        received = threading.Event()
+
+        def on_scene_created(data):
+            received.set()
+
+        with MockServer(port=0) as server:
+            with obs.EventClient(port=server.port, **{option: value}) as ev:
+                ev.callback.register(on_scene_created)
+                server.emit("SceneCreated", {"sceneName": "Scene 2", "isGroup": False})
+                assert received.wait(timeout=2)
+                assert ev.worker.is_alive()
+                recorder = getattr(ev, option)
+                if value in (False, None):
+                    assert recorder is None
+                elif option == "history":
+                    assert len(recorder) == 1
+                else:
+                    assert recorder.snapshot()["events"]["SceneCreated"]["count"] == 1
@@ -0,0 +1,90 @@
+import socket
+import threading
+from contextlib import ExitStack
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from obsws_python.error import OBSSDKFleetError
+from obsws_python.fleet import FleetClient
+from obsws_python.mock import MockServer
+
+
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        return sock.getsockname()[1]
+
+
+class NotFound(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_error(404)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestFleetClient:
+    __test__ = True
+
+    def test_fan_out(self):
+        with ExitStack() as stack:
+            servers = [stack.enter_context(MockServer(port=0)) for _ in range(2)]
+            hosts = [{"host": "localhost", "port": s.port} for s in servers]
+            with FleetClient(hosts, min_success="all") as fleet:
+                resp = fleet.get_version()
+                assert set(resp) == {f"localhost:{s.port}" for s in servers}
+                assert not resp.failed
+                assert all(r.obs_web_socket_version for r in resp.succeeded.values())
+                assert all(latency > 0 for latency in resp.latencies.values())
+
+    def test_request_error_counts_against_min_success(self):
+        with ExitStack() as stack:
+            servers = [stack.enter_context(MockServer(port=0)) for _ in range(2)]
+            hosts = [{"host": "localhost", "port": s.port} for s in servers]
+            with FleetClient(hosts) as fleet:
+                resp = fleet.get_input_mute("missing")
+                assert len(resp.failed) == 2
+                assert not resp.succeeded
+                fleet.min_success = 1
+                with pytest.raises(OBSSDKFleetError) as exc_info:
+                    fleet.get_input_mute("missing")
+                assert exc_info.value.method == "get_input_mute"
+
+    def test_connect_error_counts_against_min_success(self):
+        refused = f"localhost:{closed_port()}"
+        with MockServer(port=0) as server:
+            hosts = [
+                {"host": "localhost", "port": server.port},
+                {"host": "localhost", "port": int(refused.split(":")[1])},
+            ]
+            with FleetClient(hosts, min_success="all") as fleet:
+                assert list(fleet.connect_errors) == [refused]
+                with pytest.raises(OBSSDKFleetError) as exc_info:
+                    fleet.get_version()
+                results = exc_info.value.results
+                assert list(results.succeeded) == [f"localhost:{server.port}"]
+                assert results.failed == fleet.connect_errors
+
+                fleet.min_success = 1
+                resp = fleet.get_version()
+                assert len(resp) == 2
+                assert refused in resp.failed
+
+    def test_failed_handshake_is_a_connect_error(self):
+        http = HTTPServer(("localhost", 0), NotFound)
+        threading.Thread(target=http.serve_forever, daemon=True).start()
+        try:
+            with MockServer(port=0) as server:
+                hosts = [
+                    {"host": "localhost", "port": server.port},
+                    {"host": "localhost", "port": http.server_port},
+                ]
+                with FleetClient(hosts) as fleet:
+                    assert list(fleet.clients) == [f"localhost:{server.port}"]
+                    error = fleet.connect_errors[f"localhost:{http.server_port}"]
+                    assert not isinstance(error, OSError)
+                    assert fleet.get_version().succeeded
+        finally:
+            http.shutdown()
+            http.server_close()
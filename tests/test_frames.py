@@ -0,0 +1,56 @@
+import io
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from obsws_python.frames import (
+    FrameDecoder,
+    decode_image,
+    frame_difference,
+    mean_luma,
+)
+
+
+def encode(color, size=(64, 36), img_format="PNG"):
+    buf = io.BytesIO()
+    Image.new("RGB", size, color).save(buf, img_format)
+    return buf.getvalue()
+
+
+class TestFrames:
+    __test__ = True
+
+    def test_decode_image(self):
+        frame = decode_image(encode((255, 0, 0)))
+        assert frame.shape == (36, 64, 3)
+        assert frame[0, 0].tolist() == [255, 0, 0]
+
+    def test_mean_luma(self):
+        assert mean_luma(decode_image(encode((0, 0, 0)))) == pytest.approx(0.0)
+        assert mean_luma(decode_image(encode((255, 255, 255)))) == pytest.approx(
+            255.0, abs=0.01
+        )
+
+    def test_frame_difference(self):
+        black = decode_image(encode((0, 0, 0)))
+        grey = decode_image(encode((100, 100, 100)))
+        assert frame_difference(black, black) == 0.0
+        assert frame_difference(black, grey) == pytest.approx(100.0, abs=0.01)
+        with pytest.raises(ValueError):
+            frame_difference(black, decode_image(encode((0, 0, 0), (8, 8))))
+
+    def test_frame_decoder(self):
+        with FrameDecoder(max_width=64, max_height=36, slots=2, workers=1) as decoder:
+            with decoder.decode(encode((100, 100, 100))) as frame:
+                assert frame.array.shape == (36, 64, 3)
+                assert frame.mean_luma() == pytest.approx(100.0, abs=0.01)
+            with pytest.raises(ValueError):
+                decoder.decode(encode((0, 0, 0), (128, 128)))
+
+    def test_frame_decoder_spawns_workers(self):
+        with FrameDecoder(max_width=8, max_height=8, slots=1, workers=1) as decoder:
+            assert decoder._pool._mp_context.get_start_method() == "spawn"
+            with decoder.decode(encode((0, 0, 0), (8, 8))) as frame:
+                assert frame.mean_luma() == pytest.approx(0.0, abs=0.01)
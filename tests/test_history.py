@@ -0,0 +1,43 @@
+from obsws_python.history import EventHistory
+
+
+class TestEventHistory:
+    __test__ = True
+
+    def test_it_evicts_by_count(self):
+        history = EventHistory(maxlen=3)
+        for i in range(5):
+            history.append("SceneCreated", {"sceneName": f"scene{i}"}, 10)
+        assert len(history) == 3
+        assert history.nbytes == 30
+        assert [r.data["sceneName"] for r in history.query()] == [
+            "scene2",
+            "scene3",
+            "scene4",
+        ]
+
+    def test_it_evicts_by_bytes(self):
+        history = EventHistory(maxlen=100, maxbytes=25)
+        for i in range(5):
+            history.append("SceneCreated", {"sceneName": f"scene{i}"}, 10)
+        assert len(history) == 2
+        assert history.nbytes == 20
+
+    def test_query_by_type_and_name(self):
+        history = EventHistory()
+        history.append("InputMuteStateChanged", {"inputName": "Mic/Aux"})
+        history.append("InputMuteStateChanged", {"inputName": "Desktop Audio"})
+        history.append("SceneCreated", {"sceneName": "Mic/Aux"})
+        assert len(history.query(event_type="InputMuteStateChanged")) == 2
+        assert len(history.query(name="Mic/Aux")) == 2
+        assert (
+            len(history.query(event_type="InputMuteStateChanged", name="Mic/Aux")) == 1
+        )
+
+    def test_query_by_time_range(self):
+        history = EventHistory()
+        history.append("SceneCreated", {"sceneName": "scene"})
+        ts = history.query()[0].timestamp
+        assert history.query(since=ts, until=ts)
+        assert not history.query(since=ts + 1)
+        assert len(history.last(60)) == 1
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+
+def imported_modules(statement):
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    return subprocess.check_output([sys.executable, "-c", code], text=True).split()
+
+
+class TestImports:
+    __test__ = True
+
+    def test_importing_the_package_is_lazy(self):
+        modules = imported_modules("import obsws_python")
+        assert "websocket" not in modules
+        assert "obsws_python.reqs" not in modules
+        assert "obsws_python.events" not in modules
+
+    def test_subs_does_not_import_the_clients(self):
+        modules = imported_modules("from obsws_python import Subs")
+        assert "obsws_python.subs" in modules
+        assert "websocket" not in modules
+
+    def test_event_client_does_not_import_reqs(self):
+        modules = imported_modules("from obsws_python import EventClient")
+        assert "obsws_python.events" in modules
+        assert "obsws_python.reqs" not in modules
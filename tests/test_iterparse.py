@@ -0,0 +1,41 @@
+import json
+
+import pytest
+
+from obsws_python.iterparse import parse_response
+
+
+class TestIterParse:
+    __test__ = True
+
+    response = {
+        "requestId": 7,
+        "requestStatus": {"code": 100, "result": True},
+        "requestType": "GetSceneList",
+        "responseData": {
+            "currentProgramSceneName": "Scene",
+            "scenes": [{"sceneIndex": 0, "sceneName": "Scene"}, {"sceneIndex": 1}],
+        },
+    }
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_iter(self, indent):
+        message = json.dumps({"d": self.response, "op": 7}, indent=indent)
+        partial = parse_response(message)
+        assert partial == {
+            k: v for k, v in self.response.items() if k != "responseData"
+        }
+        assert list(partial.iter("scenes")) == self.response["responseData"]["scenes"]
+        assert list(partial.iter("missing")) == []
+
+    def test_not_a_list(self):
+        partial = parse_response(json.dumps({"d": self.response, "op": 7}))
+        with pytest.raises(ValueError):
+            list(partial.iter("currentProgramSceneName"))
+
+    def test_without_response_data(self):
+        message = json.dumps({"d": {"requestId": 1, "requestType": "StartRecord"}})
+        partial = parse_response(message)
+        assert partial["requestId"] == 1
+        assert list(partial.iter("inputs")) == []
+        assert parse_response(json.dumps({"op": 7})) is None
@@ -0,0 +1,82 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from obsws_python.levels import (
+    FLOOR_DB,
+    LevelAggregator,
+    LevelMeter,
+    levels_array,
+    mul_to_db,
+)
+
+
+def payload(name, mul):
+    return {"inputName": name, "inputLevelsMul": mul}
+
+
+class TestLevelMeter:
+    __test__ = True
+
+    def test_mul_to_db(self):
+        assert mul_to_db([1.0, 0.1, 0.0]).tolist() == [0.0, -20.0, FLOOR_DB]
+
+    def test_levels_array_pads_channels(self):
+        arr = levels_array(
+            [
+                payload("stereo", [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]),
+                payload("mono", [[0.1, 0.2, 0.3]]),
+                payload("silent", []),
+            ]
+        )
+        assert arr.shape == (3, 2, 3)
+        assert arr[1, 1].tolist() == [0.0, 0.0, 0.0]
+
+    def test_peak_hold_and_decay(self):
+        meter = LevelMeter(peak_hold=1.0, peak_decay=10.0)
+        meter.update([payload("mic", [[1.0, 1.0, 1.0]])], timestamp=1.0)
+        meter.update([payload("mic", [[0.1, 0.1, 0.1]])], timestamp=1.5)
+        frame = meter.frame("mic")
+        assert frame.db[0, 0] == pytest.approx(-20.0)
+        assert frame.peak_db[0, 0] == pytest.approx(0.0)
+
+        meter.update([payload("mic", [[0.1, 0.1, 0.1]])], timestamp=3.0)
+        assert meter.frame("mic").peak_db[0, 0] == pytest.approx(-10.0)
+
+    def test_new_inputs_are_tracked(self):
+        meter = LevelMeter()
+        meter.update([payload("mic", [[0.5, 0.5, 0.5]])], timestamp=1.0)
+        meter.update([payload("desktop", [[0.5, 0.5, 0.5]] * 2)], timestamp=1.05)
+        assert meter.names == ["mic", "desktop"]
+        assert meter.frame("mic").db.shape == (2, 3)
+        assert meter.frame("unknown") is None
+
+
+class TestLevelAggregator:
+    __test__ = True
+
+    def test_buckets(self):
+        agg = LevelAggregator(resolutions=(1.0, 10.0), capacity=4)
+        for k in range(200):
+            vu = 0.1 if k % 2 else 1.0
+            agg.update(
+                [payload("mic", [[vu, vu, vu]]), payload("aux", [[0.0, 0.0, 0.0]])],
+                timestamp=100.0 + k * 0.05,
+            )
+        agg.flush()
+
+        buckets = agg.buckets("mic")
+        assert len(buckets) == 4
+        assert buckets["start"].tolist() == [106.0, 107.0, 108.0, 109.0]
+        assert buckets[-1]["min_db"] == pytest.approx(-20.0)
+        assert buckets[-1]["max_db"] == pytest.approx(0.0)
+        assert buckets[-1]["clipped"]
+        assert len(agg.buckets("mic", 10.0)) == 1
+
+    def test_silence(self):
+        agg = LevelAggregator(silence_db=-60.0)
+        agg.update([payload("aux", [[0.0, 0.0, 0.0]])], timestamp=1.0)
+        agg.update([payload("aux", [[0.0, 0.0, 0.0]])], timestamp=2.0)
+        assert agg.silent("aux")
+        assert not agg.clipped("aux")
+        assert not agg.silent("unknown")
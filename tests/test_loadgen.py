@@ -0,0 +1,27 @@
+import obsws_python as obs
+from obsws_python.loadgen import LoadGenerator, parse_mix
+from obsws_python.mock import MockServer
+
+
+class TestLoadGenerator:
+    __test__ = True
+
+    def test_parse_mix(self):
+        assert parse_mix("set_scene_item_enabled=70,get_stats=20,GetVersion") == {
+            "set_scene_item_enabled": 70.0,
+            "get_stats": 20.0,
+            "GetVersion": 1.0,
+        }
+
+    def test_it_reports_latency_and_errors(self):
+        with MockServer(port=0) as server, obs.ReqClient(port=server.port) as cl:
+            cl.create_input("Scene", "loadgen", "color_source_v3", {}, True)
+            generator = LoadGenerator(
+                cl, {"set_scene_item_enabled": 3, "GetStats": 1, "Bogus": 1}, rate=200
+            )
+            report = generator.run(0.5, report=lambda line: None)
+        total = report["total"]
+        assert 50 < total["requests"] <= 101
+        assert total["errors"] == {204: report["requests"]["Bogus"]["requests"]}
+        assert report["requests"]["set_scene_item_enabled"]["error_rate"] == 0
+        assert total["p50_ms"] > 0
@@ -0,0 +1,102 @@
+import time
+
+import obsws_python as obs
+from obsws_python.callback import Callback
+from obsws_python.metrics import EventMetrics, RequestMetrics, RequestSample
+from obsws_python.mock import MockServer
+
+
+class TestRequestMetrics:
+    __test__ = True
+
+    def test_it_aggregates_per_request_type(self):
+        metrics = RequestMetrics()
+        for latency in (0.001, 0.003, 0.004, 0.2):
+            metrics(RequestSample("GetVersion", latency, 50, 300, 100, True, 2))
+        metrics(RequestSample("GetStats", 0.01, 40, 500, 100, True, 1))
+        snapshot = metrics.snapshot()
+        stats = snapshot["requests"]["GetVersion"]
+        assert stats["count"] == 4
+        assert stats["bytes_sent"] == 200
+        assert stats["bytes_received"] == 1200
+        assert stats["min"] == 0.001
+        assert stats["max"] == 0.2
+        assert stats["p50"] == 0.005
+        assert stats["p99"] == 0.2
+        assert sum(stats["histogram"].values()) == 4
+        assert snapshot["in_flight"] == 1
+        assert snapshot["max_in_flight"] == 2
+
+    def test_it_counts_errors_by_code(self):
+        metrics = RequestMetrics()
+        metrics(RequestSample("SetCurrentProgramScene", 0.01, 60, 200, 600, False, 0))
+        metrics(RequestSample("SetCurrentProgramScene", 0.01, 60, 200, 600, False, 0))
+        metrics(RequestSample("GetVersion", 1.0, 50, 0, None, False, 0))
+        snapshot = metrics.snapshot()
+        assert snapshot["errors"] == {600: 2, "no_response": 1}
+        assert snapshot["requests"]["SetCurrentProgramScene"]["errors"] == 2
+
+    def test_reset(self):
+        metrics = RequestMetrics()
+        metrics(RequestSample("GetVersion", 0.01, 50, 300, 100, True, 3))
+        metrics.reset()
+        assert metrics.snapshot()["requests"] == {}
+
+    def test_in_flight_counts_unfinished_requests(self):
+        metrics = RequestMetrics()
+        with MockServer(port=0, latency={"GetVersion": 0.3}) as server:
+            with obs.ReqClient(port=server.port, metrics=metrics) as cl:
+                cl.get_stats()
+                assert metrics.snapshot()["in_flight"] == 0
+                futures = [cl.send_async("GetVersion") for _ in range(3)]
+                snapshot = metrics.snapshot()
+                assert snapshot["in_flight"] == 3
+                assert snapshot["max_in_flight"] == 3
+                for future in futures:
+                    future.result(timeout=5)
+                assert metrics.snapshot()["in_flight"] == 0
+
+
+class TestEventMetrics:
+    __test__ = True
+
+    def test_it_records_events_and_handlers(self):
+        metrics = EventMetrics()
+        callback = Callback()
+        callback.metrics = metrics
+        calls = []
+
+        def on_scene_created(data):
+            calls.append(data.scene_name)
+
+        callback.register(on_scene_created)
+        for i in range(3):
+            received = time.perf_counter()
+            metrics.received("SceneCreated", 0.0001)
+            callback.trigger("SceneCreated", {"sceneName": f"scene{i}"}, received)
+        snapshot = metrics.snapshot()
+        assert calls == ["scene0", "scene1", "scene2"]
+        assert snapshot["events"]["SceneCreated"]["count"] == 3
+        assert snapshot["events"]["SceneCreated"]["rate"] > 0
+        handler = snapshot["handlers"][on_scene_created.__qualname__]
+        assert handler["count"] == 3
+        assert handler["lag"]["max"] >= 0
+
+    def test_snapshot_reset(self):
+        metrics = EventMetrics()
+        metrics.received("SceneCreated", 0.0001)
+        assert metrics.snapshot(reset=True)["events"]["SceneCreated"]["count"] == 1
+        assert metrics.snapshot()["events"] == {}
+
+    def test_reporter(self):
+        metrics = EventMetrics()
+        reports = []
+        metrics.start(interval=0.05, report=reports.append)
+        metrics.received("SceneCreated", 0.0001)
+        time.sleep(0.2)
+        metrics.stop()
+        assert reports
+        assert (
+            sum(r["events"].get("SceneCreated", {}).get("count", 0) for r in reports)
+            == 1
+        )
@@ -0,0 +1,58 @@
+import threading
+import time
+
+import obsws_python as obs
+from obsws_python.mock import MockServer
+
+
+class TestMockServer:
+    __test__ = True
+
+    @classmethod
+    def setup_class(cls):
+        cls.server = MockServer(port=0, password="secret").start()
+        cls.conn = {"host": "localhost", "port": cls.server.port, "password": "secret"}
+
+    @classmethod
+    def teardown_class(cls):
+        cls.server.stop()
+
+    def test_it_sends_events_for_state_changes(self):
+        received = threading.Event()
+        with obs.EventClient(**self.conn) as ev, obs.ReqClient(**self.conn) as req:
+
+            def on_scene_created(data):
+                if data.scene_name == "MOCK_TEST":
+                    received.set()
+
+            ev.callback.register(on_scene_created)
+            req.create_scene("MOCK_TEST")
+            assert received.wait(timeout=2)
+            req.remove_scene("MOCK_TEST")
+
+    def test_it_generates_events(self):
+        count = 0
+
+        def on_input_volume_meters(data):
+            nonlocal count
+            count += 1
+
+        with obs.EventClient(**self.conn, subs=obs.Subs.INPUTVOLUMEMETERS) as ev:
+            ev.callback.register(on_input_volume_meters)
+            stop_event = self.server.generate("InputVolumeMeters", rate=100)
+            time.sleep(0.3)
+            stop_event.set()
+        assert count > 10
+
+    def test_it_injects_latency(self):
+        self.server.latency = {"GetStats": 0.2}
+        try:
+            with obs.ReqClient(**self.conn) as req:
+                started = time.monotonic()
+                req.get_version()
+                assert time.monotonic() - started < 0.2
+                started = time.monotonic()
+                req.get_stats()
+                assert time.monotonic() - started >= 0.2
+        finally:
+            self.server.latency = 0.0
@@ -0,0 +1,144 @@
+import threading
+import time
+
+import pytest
+
+from obsws_python.error import OBSSDKError, OBSSDKTimeoutError
+from obsws_python.mock import MockRequestError, MockServer
+from obsws_python.pool import ConnectionPool
+
+
+class TestConnectionPool:
+    __test__ = True
+
+    @pytest.fixture(autouse=True)
+    def server(self):
+        with MockServer(port=0) as server:
+            self.server = server
+            self.key = f"localhost:{server.port}"
+            yield server
+
+    def test_client_reused(self):
+        with ConnectionPool() as pool:
+            with pool.connection(port=self.server.port) as cl:
+                assert cl.get_version().obs_web_socket_version
+            with pool.connection(port=self.server.port) as again:
+                assert again is cl
+            stats = pool.stats()[self.key]
+            assert stats["created"] == 1
+            assert stats["checkouts"] == 2
+            assert stats["size"] == stats["idle"] == 1
+
+    def test_max_size_timeout(self):
+        with ConnectionPool(max_size=1) as pool:
+            cl = pool.checkout(port=self.server.port)
+            started = time.monotonic()
+            with pytest.raises(OBSSDKTimeoutError):
+                pool.checkout(port=self.server.port, timeout=0.2)
+            assert 0.2 <= time.monotonic() - started < 1.0
+            pool.checkin(cl)
+            stats = pool.stats()[self.key]
+            assert stats["size"] == 1
+            assert stats["checkouts"] == 1
+
+    def test_max_size_wait(self):
+        with ConnectionPool(max_size=1) as pool:
+            cl = pool.checkout(port=self.server.port)
+            timer = threading.Timer(0.1, pool.checkin, (cl,))
+            timer.start()
+            assert pool.checkout(port=self.server.port, timeout=5) is cl
+            timer.join()
+            stats = pool.stats()[self.key]
+            assert stats["created"] == 1
+            assert stats["max_wait"] >= 0.1
+
+    def test_health_check(self):
+        checks = []
+
+        @self.server.handler("GetVersion")
+        def get_version(state, data):
+            checks.append(data)
+            raise MockRequestError(500, "unhealthy")
+
+        with ConnectionPool(check_after=0.0) as pool:
+            pool.checkin(first := pool.checkout(port=self.server.port))
+            second = pool.checkout(port=self.server.port)
+            assert second is not first
+            assert len(checks) == 1
+            stats = pool.stats()[self.key]
+            assert stats["created"] == 2
+            assert stats["discarded"] == 1
+            # the discarded client is not counted as a checkout
+            assert stats["checkouts"] == 2
+            assert stats["size"] == 1
+
+    def test_health_check_after_idle(self):
+        checks = []
+
+        @self.server.handler("GetVersion")
+        def get_version(state, data):
+            checks.append(data)
+            return {}
+
+        with ConnectionPool(check_after=0.1) as pool:
+            pool.checkin(cl := pool.checkout(port=self.server.port))
+            pool.checkin(pool.checkout(port=self.server.port))
+            assert not checks
+            time.sleep(0.15)
+            assert pool.checkout(port=self.server.port) is cl
+            assert len(checks) == 1
+
+    def test_closed_client_replaced(self):
+        with ConnectionPool(check_after=None) as pool:
+            cl = pool.checkout(port=self.server.port)
+            pool.checkin(cl)
+            cl.disconnect()
+            time.sleep(0.05)
+            assert pool.checkout(port=self.server.port) is not cl
+            assert pool.stats()[self.key]["discarded"] == 1
+
+    def test_idle_timeout(self):
+        with ConnectionPool(idle_timeout=0.05) as pool:
+            cl = pool.checkout(port=self.server.port)
+            pool.checkin(cl)
+            time.sleep(0.1)
+            assert pool.checkout(port=self.server.port) is not cl
+            assert not cl.base_client.ws.connected
+            stats = pool.stats()[self.key]
+            assert stats["discarded"] == 1
+            assert stats["size"] == 1
+
+    def test_discard_on_error(self):
+        with ConnectionPool() as pool:
+            with pytest.raises(OSError):
+                with pool.connection(port=self.server.port):
+                    raise OSError("connection reset")
+            stats = pool.stats()[self.key]
+            assert stats["discarded"] == 1
+            assert stats["size"] == 0
+
+            with pytest.raises(ValueError):
+                with pool.connection(port=self.server.port):
+                    raise ValueError
+            stats = pool.stats()[self.key]
+            assert stats["discarded"] == 1
+            assert stats["idle"] == 1
+
+    def test_stats_per_password(self):
+        with ConnectionPool() as pool:
+            pool.checkin(pool.checkout(port=self.server.port))
+            pool.checkin(pool.checkout(port=self.server.port, password="other"))
+            pool.checkin(pool.checkout(port=self.server.port))
+            stats = pool.stats()
+            assert list(stats) == [self.key, f"{self.key}#2"]
+            assert stats[self.key]["checkouts"] == 2
+            assert stats[f"{self.key}#2"]["checkouts"] == 1
+            assert "other" not in repr(stats)
+
+    def test_closed(self):
+        pool = ConnectionPool()
+        pool.checkin(cl := pool.checkout(port=self.server.port))
+        pool.close()
+        assert not cl.base_client.ws.connected
+        with pytest.raises(OBSSDKError):
+            pool.checkout(port=self.server.port)
@@ -0,0 +1,79 @@
+import json
+
+from obsws_python import protocol
+from obsws_python.util import DataDict, ResponseView, as_dataclass
+
+
+class TestProtocolClasses:
+    __test__ = True
+
+    def test_generated_class_is_used(self):
+        resp = as_dataclass(
+            "GetInputMute",
+            {"inputMuted": True},
+        )
+        assert isinstance(resp, protocol.GetInputMuteResponse)
+        assert resp.input_muted is True
+        assert not hasattr(resp, "__dict__")
+
+    def test_attrs_in_arrival_order(self):
+        data = {"sceneUuid": "abc", "sceneName": "Scene"}
+        resp = as_dataclass("GetCurrentProgramScene", data)
+        assert resp.attrs() == ["scene_uuid", "scene_name"]
+        assert resp == as_dataclass("GetCurrentProgramScene", dict(data))
+
+    def test_event_class(self):
+        event = as_dataclass("InputVolumeChanged", {"inputName": "Mic"})
+        assert isinstance(event, protocol.InputVolumeChangedEvent)
+        assert event.input_name == "Mic"
+
+    def test_unknown_field_falls_back(self):
+        resp = as_dataclass("GetInputMute", {"inputMuted": False, "addedLater": 1})
+        assert not isinstance(resp, protocol.ProtocolObject)
+        assert resp.added_later == 1
+        assert resp.attrs() == ["input_muted", "added_later"]
+
+    def test_unknown_type_falls_back(self):
+        resp = as_dataclass("SomeVendorRequest", {"someValue": 1})
+        assert resp.some_value == 1
+
+
+class TestNestedViews:
+    __test__ = True
+
+    data = {
+        "sceneItems": [
+            {
+                "sourceName": "Mic",
+                "sceneItemId": 1,
+                "sceneItemTransform": {"positionX": 10.0, "positionY": 0.0},
+            },
+            {"sourceName": "Camera", "sceneItemId": 2, "sceneItemTransform": {}},
+        ]
+    }
+
+    def test_attribute_access(self):
+        resp = as_dataclass("GetSceneItemList", self.data)
+        item = resp.scene_items[0]
+        assert item.source_name == "Mic"
+        assert item["sourceName"] == item.get("sourceName") == "Mic"
+        assert item.scene_item_transform.position_x == 10.0
+        assert [i.scene_item_id for i in resp.scene_items] == [1, 2]
+        assert [i.source_name for i in reversed(resp.scene_items)] == ["Camera", "Mic"]
+
+    def test_equal_to_plain_data(self):
+        resp = as_dataclass("GetSceneItemList", self.data)
+        assert resp.scene_items == self.data["sceneItems"]
+        assert isinstance(resp.scene_items[1], dict)
+        assert json.dumps(resp.scene_items) == json.dumps(self.data["sceneItems"])
+
+    def test_converted_on_access(self):
+        resp = as_dataclass("GetSceneItemList", self.data)
+        assert type(list.__getitem__(resp.scene_items, 1)) is dict
+        resp.scene_items[1]
+        assert type(list.__getitem__(resp.scene_items, 1)) is DataDict
+        assert type(self.data["sceneItems"][1]) is dict
+
+    def test_lazy_response_mode(self):
+        view = ResponseView("GetSceneItemList", self.data)
+        assert view.scene_items[0].scene_item_transform.position_y == 0.0
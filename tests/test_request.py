@@ -1,5 +1,13 @@
+import json
+import threading
+import time
+
 import pytest
 
+import obsws_python as obs
+from obsws_python.error import OBSSDKRequestError, OBSSDKTimeoutError
+from obsws_python.metrics import RequestMetrics
+from obsws_python.mock import MockServer, _Connection
 from tests import req_cl
 
 
@@ -11,6 +19,54 @@ class TestRequests:
         assert hasattr(resp, "obs_version")
         assert hasattr(resp, "obs_web_socket_version")
 
+    def test_send_batch(self):
+        resp = req_cl.send_batch(
+            [("GetVersion", None), ("GetStudioModeEnabled", None)],
+        )
+        assert hasattr(resp[0], "obs_version")
+        assert hasattr(resp[1], "studio_mode_enabled")
+
+    @pytest.mark.parametrize("mode", ["raw", "lazy", "dataclass"])
+    def test_response_mode(self, mode):
+        cl = req_cl.with_options(response=mode)
+        resp = cl.get_version()
+        if mode == "raw":
+            assert isinstance(resp, dict)
+            assert "obsVersion" in resp
+        else:
+            assert resp.obs_web_socket_version
+            assert resp.attrs() == req_cl.get_version().attrs()
+        assert isinstance(cl.send_batch([("GetVersion", None)])[0], type(resp))
+
+    def test_response_mode_unknown(self):
+        with pytest.raises(ValueError):
+            req_cl.with_options(response="json")
+
+    def test_iter_input_list(self):
+        inputs = list(req_cl.iter_input_list())
+        assert inputs == req_cl.get_input_list().inputs
+        assert all(i.input_name for i in inputs)
+
+    def test_send_without_waiting(self):
+        nowait = req_cl.with_options(wait=False)
+        assert nowait.set_current_program_scene("BRB_TEST") is None
+        assert req_cl.flush(timeout=5)
+        resp = req_cl.get_current_program_scene()
+        assert resp.current_program_scene_name == "BRB_TEST"
+
+    def test_flush_counts_failures(self):
+        errors = []
+        with MockServer(port=0) as server:
+            with obs.ReqClient(port=server.port, on_error=errors.append) as cl:
+                nowait = cl.with_options(wait=False)
+                for _ in range(200):
+                    nowait.get_input_mute("missing")
+                assert cl.flush(timeout=5)
+                assert cl.detached.outstanding == 0
+                assert cl.detached.failed == 200
+                assert len(errors) == 200
+                assert all(isinstance(e, OBSSDKRequestError) for e in errors)
+
     def test_get_hot_key_list(self):
         resp = req_cl.get_hot_key_list()
         assert resp.hotkeys
@@ -66,6 +122,13 @@ class TestRequests:
         resp = req_cl.get_current_program_scene()
         assert resp.current_program_scene_name == scene
 
+    def test_get_source_screenshot_data(self):
+        img_format, data = req_cl.get_source_screenshot_data(
+            "START_TEST", "png", width=64, height=36
+        )
+        assert img_format == "png"
+        assert data[:8] == b"\x89PNG\r\n\x1a\n"
+
     def test_input_list(self):
         req_cl.create_input(
             "START_TEST", "test", "color_source_v3", {"color": 4294945535}, True
@@ -110,3 +173,113 @@ class TestRequests:
         req_cl.set_studio_mode_enabled(state)
         resp = req_cl.get_studio_mode_enabled()
         assert resp.studio_mode_enabled == state
+
+
+class TestTimeouts:
+    __test__ = True
+
+    @classmethod
+    def setup_class(cls):
+        cls.server = MockServer(port=0, latency=1.0).start()
+        cls.cl = obs.ReqClient(port=cls.server.port)
+
+    @classmethod
+    def teardown_class(cls):
+        cls.cl.disconnect()
+        cls.server.stop()
+
+    def test_send_timeout(self):
+        started = time.monotonic()
+        with pytest.raises(OBSSDKTimeoutError):
+            self.cl.send("GetVersion", timeout=0.2)
+        assert time.monotonic() - started < 0.9
+
+    def test_send_batch_timeout(self):
+        started = time.monotonic()
+        with pytest.raises(OBSSDKTimeoutError):
+            self.cl.send_batch([("GetVersion", None)], timeout=0.2)
+        assert time.monotonic() - started < 0.9
+
+    def test_send_batch_deadline(self):
+        started = time.monotonic()
+        with pytest.raises(OBSSDKTimeoutError):
+            self.cl.with_options(deadline=started + 0.2).send_batch(
+                [("GetVersion", None)]
+            )
+        assert time.monotonic() - started < 0.9
+
+
+class TestSendIter:
+    __test__ = True
+
+    def test_response_data_first(self, monkeypatch):
+        """a response not laid out as obs-websocket sorts it is decoded whole"""
+
+        def send(conn, message, delay=0.0):
+            d = message.get("d", {})
+            if "responseData" in d:
+                message = {
+                    "d": {"responseData": d.pop("responseData"), **d},
+                    "op": message["op"],
+                }
+            conn._write_frame(0x1, json.dumps(message).encode())
+
+        monkeypatch.setattr(_Connection, "send", send)
+        metrics = RequestMetrics()
+        with MockServer(port=0) as server:
+            with obs.ReqClient(port=server.port, metrics=metrics) as cl:
+                names = [i.input_name for i in cl.iter_input_list()]
+                assert names == [i["inputName"] for i in cl.get_input_list().inputs]
+                assert not cl.base_client._streamed
+                assert cl.base_client._reader.is_alive()
+        assert metrics.snapshot()["requests"]["GetInputList"]["errors"] == 0
+
+
+class TestSendAsync:
+    __test__ = True
+
+    def test_resolves_to_response(self):
+        futures = [req_cl.send_async("GetVersion"), req_cl.send_async("GetStats")]
+        assert futures[0].result(timeout=5).obs_web_socket_version
+        assert hasattr(futures[1].result(timeout=5), "cpu_usage")
+        raw = req_cl.send_async("GetVersion", raw=True).result(timeout=5)
+        assert "obsWebSocketVersion" in raw
+
+    def test_failed_request(self):
+        future = req_cl.send_async("GetInputMute", {"inputName": "missing"})
+        with pytest.raises(OBSSDKRequestError) as exc_info:
+            future.result(timeout=5)
+        assert exc_info.value.code == 600
+
+    def test_callback_sends_request(self):
+        with MockServer(port=0) as server, obs.ReqClient(port=server.port) as cl:
+            done = threading.Event()
+            stats = []
+
+            def callback(future):
+                stats.append(cl.send("GetStats", timeout=2))
+                done.set()
+
+            cl.send_async("GetVersion").add_done_callback(callback)
+            assert done.wait(timeout=5)
+            assert hasattr(stats[0], "cpu_usage")
+            assert cl.send("GetVersion", timeout=2).obs_web_socket_version
+
+    def test_slow_callback_holds_up_no_response(self):
+        with MockServer(port=0) as server, obs.ReqClient(port=server.port) as cl:
+            release = threading.Event()
+            cl.send_async("GetVersion").add_done_callback(lambda f: release.wait(5))
+            try:
+                assert cl.send("GetVersion", timeout=2).obs_web_socket_version
+                future = cl.send_async("GetStats")
+                assert hasattr(future.result(timeout=2), "cpu_usage")
+            finally:
+                release.set()
+
+    def test_cancel(self):
+        with MockServer(port=0, latency={"GetStats": 0.5}) as server:
+            with obs.ReqClient(port=server.port) as cl:
+                future = cl.send_async("GetStats")
+                assert future.cancel()
+                assert not cl.base_client._pending
+                assert cl.send("GetVersion", timeout=2).obs_web_socket_version
@@ -0,0 +1,79 @@
+from concurrent.futures import Future
+
+from obsws_python.scheduler import Priority, RequestScheduler
+
+
+class TestRequestScheduler:
+    __test__ = True
+
+    def setup_method(self):
+        self.sent = []
+
+    def send(self, payload):
+        self.sent.append(payload["d"]["requestId"])
+
+    def submit(self, scheduler, request_id, priority, req_type="GetVersion"):
+        future = Future()
+        payload = {"d": {"requestType": req_type, "requestId": request_id}}
+        scheduler.submit(request_id, payload, future, priority)
+        return future
+
+    def test_it_sends_immediately_below_the_limit(self):
+        scheduler = RequestScheduler(self.send, max_in_flight=1)
+        self.submit(scheduler, 1, Priority.BACKGROUND)
+        assert self.sent == [1]
+        assert scheduler.in_flight == 1
+
+    def test_it_releases_by_priority(self):
+        scheduler = RequestScheduler(self.send, max_in_flight=1)
+        self.submit(scheduler, 1, Priority.NORMAL)
+        self.submit(scheduler, 2, Priority.BACKGROUND)
+        self.submit(scheduler, 3, Priority.NORMAL)
+        self.submit(scheduler, 4, Priority.CRITICAL)
+        assert scheduler.stats()["BACKGROUND"]["depth"] == 1
+        for request_id in (1, 4, 3):
+            scheduler.complete(request_id)
+        assert self.sent == [1, 4, 3, 2]
+
+    def test_it_skips_cancelled_requests(self):
+        scheduler = RequestScheduler(self.send, max_in_flight=1)
+        self.submit(scheduler, 1, Priority.NORMAL)
+        self.submit(scheduler, 2, Priority.NORMAL).cancel()
+        self.submit(scheduler, 3, Priority.NORMAL)
+        scheduler.complete(1)
+        assert self.sent == [1, 3]
+        assert scheduler.stats()["NORMAL"]["sent"] == 2
+
+    def test_it_rate_limits(self):
+        scheduler = RequestScheduler(self.send, rate_limit=0.001, burst=2)
+        for request_id in range(4):
+            self.submit(scheduler, request_id, Priority.NORMAL)
+        assert self.sent == [0, 1]
+        assert scheduler.stats()["NORMAL"]["depth"] == 2
+
+    def test_per_type_limits_do_not_block_other_types(self):
+        scheduler = RequestScheduler(
+            self.send, limits={"GetSourceScreenshot": {"max_in_flight": 1}}
+        )
+        self.submit(scheduler, 1, Priority.NORMAL, "GetSourceScreenshot")
+        self.submit(scheduler, 2, Priority.NORMAL, "GetSourceScreenshot")
+        self.submit(scheduler, 3, Priority.NORMAL)
+        assert self.sent == [1, 3]
+        scheduler.complete(1)
+        assert self.sent == [1, 3, 2]
+
+    def test_send_error_after_the_request_failed(self):
+        closed = OSError("connection closed")
+
+        def send(payload):
+            # the response thread fails the request while it is being sent
+            future.set_running_or_notify_cancel()
+            future.set_exception(closed)
+            raise OSError("socket closed")
+
+        scheduler = RequestScheduler(send)
+        future = Future()
+        payload = {"d": {"requestType": "GetVersion", "requestId": 1}}
+        scheduler.submit(1, payload, future, Priority.NORMAL)
+        assert future.exception() is closed
+        assert scheduler.in_flight == 0
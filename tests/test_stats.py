@@ -0,0 +1,125 @@
+import itertools
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import obsws_python as obs
+from obsws_python.mock import MockServer
+from obsws_python.stats import COLUMN, FIELDS, StatsSampler
+
+
+@pytest.fixture
+def client():
+    """a client of a mock whose counters advance by a fixed step per sample"""
+
+    with MockServer(port=0) as server:
+        stats, stream, record = itertools.count(), itertools.count(), itertools.count()
+
+        @server.handler("GetStats")
+        def get_stats(state, data):
+            n = next(stats)
+            return {
+                "cpuUsage": 2.5,
+                "memoryUsage": 300.0,
+                "activeFps": 60.0,
+                "averageFrameRenderTime": 1.0 + n,
+                "renderSkippedFrames": 3 * n,
+                "renderTotalFrames": 60 * n,
+                "outputSkippedFrames": 2 * n,
+                "outputTotalFrames": 60 * n,
+            }
+
+        @server.handler("GetStreamStatus")
+        def get_stream_status(state, data):
+            n = next(stream)
+            return {
+                "outputActive": True,
+                "outputBytes": 125_000 * n,
+                "outputSkippedFrames": n,
+                "outputTotalFrames": 60 * n,
+            }
+
+        @server.handler("GetRecordStatus")
+        def get_record_status(state, data):
+            return {"outputActive": False, "outputBytes": 250_000 * next(record)}
+
+        with obs.ReqClient(port=server.port) as cl:
+            yield cl
+
+
+def take(sampler, n):
+    for _ in range(n):
+        sampler.sample()
+        time.sleep(0.01)
+
+
+class TestStatsSampler:
+    __test__ = True
+
+    def test_sample(self, client):
+        sampler = StatsSampler(client)
+        take(sampler, 2)
+        assert len(sampler) == 2
+        data = sampler.samples()
+        assert data.shape == (2, len(FIELDS))
+        last = data[-1]
+        assert last[COLUMN["cpu_usage"]] == 2.5
+        assert last[COLUMN["render_total_frames"]] == 60
+        assert last[COLUMN["stream_active"]] == 1.0
+        assert last[COLUMN["stream_bytes"]] == 125_000
+        assert last[COLUMN["stream_skipped_frames"]] == 1
+        assert last[COLUMN["record_active"]] == 0.0
+        assert last[COLUMN["record_bytes"]] == 250_000
+        assert list(sampler.column("render_skipped_frames")) == [0, 3]
+
+    def test_rates(self, client):
+        sampler = StatsSampler(client)
+        take(sampler, 3)
+        timestamps = sampler.column("timestamp")
+        dt = timestamps[-1] - timestamps[0]
+        rates = sampler.rates()
+        # 6 render and 4 output frames skipped over the window
+        assert rates["dropped_frames_per_sec"] == pytest.approx(10 / dt)
+        assert rates["render_lag_ratio"] == pytest.approx(6 / 120)
+        assert rates["average_frame_render_time"] == pytest.approx(2.0)
+        assert rates["stream_kbps"] == pytest.approx(250_000 * 8 / dt / 1000)
+        assert rates["record_kbps"] == pytest.approx(500_000 * 8 / dt / 1000)
+
+    def test_rates_need_two_samples(self, client):
+        sampler = StatsSampler(client)
+        assert sampler.rates() == {}
+        take(sampler, 1)
+        assert sampler.rates() == {}
+        take(sampler, 1)
+        assert sampler.rates()
+        assert sampler.rates(seconds=0) == {}
+
+    def test_capacity(self, client):
+        sampler = StatsSampler(client, capacity=2)
+        take(sampler, 3)
+        assert len(sampler) == 2
+        assert list(sampler.column("render_total_frames")) == [60, 120]
+        assert np.all(np.diff(sampler.column("timestamp")) > 0)
+
+    def test_background_sampling(self, client):
+        with StatsSampler(client, interval=0.01) as sampler:
+            deadline = time.monotonic() + 5
+            while len(sampler) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert not sampler.worker.is_alive()
+        assert len(sampler) >= 3
+        assert sampler.rates()["render_lag_ratio"] == pytest.approx(0.05)
+
+    def test_stops_when_connection_closes(self):
+        server = MockServer(port=0).start()
+        cl = obs.ReqClient(port=server.port)
+        with StatsSampler(cl, interval=0.01) as sampler:
+            deadline = time.monotonic() + 5
+            while not len(sampler) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            server.stop()
+            sampler.worker.join(timeout=5)
+            assert not sampler.worker.is_alive()
+        cl.disconnect()
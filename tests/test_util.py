@@ -0,0 +1,31 @@
+import base64
+import os
+
+import pytest
+
+from obsws_python import util
+
+
+class TestDecodeImageData:
+    __test__ = True
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 3, 100, util.DECODE_CHUNK * 2 + 5])
+    def test_decode_into_buffer(self, size):
+        image = os.urandom(size)
+        uri = "data:image/png;base64," + base64.b64encode(image).decode()
+        out = bytearray(size + 10)
+        img_format, data = util.decode_image_data(uri, out)
+        assert img_format == "png"
+        assert isinstance(data, memoryview)
+        assert data.obj is out
+        assert bytes(data) == image
+        assert util.decode_image_data(uri) == ("png", image)
+
+    def test_buffer_too_small(self):
+        uri = "data:image/jpg;base64," + base64.b64encode(b"x" * 10).decode()
+        with pytest.raises(ValueError):
+            util.decode_image_data(uri, bytearray(9))
+
+    def test_not_a_data_uri(self):
+        with pytest.raises(ValueError):
+            util.decode_image_data("aGVsbG8=")